@@ -38,6 +38,12 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
         ],
+        "arrow": [
+            "pyarrow>=12.0.0",
+        ],
+        "json": [
+            "orjson>=3.8.0",
+        ],
     },
     entry_points={
         "console_scripts": [
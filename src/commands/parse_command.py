@@ -49,17 +49,20 @@ def run_parse_command(file, mapping, format, output, use_chunked, chunk_size, lo
                 first_chunk = True
                 for chunk in parser.parse_chunks():
                     if preview_df is None:
-                        preview_df = chunk.head(10)
+                        # Copy so the preview does not pin the first chunk's block.
+                        preview_df = chunk.iloc[:10].copy()
                     chunk.to_csv(output, index=False, mode='w' if first_chunk else 'a', header=first_chunk)
                     first_chunk = False
                     total_rows += len(chunk)
+                    del chunk
                 click.echo(f"Output written to: {output}")
                 click.echo(f"Total rows: {total_rows}")
             else:
                 for chunk in parser.parse_chunks():
                     if preview_df is None:
-                        preview_df = chunk.head(10)
+                        preview_df = chunk.iloc[:10].copy()
                     total_rows += len(chunk)
+                    del chunk
 
                 if preview_df is not None:
                     click.echo(preview_df.to_string())
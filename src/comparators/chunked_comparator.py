@@ -12,6 +12,10 @@ from ..utils.progress import ProgressTracker
 from ..utils.memory_monitor import MemoryMonitor
 from ..utils.logger import get_logger
 
+# RSS growth (MB) over the level at the start of a chunk loop that triggers
+# a forced full collection.
+_GC_HEADROOM_MB = 512
+
 
 class ChunkedFileComparator:
     """Compare large files in chunks using SQLite indexing."""
@@ -141,6 +145,7 @@ class ChunkedFileComparator:
         # Insert data in chunks
         total_rows = 0
         progress = ProgressTracker(parser.count_rows(), "Indexing file1") if show_progress else None
+        gc_watermark_mb = self.memory_monitor.get_current_memory_mb() + _GC_HEADROOM_MB
         
         for chunk in parser.parse_chunks():
             # Filter columns
@@ -154,9 +159,11 @@ class ChunkedFileComparator:
             if progress:
                 progress.update(total_rows)
             
-            # Periodic garbage collection
-            if total_rows % (self.chunk_size * 10) == 0:
-                self.memory_monitor.force_garbage_collection()
+            # Collect only under memory pressure (automatic GC handles the
+            # rest), then re-arm the watermark above the post-collection level
+            if (total_rows % (self.chunk_size * 10) == 0
+                    and self.memory_monitor.collect_if_above(gc_watermark_mb)):
+                gc_watermark_mb = self.memory_monitor.get_current_memory_mb() + _GC_HEADROOM_MB
         
         self.db_conn.commit()
         
@@ -183,6 +190,7 @@ class ChunkedFileComparator:
         matched_keys = 0
         
         progress = ProgressTracker(parser.count_rows(), "Comparing file2") if show_progress else None
+        gc_watermark_mb = self.memory_monitor.get_current_memory_mb() + _GC_HEADROOM_MB
         
         for chunk in parser.parse_chunks():
             chunk_diffs, chunk_matches = self._compare_chunk(chunk, detailed)
@@ -193,9 +201,11 @@ class ChunkedFileComparator:
             if progress:
                 progress.update(total_rows)
             
-            # Periodic garbage collection
-            if total_rows % (self.chunk_size * 10) == 0:
-                self.memory_monitor.force_garbage_collection()
+            # Collect only under memory pressure (automatic GC handles the
+            # rest), then re-arm the watermark above the post-collection level
+            if (total_rows % (self.chunk_size * 10) == 0
+                    and self.memory_monitor.collect_if_above(gc_watermark_mb)):
+                gc_watermark_mb = self.memory_monitor.get_current_memory_mb() + _GC_HEADROOM_MB
         
         if progress:
             progress.finish()
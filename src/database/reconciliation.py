@@ -9,6 +9,10 @@ from .query_executor import QueryExecutor
 from ..utils.logger import get_logger
 
 
+# Oracle rejects IN lists longer than 1000 expressions.
+_MAX_IN_LIST = 1000
+
+
 class SchemaReconciler:
     """Reconciles mapping documents with actual database schema."""
 
@@ -21,6 +25,108 @@ class SchemaReconciler:
         self.connection = connection
         self.executor = QueryExecutor(connection)
         self.logger = get_logger(__name__)
+        # (owner, table_name) -> ordered column details, filled by prefetch_schemas()
+        self._schema_cache: Dict[Tuple[Optional[str], str], Dict[str, Dict[str, Any]]] = {}
+
+    def prefetch_schemas(self, table_references: List[str]) -> int:
+        """Load column metadata for many tables in batched queries.
+
+        Subsequent ``reconcile_mapping`` calls for prefetched tables are
+        answered from memory instead of issuing per-table dictionary queries.
+        Tables that are not found are cached as missing.
+
+        Args:
+            table_references: Table names, optionally owner-qualified (``OWNER.TABLE``)
+
+        Returns:
+            Number of distinct tables prefetched
+        """
+        targets = sorted(
+            {self._parse_table_reference(ref) for ref in table_references if ref},
+            key=lambda t: (t[0] or '', t[1]),
+        )
+        qualified = [t for t in targets if t[0]]
+        unqualified = [t for t in targets if not t[0]]
+
+        try:
+            for start in range(0, len(qualified), _MAX_IN_LIST):
+                self._prefetch_batch(qualified[start:start + _MAX_IN_LIST])
+            for start in range(0, len(unqualified), _MAX_IN_LIST):
+                self._prefetch_batch(unqualified[start:start + _MAX_IN_LIST])
+        except Exception as e:
+            # Fall back to per-table lookups for anything not yet cached.
+            self.logger.error(f"Error prefetching table schemas: {e}")
+
+        return len(targets)
+
+    def _prefetch_batch(self, targets: List[Tuple[Optional[str], str]]) -> None:
+        """Fetch existence and column details for one IN-list sized batch."""
+        if not targets:
+            return
+
+        params: Dict[str, Any] = {}
+        if targets[0][0]:
+            pairs = []
+            for i, (owner, table_name) in enumerate(targets):
+                params[f'o{i}'] = owner
+                params[f't{i}'] = table_name
+                pairs.append(f"(:o{i}, :t{i})")
+            in_clause = f"(owner, table_name) IN ({', '.join(pairs)})"
+            tables_query = f"SELECT owner, table_name FROM all_tables WHERE {in_clause}"
+            columns_query = f"""
+                SELECT owner, table_name, column_name, data_type, data_length,
+                       data_precision, data_scale, nullable
+                FROM all_tab_columns
+                WHERE {in_clause}
+                ORDER BY owner, table_name, column_id
+            """
+        else:
+            names = []
+            for i, (_, table_name) in enumerate(targets):
+                params[f't{i}'] = table_name
+                names.append(f":t{i}")
+            in_clause = f"table_name IN ({', '.join(names)})"
+            tables_query = f"SELECT NULL AS owner, table_name FROM user_tables WHERE {in_clause}"
+            columns_query = f"""
+                SELECT NULL AS owner, table_name, column_name, data_type, data_length,
+                       data_precision, data_scale, nullable
+                FROM user_tab_columns
+                WHERE {in_clause}
+                ORDER BY table_name, column_id
+            """
+
+        tables_df = self.executor.execute_query(tables_query, params)
+        columns_df = self.executor.execute_query(columns_query, params)
+
+        existing = {
+            (row['OWNER'] or None, row['TABLE_NAME'])
+            for _, row in tables_df.iterrows()
+        }
+        batch: Dict[Tuple[Optional[str], str], Dict[str, Dict[str, Any]]] = {
+            key: {} for key in existing
+        }
+        for _, row in columns_df.iterrows():
+            key = (row['OWNER'] or None, row['TABLE_NAME'])
+            if key not in batch:
+                continue
+            batch[key][row['COLUMN_NAME']] = {
+                'data_type': row['DATA_TYPE'],
+                'data_length': row['DATA_LENGTH'],
+                'data_precision': row['DATA_PRECISION'],
+                'data_scale': row['DATA_SCALE'],
+                'nullable': row['NULLABLE'],
+            }
+
+        for key in targets:
+            # None marks a table confirmed missing by the prefetch.
+            self._schema_cache[key] = batch.get(key)
+
+    def _cached_schema(self, table_name: str, owner: Optional[str]):
+        """Return (hit, columns) for a prefetched table."""
+        key = (owner.upper() if owner else None, table_name.upper())
+        if key in self._schema_cache:
+            return True, self._schema_cache[key]
+        return False, None
 
     def reconcile_mapping(self, mapping: MappingDocument) -> Dict[str, Any]:
         """Reconcile mapping document with database schema.
@@ -170,6 +276,10 @@ class SchemaReconciler:
 
     def _table_exists(self, table_name: str, owner: Optional[str] = None) -> bool:
         """Check if table exists."""
+        hit, cached = self._cached_schema(table_name, owner)
+        if hit:
+            return cached is not None
+
         if owner:
             query = """
                 SELECT COUNT(*) as cnt
@@ -194,6 +304,10 @@ class SchemaReconciler:
 
     def _get_table_columns(self, table_name: str, owner: Optional[str] = None) -> List[str]:
         """Get list of column names for table."""
+        hit, cached = self._cached_schema(table_name, owner)
+        if hit:
+            return list(cached or {})
+
         if owner:
             query = """
                 SELECT column_name
@@ -213,6 +327,10 @@ class SchemaReconciler:
 
     def _get_column_details(self, table_name: str, owner: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """Get detailed column information."""
+        hit, cached = self._cached_schema(table_name, owner)
+        if hit:
+            return dict(cached or {})
+
         if owner:
             query = """
                 SELECT
@@ -263,6 +381,10 @@ class SchemaReconciler:
 
     def _get_required_columns(self, table_name: str, owner: Optional[str] = None) -> Set[str]:
         """Get set of required (NOT NULL) columns."""
+        hit, cached = self._cached_schema(table_name, owner)
+        if hit:
+            return {name for name, info in (cached or {}).items() if info.get('nullable') == 'N'}
+
         if owner:
             query = """
                 SELECT column_name
@@ -512,7 +634,13 @@ class MappingValidator:
         results = {}
         total_valid = 0
         total_invalid = 0
-        
+
+        self.reconciler.prefetch_schemas([
+            m.target.get('table_name')
+            for m in mappings
+            if m.target.get('type') == 'database'
+        ])
+
         for mapping in mappings:
             result = self.reconciler.reconcile_mapping(mapping)
             results[mapping.mapping_name] = result
@@ -6,6 +6,108 @@ import os
 import click
 from src.utils.logger import setup_logger
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+
+_MAPPING_READ_THREADS = 4
+_ECHO_FLUSH_LINES = 100
+
+# Pre-rendered ANSI templates for per-mapping status lines; click.echo still
+# strips the codes when output is not a terminal.
+_STYLE_RED = click.style('{msg}', fg='red')
+_STYLE_YELLOW = click.style('{msg}', fg='yellow')
+_STYLE_GREEN = click.style('{msg}', fg='green')
+
+
+def _load_json(path):
+    """Load a JSON document from *path*, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path, obj):
+    """Write *obj* to *path* as indented JSON, using orjson when available."""
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        with open(path, 'wb') as f:
+            f.write(payload)
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2)
+
+
+def _iter_mapping_files(mappings_dir, pattern):
+    """Yield paths of files in *mappings_dir* matching *pattern* as they are listed.
+
+    Simple patterns stream from :func:`os.scandir`; patterns with path
+    separators or ``**`` fall back to :meth:`pathlib.Path.glob`.
+    """
+    import fnmatch
+    from pathlib import Path
+
+    if '**' in pattern or '/' in pattern or os.sep in pattern:
+        for path in Path(mappings_dir).glob(pattern):
+            if path.is_file():
+                yield str(path)
+        return
+
+    with os.scandir(mappings_dir) as entries:
+        for entry in entries:
+            if fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                yield str(Path(mappings_dir) / entry.name)
+
+
+def _read_mapping_bytes(path):
+    """Read a mapping file's raw bytes; return the exception instead of raising."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        return e
+
+
+def _parse_mapping_bytes(raw):
+    """Parse raw mapping JSON into a MappingDocument; return the exception instead of raising."""
+    from src.config.mapping_parser import MappingParser
+
+    if isinstance(raw, Exception):
+        return raw
+    try:
+        mapping_dict = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return MappingParser().parse(mapping_dict)
+    except Exception as e:
+        return e
+
+
+def _load_mapping_document(path):
+    """Load and parse one mapping file; return the exception instead of raising.
+
+    Module-level so it can run in a :class:`~concurrent.futures.ProcessPoolExecutor`.
+    """
+    return _parse_mapping_bytes(_read_mapping_bytes(path))
+
+
+def _index_reconcile_results(results):
+    """Map each result's ``mapping_file`` to its ``(error_count, warning_count)``."""
+    index = {}
+    for r in results:
+        mf = r.get('mapping_file')
+        if not mf:
+            continue
+        errors = r.get('error_count')
+        warnings = r.get('warning_count')
+        index[mf] = (
+            errors if errors is not None else len(r.get('errors', [])),
+            warnings if warnings is not None else len(r.get('warnings', [])),
+        )
+    return index
+
 
 @click.group()
 @click.version_option(version='0.1.0')
@@ -354,7 +456,6 @@ def reconcile(mapping, output, fail_on_warnings):
     logger = setup_logger('valdo', log_to_file=False)
 
     try:
-        import json
         from src.database.connection import OracleConnection
         from src.database.reconciliation import SchemaReconciler
         from src.config.loader import ConfigLoader
@@ -393,8 +494,7 @@ def reconcile(mapping, output, fail_on_warnings):
 
         if output:
             if output.lower().endswith('.json'):
-                with open(output, 'w') as f:
-                    json.dump(result, f, indent=2)
+                _write_json(output, result)
             else:
                 report = reconciler.generate_reconciliation_report(mapping_doc)
                 with open(output, 'w') as f:
@@ -418,38 +518,61 @@ def reconcile(mapping, output, fail_on_warnings):
               help='Baseline reconcile-all JSON report to compare drift against')
 @click.option('--fail-on-warnings', is_flag=True, help='Return non-zero exit code if warnings are found')
 @click.option('--fail-on-drift', is_flag=True, help='Return non-zero exit code if new errors/warnings appear vs baseline')
-def reconcile_all(mappings_dir, pattern, output, baseline, fail_on_warnings, fail_on_drift):
+@click.option('--workers', default=1, type=int, show_default=True,
+              help='Parallel worker processes for loading mapping files (1 disables parallel mode)')
+def reconcile_all(mappings_dir, pattern, output, baseline, fail_on_warnings, fail_on_drift, workers):
     """Reconcile all mapping documents in a directory against database schema."""
     logger = setup_logger('valdo', log_to_file=False)
 
     try:
-        import json
-        from pathlib import Path
         from src.database.connection import OracleConnection
         from src.database.reconciliation import SchemaReconciler
-        from src.config.loader import ConfigLoader
-        from src.config.mapping_parser import MappingParser
 
-        loader = ConfigLoader()
-        parser = MappingParser()
         conn = OracleConnection.from_env()
         reconciler = SchemaReconciler(conn)
 
-        mapping_files = sorted(Path(mappings_dir).glob(pattern))
-        if not mapping_files:
+        # Parse every mapping up front so all target schemas can be fetched
+        # in a few batched dictionary queries instead of one round-trip per file.
+        # Discovery is streamed, so reads start while the directory is listed.
+        mapping_paths = _iter_mapping_files(mappings_dir, pattern)
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            mapping_paths = list(mapping_paths)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                docs = list(pool.map(_load_mapping_document, mapping_paths, chunksize=8))
+            loaded = zip(mapping_paths, docs)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Reader threads keep disk reads in flight while this thread parses.
+            with ThreadPoolExecutor(max_workers=_MAPPING_READ_THREADS) as io_pool:
+                reads = [(path, io_pool.submit(_read_mapping_bytes, path)) for path in mapping_paths]
+                loaded = [(path, _parse_mapping_bytes(fut.result())) for path, fut in reads]
+        parsed_docs = dict(sorted(loaded, key=lambda item: item[0]))
+
+        if not parsed_docs:
             click.echo(click.style(f"No mapping files found in {mappings_dir} matching '{pattern}'", fg='yellow'))
             return
 
+        reconciler.prefetch_schemas([
+            doc.target.get('table_name')
+            for doc in parsed_docs.values()
+            if not isinstance(doc, Exception) and doc.target.get('type') == 'database'
+        ])
+
         results = []
         total_errors = 0
         total_warnings = 0
         invalid_mappings = 0
+        # Status lines are buffered and echoed in batches to cut per-line stdout overhead.
+        out_buf = []
 
-        for mapping_file in mapping_files:
-            click.echo(f"\nReconciling: {mapping_file}")
+        for mapping_path, mapping_doc in parsed_docs.items():
+            out_buf.append(f"\nReconciling: {mapping_path}")
             try:
-                mapping_dict = loader.load_mapping(str(mapping_file))
-                mapping_doc = parser.parse(mapping_dict)
+                if isinstance(mapping_doc, Exception):
+                    raise mapping_doc
                 result = reconciler.reconcile_mapping(mapping_doc)
 
                 errors = result.get('error_count', len(result.get('errors', [])))
@@ -459,14 +582,15 @@ def reconcile_all(mappings_dir, pattern, output, baseline, fail_on_warnings, fai
 
                 if not result.get('valid', False):
                     invalid_mappings += 1
-                    click.echo(click.style(f"  ✗ INVALID ({errors} errors, {warnings} warnings)", fg='red'))
+                    out_buf.append(_STYLE_RED.format(msg=f"  ✗ INVALID ({errors} errors, {warnings} warnings)"))
                 else:
-                    status_color = 'yellow' if warnings else 'green'
-                    status_text = f"  ✓ VALID ({warnings} warnings)" if warnings else "  ✓ VALID"
-                    click.echo(click.style(status_text, fg=status_color))
+                    if warnings:
+                        out_buf.append(_STYLE_YELLOW.format(msg=f"  ✓ VALID ({warnings} warnings)"))
+                    else:
+                        out_buf.append(_STYLE_GREEN.format(msg="  ✓ VALID"))
 
                 results.append({
-                    'mapping_file': str(mapping_file),
+                    'mapping_file': mapping_path,
                     'mapping_name': mapping_doc.mapping_name,
                     **result,
                 })
@@ -474,9 +598,9 @@ def reconcile_all(mappings_dir, pattern, output, baseline, fail_on_warnings, fai
             except Exception as file_error:
                 invalid_mappings += 1
                 total_errors += 1
-                click.echo(click.style(f"  ✗ FAILED to process: {file_error}", fg='red'))
+                out_buf.append(_STYLE_RED.format(msg=f"  ✗ FAILED to process: {file_error}"))
                 results.append({
-                    'mapping_file': str(mapping_file),
+                    'mapping_file': mapping_path,
                     'valid': False,
                     'errors': [f"Failed to process mapping: {file_error}"],
                     'warnings': [],
@@ -484,9 +608,16 @@ def reconcile_all(mappings_dir, pattern, output, baseline, fail_on_warnings, fai
                     'warning_count': 0,
                 })
 
+            if len(out_buf) >= _ECHO_FLUSH_LINES:
+                click.echo('\n'.join(out_buf))
+                out_buf.clear()
+
+        if out_buf:
+            click.echo('\n'.join(out_buf))
+
         summary = {
-            'total_mappings': len(mapping_files),
-            'valid_mappings': len(mapping_files) - invalid_mappings,
+            'total_mappings': len(parsed_docs),
+            'valid_mappings': len(parsed_docs) - invalid_mappings,
             'invalid_mappings': invalid_mappings,
             'total_errors': total_errors,
             'total_warnings': total_warnings,
@@ -504,54 +635,41 @@ def reconcile_all(mappings_dir, pattern, output, baseline, fail_on_warnings, fai
 
         drift = None
         if baseline:
-            with open(baseline, 'r') as f:
-                baseline_report = json.load(f)
+            baseline_report = _load_json(baseline)
 
-            baseline_results = {
-                r.get('mapping_file'): r
-                for r in baseline_report.get('results', [])
-                if r.get('mapping_file')
-            }
-            current_results = {
-                r.get('mapping_file'): r
-                for r in results
-                if r.get('mapping_file')
-            }
+            baseline_idx = _index_reconcile_results(baseline_report.get('results', []))
+            current_idx = _index_reconcile_results(results)
 
-            baseline_files = set(baseline_results.keys())
-            current_files = set(current_results.keys())
-
-            added_files = sorted(current_files - baseline_files)
-            removed_files = sorted(baseline_files - current_files)
+            added_files = sorted(current_idx.keys() - baseline_idx.keys())
+            removed_files = sorted(baseline_idx.keys() - current_idx.keys())
 
             changed = []
             new_errors = 0
             new_warnings = 0
 
-            for mf in sorted(current_files & baseline_files):
-                old = baseline_results[mf]
-                new = current_results[mf]
-                old_e = old.get('error_count', len(old.get('errors', [])))
-                old_w = old.get('warning_count', len(old.get('warnings', [])))
-                new_e = new.get('error_count', len(new.get('errors', [])))
-                new_w = new.get('warning_count', len(new.get('warnings', [])))
+            for mf in sorted(current_idx.keys() & baseline_idx.keys()):
+                old_counts = baseline_idx[mf]
+                new_counts = current_idx[mf]
+                if old_counts == new_counts:
+                    continue  # common case on CI: no drift for this mapping
 
+                old_e, old_w = old_counts
+                new_e, new_w = new_counts
                 delta_e = new_e - old_e
                 delta_w = new_w - old_w
-                if delta_e != 0 or delta_w != 0:
-                    changed.append({
-                        'mapping_file': mf,
-                        'old_errors': old_e,
-                        'new_errors': new_e,
-                        'delta_errors': delta_e,
-                        'old_warnings': old_w,
-                        'new_warnings': new_w,
-                        'delta_warnings': delta_w,
-                    })
-                    if delta_e > 0:
-                        new_errors += delta_e
-                    if delta_w > 0:
-                        new_warnings += delta_w
+                changed.append({
+                    'mapping_file': mf,
+                    'old_errors': old_e,
+                    'new_errors': new_e,
+                    'delta_errors': delta_e,
+                    'old_warnings': old_w,
+                    'new_warnings': new_w,
+                    'delta_warnings': delta_w,
+                })
+                if delta_e > 0:
+                    new_errors += delta_e
+                if delta_w > 0:
+                    new_warnings += delta_w
 
             drift = {
                 'baseline': baseline,
@@ -574,12 +692,7 @@ def reconcile_all(mappings_dir, pattern, output, baseline, fail_on_warnings, fai
             summary['drift'] = drift
 
         if output:
-            if output.lower().endswith('.json'):
-                with open(output, 'w') as f:
-                    json.dump(summary, f, indent=2)
-            else:
-                with open(output, 'w') as f:
-                    f.write(json.dumps(summary, indent=2))
+            _write_json(output, summary)
             click.echo(f"\nAggregate report written to: {output}")
 
         has_drift_regression = bool(drift and (drift.get('new_errors', 0) > 0 or drift.get('new_warnings', 0) > 0))
@@ -687,8 +800,7 @@ def generate_oracle_expected(manifest_path, dry_run, output):
             click.echo(f"- {j.get('name')}: {j.get('status')}")
 
         if output:
-            with open(output, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2)
+            _write_json(output, summary)
             click.echo(f"\n✓ Oracle expected summary written: {output}")
 
         if summary.get('status') == 'failed':
@@ -1,10 +1,60 @@
 """Chunked file parser for memory-efficient large file processing."""
 
+import codecs
+import csv
+import mmap
+import os
+from itertools import islice
+import numpy as np
 import pandas as pd
 from typing import Iterator, Optional, List, Callable, Dict, Any
 from pathlib import Path
 import time
 from ..utils.logger import get_logger
+from ..utils.file_scan import advise_sequential
+
+_COUNT_BLOCK_SIZE = 1 << 20
+_PEEK_SIZE = 1 << 16
+
+# Strings pd.read_fwf turns into NaN by default (after whitespace stripping).
+_FWF_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+_LAYOUT_BLOCK_ROWS = 1 << 16
+
+_SINGLE_BYTE_ENCODINGS = {'latin-1', 'iso8859-1', 'cp1252', 'cp037', 'cp500', 'ascii'}
+
+
+def _dedup_names(names: List[str]) -> List[str]:
+    """Return header *names* as ``pd.read_csv`` reports them.
+
+    Empty names become ``Unnamed: <i>`` and repeats are renamed ``a.1``,
+    ``a.2``, … (skipping names already in the header), with named columns
+    claiming suffixes before unnamed ones — the C parser's rules.
+    """
+    unnamed = [i for i, name in enumerate(names) if not name]
+    names = [name if name else f"Unnamed: {i}" for i, name in enumerate(names)]
+    order = [i for i in range(len(names)) if i not in unnamed] + unnamed
+    present = set(names)
+    counts: Dict[str, int] = {}
+    for i in order:
+        name = original = names[i]
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[original] = count + 1
+            name = f"{original}.{count}"
+            count = count + 1 if name in present else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def _skip_whitespace_rows(row) -> str:
+    """pyarrow ``invalid_row_handler``: drop whitespace-only lines, as pandas
+    does, and reject any other malformed row."""
+    return 'skip' if not row.text.strip() else 'error'
 
 
 class ChunkedFileParser:
@@ -12,7 +62,7 @@ class ChunkedFileParser:
     
     def __init__(self, file_path: str, delimiter: str = '|',
                  chunk_size: int = 100000, encoding: str = 'utf-8',
-                 has_header: bool = True):
+                 has_header: bool = True, engine: str = 'pandas'):
         """Initialize chunked parser.
 
         Args:
@@ -23,13 +73,24 @@ class ChunkedFileParser:
             has_header: Whether the file contains a header row. When False,
                 pandas reads all rows as data and column names are auto-assigned
                 (0, 1, …) unless columns are supplied to parse_chunks.
+            engine: ``'pandas'`` (default) uses ``pd.read_csv`` chunking;
+                ``'pyarrow'`` streams record batches through
+                ``pyarrow.csv.open_csv`` (requires the optional ``pyarrow``
+                package).  Both yield string-typed chunks of ``chunk_size`` rows.
         """
+        if engine not in ('pandas', 'pyarrow'):
+            raise ValueError(f"Unsupported engine: {engine!r} (expected 'pandas' or 'pyarrow')")
         self.file_path = file_path
         self.delimiter = delimiter
         self.chunk_size = chunk_size
         self.encoding = encoding
         self.has_header = has_header
+        self.engine = engine
+        # Encoded once for byte-level scans of the raw file.
+        self._delim_bytes = delimiter.encode(encoding) if delimiter else b''
         self.logger = get_logger(__name__)
+        # (file_path, row count) memoized by count_rows()
+        self._row_count_cache: Optional[tuple] = None
         
     def parse_chunks(self, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
         """Parse file in chunks.
@@ -40,6 +101,13 @@ class ChunkedFileParser:
         Yields:
             DataFrame chunks
         """
+        if self.engine == 'pyarrow':
+            yield from self._parse_chunks_pyarrow(columns)
+            return
+        yield from self._parse_chunks_pandas(columns)
+
+    def _parse_chunks_pandas(self, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Stream the file with ``pd.read_csv`` in ``chunk_size`` chunks."""
         try:
             # When the file has no header row, use header=None so pandas treats
             # all lines as data.  header=0 is the pandas default (row 0 as
@@ -52,16 +120,174 @@ class ChunkedFileParser:
                 header=header,
                 dtype=str,
                 keep_default_na=False,
+                # Every column is a string with no NA sentinels, so skip the
+                # NA scan; map the file instead of copying it through a buffer.
+                na_filter=False,
+                memory_map=True,
+                low_memory=False,
                 chunksize=self.chunk_size,
                 encoding=self.encoding,
-                engine='c'  # Faster C engine
             ):
                 yield chunk
                 
         except Exception as e:
             self.logger.error(f"Error parsing file in chunks: {e}")
             raise ValueError(f"Failed to parse file: {e}")
+
+    def _parse_chunks_pyarrow(self, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Stream the file with ``pyarrow.csv.open_csv`` and re-slice to ``chunk_size`` rows.
+
+        Arrow decodes blocks in C++ on multiple threads; batches are regrouped
+        so callers see the same chunk boundaries, RangeIndex offsets, and
+        all-string columns as the pandas engine.  Header names follow pandas
+        too: a UTF-8 BOM is dropped, duplicates are renamed ``a``, ``a.1``, …,
+        and a header-only file yields one empty chunk.
+
+        Whitespace-only lines are skipped, as pandas skips them.  Rows Arrow
+        cannot represent — short rows, which pandas pads with ``''`` — hand
+        the rest of the file to the pandas engine, resuming at the next
+        chunk, so the result still matches it row for row.
+        """
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError as exc:
+            raise RuntimeError(
+                "pyarrow is required for engine='pyarrow'. Install with: pip install pyarrow"
+            ) from exc
+
+        emitted = 0
+        try:
+            with open(self.file_path, 'r', encoding=self.encoding, newline='') as f:
+                first_row = next(csv.reader(f, delimiter=self.delimiter), None)
+            if first_row is None:
+                return
+
+            if first_row:
+                first_row[0] = first_row[0].lstrip('\ufeff')
+
+            if columns is not None:
+                names = list(columns)
+            elif self.has_header:
+                names = _dedup_names(first_row)
+            else:
+                names = [f"f{i}" for i in range(len(first_row))]
+
+            reader = pa_csv.open_csv(
+                self.file_path,
+                read_options=pa_csv.ReadOptions(
+                    column_names=names,
+                    skip_rows=1 if self.has_header else 0,
+                    encoding=self.encoding,
+                    use_threads=True,
+                ),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=self.delimiter,
+                    invalid_row_handler=_skip_whitespace_rows,
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in names},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+
+            def _to_frame(table, start: int) -> pd.DataFrame:
+                frame = table.to_pandas()
+                if columns is None and not self.has_header:
+                    frame.columns = range(len(names))
+                frame.index = pd.RangeIndex(start, start + len(frame))
+                return frame
+
+            pending: List[Any] = []
+            pending_rows = 0
+            for batch in reader:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                while pending_rows >= self.chunk_size:
+                    table = pa.Table.from_batches(pending)
+                    yield _to_frame(table.slice(0, self.chunk_size), emitted)
+                    emitted += self.chunk_size
+                    rest = table.slice(self.chunk_size)
+                    pending = rest.to_batches()
+                    pending_rows = rest.num_rows
+            if pending_rows or not emitted:
+                yield _to_frame(pa.Table.from_batches(pending, schema=reader.schema), emitted)
+            return
+
+        except pa.ArrowInvalid as e:
+            # Only whole chunks have been yielded, so pandas resumes at a
+            # chunk boundary.
+            self.logger.info(
+                f"pyarrow cannot parse {self.file_path} ({e}); "
+                f"continuing from row {emitted:,} with the pandas engine"
+            )
+        except Exception as e:
+            self.logger.error(f"Error parsing file in chunks: {e}")
+            raise ValueError(f"Failed to parse file: {e}")
+
+        yield from islice(self._parse_chunks_pandas(columns), emitted // self.chunk_size, None)
     
+    def parse_chunks_fast(self, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Parse a simple delimited file in chunks without the pandas CSV machinery.
+
+        Every field is a string, so each chunk of lines is joined, split once
+        on the delimiter in C, and reshaped into a single 2-D object block —
+        no type inference, NA handling or per-cell tokenizer state.  Files
+        that need the full parser — quoted fields or rows whose field count
+        differs from the header — raise ``ValueError``; use
+        :meth:`parse_chunks` for those.  Header names follow pandas: a UTF-8
+        BOM is dropped, empty and repeated names are renamed (see
+        :func:`_dedup_names`), and a header-only file yields one empty chunk.
+
+        Args:
+            columns: Optional column names
+
+        Yields:
+            DataFrame chunks with the same boundaries, index offsets and
+            column names as :meth:`parse_chunks`
+        """
+        delimiter = self.delimiter
+        with open(self.file_path, 'r', encoding=self.encoding, newline='') as f:
+            advise_sequential(f)
+            if f.read(1) != '\ufeff':
+                f.seek(0)
+            names: Optional[List[Any]] = list(columns) if columns is not None else None
+            if self.has_header:
+                header_line = f.readline().rstrip('\r\n')
+                if names is None and header_line:
+                    names = _dedup_names(header_line.split(delimiter))
+
+            # Blank lines are dropped before chunking, as pandas does, so
+            # every chunk holds chunk_size rows.
+            rows = (line for line in f if line.strip('\r\n'))
+            start = 0
+            while True:
+                lines = list(islice(rows, self.chunk_size))
+                if not lines:
+                    if start == 0 and names is not None and self.has_header:
+                        yield pd.DataFrame(columns=names, dtype=object, index=pd.RangeIndex(0, 0))
+                    break
+                if names is None:
+                    names = list(range(lines[0].count(delimiter) + 1))
+
+                width = len(names)
+                if any(line.count(delimiter) != width - 1 or '"' in line for line in lines):
+                    raise ValueError(
+                        f"Fast parser supports unquoted rows with exactly {width} fields; "
+                        "use parse_chunks() for this file"
+                    )
+
+                text = ''.join(lines).replace('\r\n', '\n')
+                if not text.endswith('\n'):
+                    text += '\n'
+                cells = text.replace('\n', delimiter).split(delimiter)
+                cells.pop()  # empty string after the final newline
+
+                block = np.array(cells, dtype=object).reshape(len(lines), width)
+                yield pd.DataFrame(block, columns=names, index=pd.RangeIndex(start, start + len(lines)))
+                start += len(lines)
+
     def parse_with_progress(self, 
                            columns: Optional[List[str]] = None,
                            progress_callback: Optional[Callable[[int, int], None]] = None) -> Iterator[pd.DataFrame]:
@@ -74,11 +300,14 @@ class ChunkedFileParser:
         Yields:
             DataFrame chunks with progress updates
         """
-        total_rows = self.count_rows()
+        # Only a callback needs the total up front; skipping the count lets the
+        # first chunk be emitted without a full file scan.
+        total_rows = self.count_rows() if progress_callback else None
+        total_label = f"{total_rows:,}" if total_rows is not None else '?'
         processed_rows = 0
         start_time = time.time()
         
-        self.logger.info(f"Starting chunked parsing: {total_rows:,} total rows, "
+        self.logger.info(f"Starting chunked parsing: {total_label} total rows, "
                         f"chunk size: {self.chunk_size:,}")
         
         for chunk_num, chunk in enumerate(self.parse_chunks(columns), 1):
@@ -91,9 +320,10 @@ class ChunkedFileParser:
             if chunk_num % 10 == 0:
                 elapsed = time.time() - start_time
                 rate = processed_rows / elapsed if elapsed > 0 else 0
+                pct = f"{processed_rows/total_rows*100:.1f}%" if total_rows else "n/a"
                 self.logger.info(
-                    f"Processed chunk {chunk_num}: {processed_rows:,}/{total_rows:,} rows "
-                    f"({processed_rows/total_rows*100:.1f}%) at {rate:.0f} rows/sec"
+                    f"Processed chunk {chunk_num}: {processed_rows:,}/{total_label} rows "
+                    f"({pct}) at {rate:.0f} rows/sec"
                 )
             
             yield chunk
@@ -106,27 +336,67 @@ class ChunkedFileParser:
     
     def count_rows(self) -> int:
         """Count total rows in file.
-        
+
+        The result is memoized per ``file_path`` so progress tracking,
+        ``get_file_info`` and ``validate_structure`` share one file scan.
+
         Returns:
             Total number of rows
         """
+        if self._row_count_cache is not None and self._row_count_cache[0] == self.file_path:
+            return self._row_count_cache[1]
         try:
-            # Fast line counting
-            with open(self.file_path, 'rb') as f:
-                return sum(1 for _ in f)
+            # Count newlines over 1 MiB blocks read straight into one reused
+            # buffer: unbuffered readinto drops the GIL for the syscall and
+            # allocates nothing per block; count() runs in C (memchr).
+            count = 0
+            last = None
+            buf = bytearray(_COUNT_BLOCK_SIZE)
+            with open(self.file_path, 'rb', buffering=0) as f:
+                advise_sequential(f)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    count += buf.count(b'\n', 0, n)
+                    last = buf[n - 1]
+            # A final line without a trailing newline still counts as a row.
+            if last is not None and last != 0x0A:
+                count += 1
+            self._row_count_cache = (self.file_path, count)
+            return count
         except Exception as e:
             self.logger.warning(f"Could not count rows: {e}")
             return 0
     
+    def set_row_count(self, count: int) -> None:
+        """Record a row count measured by another full pass over the file.
+
+        :meth:`count_rows` then returns *count* instead of scanning the file.
+
+        Args:
+            count: Number of lines in the file, counted as :meth:`count_rows` does.
+        """
+        self._row_count_cache = (self.file_path, count)
+
     def get_file_info(self) -> Dict[str, Any]:
         """Get file information.
         
         Returns:
             Dictionary with file metadata
         """
+        return self._file_info_from_stat(os.stat(self.file_path))
+
+    def _file_info_from_stat(self, st: os.stat_result, include_row_count: bool = True) -> Dict[str, Any]:
+        """Build ``get_file_info`` output from an existing ``os.stat`` result.
+
+        Without *include_row_count*, ``total_rows`` and ``estimated_chunks``
+        are None unless the row count is already known, sparing a file scan.
+        """
         path = Path(self.file_path)
-        size_bytes = path.stat().st_size
-        total_rows = self.count_rows()
+        size_bytes = st.st_size
+        known = self._row_count_cache is not None and self._row_count_cache[0] == self.file_path
+        total_rows = self.count_rows() if include_row_count or known else None
         
         return {
             'file_path': str(path.absolute()),
@@ -135,7 +405,7 @@ class ChunkedFileParser:
             'size_mb': size_bytes / (1024 * 1024),
             'total_rows': total_rows,
             'chunk_size': self.chunk_size,
-            'estimated_chunks': (total_rows // self.chunk_size) + 1,
+            'estimated_chunks': None if total_rows is None else (total_rows // self.chunk_size) + 1,
             'delimiter': self.delimiter,
             'encoding': self.encoding
         }
@@ -162,8 +432,13 @@ class ChunkedFileParser:
             self.logger.error(f"Error parsing sample: {e}")
             raise ValueError(f"Failed to parse sample: {e}")
     
-    def validate_structure(self) -> Dict[str, Any]:
+    def validate_structure(self, include_row_count: bool = True) -> Dict[str, Any]:
         """Validate file structure.
+
+        Args:
+            include_row_count: Count the file's rows for ``file_info``.  The
+                count is a full pass over the file; callers that do not need
+                it can pass False.
         
         Returns:
             Validation results
@@ -171,31 +446,43 @@ class ChunkedFileParser:
         errors = []
         warnings = []
         
-        # Check file exists
-        if not Path(self.file_path).exists():
+        # Check file exists; one stat serves the size check and file_info
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
             errors.append(f"File not found: {self.file_path}")
             return {'valid': False, 'errors': errors, 'warnings': warnings}
         
         # Check file size
-        size_mb = Path(self.file_path).stat().st_size / (1024 * 1024)
+        size_mb = st.st_size / (1024 * 1024)
         if size_mb == 0:
             errors.append("File is empty")
         elif size_mb > 1000:  # >1GB
             warnings.append(f"Large file detected: {size_mb:.1f} MB")
         
-        # Try parsing first chunk
-        try:
-            first_chunk = next(self.parse_chunks())
-            if first_chunk.empty:
-                warnings.append("First chunk is empty")
-        except Exception as e:
-            errors.append(f"Failed to parse first chunk: {e}")
+        # Peek at the head of the file instead of materializing a full chunk
+        if st.st_size > 0:
+            try:
+                with open(self.file_path, 'rb') as f:
+                    head = f.read(_PEEK_SIZE)
+                if b'\x00' in head:
+                    raise ValueError("file appears to be binary (NUL bytes found)")
+                # Decode only to surface encoding errors; checks run on bytes.
+                codecs.getincrementaldecoder(self.encoding)().decode(head, final=False)
+                lines = [line for line in head.splitlines() if line.strip()]
+                data_lines = lines[1:] if self.has_header else lines
+                if not data_lines and len(head) == st.st_size:
+                    warnings.append("First chunk is empty")
+                elif lines and self._delim_bytes and self._delim_bytes not in lines[0]:
+                    warnings.append(f"No delimiter '{self.delimiter}' found in first line")
+            except Exception as e:
+                errors.append(f"Failed to parse first chunk: {e}")
         
         return {
             'valid': len(errors) == 0,
             'errors': errors,
             'warnings': warnings,
-            'file_info': self.get_file_info()
+            'file_info': self._file_info_from_stat(st, include_row_count)
         }
 
 
@@ -216,10 +503,21 @@ class ChunkedFixedWidthParser(ChunkedFileParser):
         self.field_specs = field_specs
         self.colspecs = [(start, end) for _, start, end in field_specs]
         self.names = [name for name, _, _ in field_specs]
+        # Byte-string layout of one record, reused for every mmap chunk.
+        self._record_fields = {
+            'names': [name for name, start, end in field_specs if end > start],
+            'formats': [f'S{end - start}' for _, start, end in field_specs if end > start],
+            'offsets': [start for _, start, end in field_specs if end > start],
+        }
     
     def parse_chunks(self, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
         """Parse fixed-width file in chunks.
-        
+
+        Files whose records all share one length are memory-mapped and each
+        field is sliced out of every record with a strided NumPy view; other
+        files (ragged rows, blank lines, multi-byte text) go through
+        ``pd.read_fwf``.  Both paths yield identical chunks.
+
         Args:
             columns: Ignored for fixed-width (uses field_specs)
             
@@ -227,6 +525,11 @@ class ChunkedFixedWidthParser(ChunkedFileParser):
             DataFrame chunks
         """
         try:
+            layout = self._uniform_record_layout()
+            if layout is not None:
+                yield from self._parse_chunks_mmap(layout)
+                return
+
             for chunk in pd.read_fwf(
                 self.file_path,
                 colspecs=self.colspecs,
@@ -241,6 +544,118 @@ class ChunkedFixedWidthParser(ChunkedFileParser):
             self.logger.error(f"Error parsing fixed-width file: {e}")
             raise ValueError(f"Failed to parse fixed-width file: {e}")
 
+    def _uniform_record_layout(self) -> Optional[tuple]:
+        """Return ``(record_len, n_rows, ascii_only)`` when every record has the same length.
+
+        The check runs over the memory-mapped file in blocks of rows, so it
+        never holds more than one block of temporaries.  ``None`` means the
+        file must go through ``pd.read_fwf`` (ragged or blank lines, embedded
+        carriage returns, fields past the record end, or multi-byte text).
+        """
+        if not self.field_specs or len(set(self.names)) != len(self.names):
+            return None
+        size = os.path.getsize(self.file_path)
+        if size == 0:
+            return None
+
+        with open(self.file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first_newline = mm.find(b'\n')
+            if first_newline < 0:
+                return None
+            record_len = first_newline + 1
+            newline_len = 2 if first_newline > 0 and mm[first_newline - 1] == 0x0D else 1
+            data_len = record_len - newline_len
+            if max(end for _, _, end in self.field_specs) > data_len:
+                return None
+
+            if size % record_len == 0:
+                n_rows = size // record_len
+            elif size % record_len == data_len:
+                n_rows = size // record_len + 1  # last record lacks a newline
+            else:
+                return None
+
+            ascii_only = self._scan_uniform_records(mm, record_len, newline_len, n_rows)
+            if ascii_only is None:
+                return None
+
+        # Byte offsets equal character offsets only for single-byte text.
+        if not ascii_only and codecs.lookup(self.encoding).name not in _SINGLE_BYTE_ENCODINGS:
+            return None
+        return record_len, n_rows, ascii_only
+
+    @staticmethod
+    def _scan_uniform_records(mm: mmap.mmap, record_len: int, newline_len: int,
+                              n_rows: int) -> Optional[bool]:
+        """Verify record boundaries block by block; return whether the text is ASCII.
+
+        Kept separate so every NumPy view of ``mm`` is released on return,
+        before the caller closes the map.
+        """
+        data = np.frombuffer(mm, dtype=np.uint8)
+        data_len = record_len - newline_len
+        ascii_only = True
+        for row_start in range(0, n_rows, _LAYOUT_BLOCK_ROWS):
+            offset = row_start * record_len
+            block = data[offset:offset + _LAYOUT_BLOCK_ROWS * record_len]
+            full_rows = len(block) // record_len
+            records = block[:full_rows * record_len].reshape(full_rows, record_len)
+            if not (records[:, -1] == 0x0A).all():
+                return None
+            if newline_len == 2 and not (records[:, -2] == 0x0D).all():
+                return None
+            bodies = [records[:, :data_len]]
+            if full_rows * record_len < len(block):
+                bodies.append(block[full_rows * record_len:].reshape(1, data_len))
+            for body in bodies:
+                if body.size == 0:
+                    continue
+                if ((body == 0x0A) | (body == 0x0D)).any():
+                    return None
+                # read_fwf skips whitespace-only lines; keep its row numbering.
+                if ((body == 0x20) | (body == 0x09)).all(axis=1).any():
+                    return None
+                if ascii_only and body.max() >= 0x80:
+                    ascii_only = False
+        return ascii_only
+
+    def _parse_chunks_mmap(self, layout: tuple) -> Iterator[pd.DataFrame]:
+        """Yield chunks by slicing fields out of a memory-mapped uniform-length file."""
+        record_len, n_rows, ascii_only = layout
+        # Records are strided by record_len; the itemsize only spans the fields
+        # so the final record may lack its newline.
+        itemsize = max(end for _, _, end in self.field_specs)
+        record_dtype = np.dtype({**self._record_fields, 'itemsize': itemsize})
+        with open(self.file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            advise_sequential(f, mm)
+            for row_start in range(0, n_rows, self.chunk_size):
+                count = min(self.chunk_size, n_rows - row_start)
+                records = np.ndarray(
+                    shape=(count,),
+                    dtype=record_dtype,
+                    buffer=mm,
+                    offset=row_start * record_len,
+                    strides=(record_len,),
+                )
+                frame = {}
+                for name, start, end in self.field_specs:
+                    if end <= start:
+                        frame[name] = np.full(count, np.nan, dtype=object)
+                        continue
+                    raw = records[name]
+                    if ascii_only:
+                        decoded = raw.astype(f'U{end - start}')
+                    else:
+                        decoded = np.char.decode(raw, self.encoding)
+                    del raw
+                    stripped = np.char.strip(decoded, ' \t')
+                    text = stripped.astype(object)
+                    text[np.isin(stripped, _FWF_NA_VALUES)] = np.nan
+                    frame[name] = text
+                # Release every view of the map before handing control back.
+                del records
+                yield pd.DataFrame(frame, index=pd.RangeIndex(row_start, row_start + count))
+
     def parse_sample(self, n_rows: int = 1000) -> pd.DataFrame:
         """Parse sample of fixed-width file."""
         try:
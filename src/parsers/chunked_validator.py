@@ -1,16 +1,53 @@
 """Chunked file validator for memory-efficient validation."""
 
+import gc
 import json
+import os
+import queue
+import re
+import sys
+import threading
 import time
-from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
+from itertools import chain, islice
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterator, List, Optional
 from .chunked_parser import ChunkedFileParser
+from ..utils.file_scan import scan_line_lengths
 from ..utils.progress import ProgressTracker
 from ..utils.memory_monitor import MemoryMonitor
 from ..utils.logger import get_logger
 from ..validators.rule_engine import RuleEngine
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values JSON has no type for: NumPy scalars/arrays as numbers, the rest as text."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _json_line(obj: Any) -> bytes:
+    """Encode *obj* as one newline-terminated JSON line, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=_json_default,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return (json.dumps(obj, default=_json_default) + '\n').encode('utf-8')
+
 
 def _is_integer(value: str) -> bool:
     """Return True if *value* represents a valid integer."""
@@ -30,6 +67,78 @@ def _is_float(value: str) -> bool:
         return False
 
 
+_NUMERIC_FMT_RE = re.compile(r'([+S])?9\((\d+)\)(?:V9\((\d+)\))?')
+
+
+@lru_cache(maxsize=256)
+def _digits_pattern(sign_kind: str, total: int) -> re.Pattern:
+    """Return the compiled value pattern for *total* digits and a sign kind.
+
+    ``'+'`` requires a leading sign, ``'S'`` allows one, ``''`` forbids it.
+    """
+    sign = {'+': '[+-]', 'S': '[+-]?'}.get(sign_kind, '')
+    return re.compile(rf'{sign}\d{{{total}}}')
+
+
+def _numeric_format_spec(fmt: str) -> Optional[tuple[str, int]]:
+    """Parse ``[+S]9(n)[V9(m)]`` into ``(sign_kind, total_digits)``, or None."""
+    m = _NUMERIC_FMT_RE.fullmatch(fmt)
+    if not m:
+        return None
+    sign_kind, n, frac = m.group(1) or '', int(m.group(2)), m.group(3)
+    if frac is None:
+        # Plain S9(n)/9(n); a leading '+' only has meaning for decimals.
+        if sign_kind == '+':
+            return None
+        return sign_kind, n
+    return sign_kind, n + int(frac)
+
+
+def _is_three_letters(v: str) -> bool:
+    return len(v) == 3 and v.isascii() and v.isalpha()
+
+
+def _digits_checker(sign_kind: str, total: int) -> Callable[[str], bool]:
+    """Build a ``str``-method predicate equivalent to ``_digits_pattern``.
+
+    ``str.isdecimal`` accepts exactly the Unicode ``Nd`` characters that
+    ``\\d`` matches, so results are identical to the regex, without the
+    regex engine's per-call overhead.
+    """
+    if sign_kind == '+':
+        def check(v: str) -> bool:
+            return len(v) == total + 1 and v[0] in '+-' and v[1:].isdecimal()
+    elif sign_kind == 'S':
+        def check(v: str) -> bool:
+            if v[:1] in ('+', '-'):
+                v = v[1:]
+            return len(v) == total and v.isdecimal()
+    else:
+        def check(v: str) -> bool:
+            return len(v) == total and v.isdecimal()
+    return check
+
+
+@lru_cache(maxsize=256)
+def _format_checker(fmt: str) -> Optional[Callable[[str], bool]]:
+    """Return a fast predicate for an upper-cased format code, or None.
+
+    Common codes are specialised into plain string-method checks; anything
+    else falls back to the compiled pattern's ``fullmatch``.
+    """
+    if fmt == 'XXX':
+        return _is_three_letters
+    if fmt == 'CCYYMMDD':
+        return _digits_checker('', 8)
+    spec = _numeric_format_spec(fmt)
+    if spec is None:
+        return None
+    if spec[1] == 0:
+        pattern = _digits_pattern(*spec)
+        return lambda v: pattern.fullmatch(v) is not None
+    return _digits_checker(*spec)
+
+
 def _is_value_valid_for_format(value: str, fmt: str) -> bool:
     """Check whether *value* matches the COBOL-style format specifier *fmt*.
 
@@ -49,38 +158,311 @@ def _is_value_valid_for_format(value: str, fmt: str) -> bool:
     Returns:
         True if the value conforms to *fmt*, or if *fmt* is unrecognised.
     """
-    import re
-
     v = str(value).strip()
     fmt = str(fmt or '').upper()
     if not fmt:
         return True
-    if fmt == 'XXX':
-        return bool(re.fullmatch(r'[A-Za-z]{3}', v))
-    if fmt == 'CCYYMMDD':
-        return bool(re.fullmatch(r'\d{8}', v))
-
-    m_s9 = re.fullmatch(r'S9\((\d+)\)', fmt)
-    if m_s9:
-        n = int(m_s9.group(1))
-        return bool(re.fullmatch(rf'[+-]?\d{{{n}}}', v))
-
-    m_9 = re.fullmatch(r'9\((\d+)\)', fmt)
-    if m_9:
-        n = int(m_9.group(1))
-        return bool(re.fullmatch(rf'\d{{{n}}}', v))
-
-    m_dec = re.fullmatch(r'([+S])?9\((\d+)\)V9\((\d+)\)', fmt)
-    if m_dec:
-        sign_kind = m_dec.group(1)
-        n = int(m_dec.group(2))
-        m = int(m_dec.group(3))
-        if sign_kind == '+':
-            return bool(re.fullmatch(rf'[+-]\d{{{n+m}}}', v))
-        if sign_kind == 'S':
-            return bool(re.fullmatch(rf'[+-]?\d{{{n+m}}}', v))
-        return bool(re.fullmatch(rf'\d{{{n+m}}}', v))
-    return True
+    checker = _format_checker(fmt)
+    return True if checker is None else checker(v)
+
+
+# Strict-check errors travel as plain tuples in this field order: a tuple is
+# a fraction of a dict's size and pickles several times faster between worker
+# processes.  :func:`_error_dicts` converts them once results are reported.
+_ERROR_FIELDS = ('severity', 'category', 'code', 'message', 'row', 'field')
+
+
+def _error_dicts(errors: list) -> list:
+    """Return *errors* with every :data:`_ERROR_FIELDS` tuple converted to a dict."""
+    return [dict(zip(_ERROR_FIELDS, e)) if type(e) is tuple else e for e in errors]
+
+
+@dataclass(frozen=True)
+class _StrictFieldPlan:
+    """A strict field definition with every lookup resolved ahead of time.
+
+    Built once per run by :func:`_compile_strict_plan` so chunk checks never
+    re-read the mapping dicts, re-parse format codes or rebuild allowed sets.
+    """
+
+    pos: int
+    name: str
+    type_check: Optional[Callable[[str], bool]]
+    type_code: str
+    type_label: str
+    required: bool
+    allowed: Optional[list]
+    format_check: Optional[Callable[[str], bool]]
+    # Message text fixed per field, formatted once here so error paths only
+    # concatenate the offending value.
+    type_prefix: str = ''
+    required_message: str = ''
+    invalid_value_prefix: str = ''
+    invalid_format_prefix: str = ''
+
+
+def _compile_strict_plan(strict_fields) -> tuple:
+    """Resolve *strict_fields* into a tuple of :class:`_StrictFieldPlan`.
+
+    Format checkers are closures and cannot be pickled, so worker processes
+    compile their own plan in :func:`_worker_init`.
+    """
+    plan = []
+    for pos, field in enumerate(strict_fields or []):
+        name = field.get('name')
+        dtype = str(field.get('data_type') or '').lower()
+        type_check, type_code, type_label = None, '', ''
+        if dtype in {'integer', 'int'}:
+            type_check, type_code, type_label = _is_integer, 'DT_INT_001', 'integer'
+        elif dtype in {'float', 'decimal', 'number'}:
+            type_check, type_code, type_label = _is_float, 'DT_FLT_001', 'float'
+        fmt = str(field.get('format') or '').upper()
+        plan.append(_StrictFieldPlan(
+            pos=pos,
+            name=name,
+            type_check=type_check,
+            type_code=type_code,
+            type_label=type_label,
+            required=bool(field.get('required')),
+            allowed=_allowed_values(field) if field.get('valid_values') else None,
+            format_check=_format_checker(fmt) if fmt else None,
+            type_prefix=f"Field '{name}' expects {type_label} but got '",
+            required_message=f"Required field '{name}' is empty",
+            invalid_value_prefix=f"Field '{name}' has invalid value '",
+            invalid_format_prefix=f"Field '{name}' has invalid format for value '",
+        ))
+    return tuple(plan)
+
+
+_UNIQUE_SAMPLE_SIZE = 1024
+
+
+def _failing_values(values: np.ndarray, predicate: Callable[[str], bool]) -> np.ndarray:
+    """Boolean mask of the non-empty *values* for which *predicate* is False.
+
+    Fixed-width code and date columns repeat a few distinct values, so the
+    column is factorized and *predicate* runs once per distinct value.  When a
+    leading sample is mostly unique (IDs, amounts) factorizing would not pay
+    off and each value is checked directly.
+    """
+    sample = values[:_UNIQUE_SAMPLE_SIZE]
+    if len(sample) and len(set(sample.tolist())) > len(sample) // 2:
+        return np.fromiter(
+            (bool(v) and not predicate(v) for v in values.tolist()),
+            dtype=bool, count=len(values),
+        )
+    codes, uniques = pd.factorize(values)
+    failed = np.fromiter(
+        (bool(v) and not predicate(v) for v in uniques.tolist()),
+        dtype=bool, count=len(uniques),
+    )
+    return failed[codes]
+
+
+def _strict_field_errors(
+    chunk: pd.DataFrame,
+    row_base: int,
+    plan: tuple,
+    check_fixed_width: bool,
+    stripped: Optional[dict] = None,
+) -> list[dict]:
+    """Run data-type and strict fixed-width checks column-wise over *chunk*.
+
+    Each strict field is stripped once as a whole column and checked with
+    vectorized masks; errors are only built for offending rows.  The
+    result is ordered exactly as a row-by-row scan would produce it: by row,
+    data-type errors before fixed-width errors, then by field order, with
+    ``FW_REQ_001`` / ``FW_VAL_001`` taking precedence over ``FW_FMT_001``.
+
+    Args:
+        chunk: The DataFrame slice to validate.
+        row_base: Number of rows preceding this chunk in the file.
+        plan: Compiled strict fields from :func:`_compile_strict_plan`.
+        check_fixed_width: Whether required/valid-value/format checks apply.
+        stripped: Optional column name -> stripped values already computed by
+            :func:`_scan_columns`; missing columns are stripped on demand.
+
+    Returns:
+        List of error tuples in :data:`_ERROR_FIELDS` order.
+    """
+    keyed: list[tuple[int, int, int, tuple]] = []
+    stripped_cache: dict = dict(stripped or {})
+    present = [f for f in plan if f.name in chunk.columns]
+
+    def _stripped(name: str) -> np.ndarray:
+        if name not in stripped_cache:
+            values = chunk[name].to_numpy()
+            stripped_cache[name] = _strip_values(values, pd.isna(values))
+        return stripped_cache[name]
+
+    def _emit(mask, phase: int, pos: int, make) -> None:
+        for i in np.flatnonzero(np.asarray(mask, dtype=bool)):
+            keyed.append((int(i), phase, pos, make(int(i))))
+
+    failed_cache: dict = {}
+
+    def _failed(name: str, predicate: Callable[[str], bool]) -> np.ndarray:
+        # Fields sharing a column and predicate (e.g. the same format code)
+        # reuse one evaluation per chunk.
+        key = (name, predicate)
+        if key not in failed_cache:
+            failed_cache[key] = _failing_values(_stripped(name), predicate)
+        return failed_cache[key]
+
+    for f in present:
+        if f.type_check is None:
+            continue
+        values = _stripped(f.name)
+        bad = (values != '') & _failed(f.name, f.type_check)
+        _emit(bad, 0, f.pos, lambda i, f=f, values=values: (
+            'error', 'data_type', f.type_code,
+            f.type_prefix + values[i] + "'", row_base + i + 1, f.name,
+        ))
+
+    if check_fixed_width:
+        for f in present:
+            values = _stripped(f.name)
+            empty = values == ''
+
+            if f.required:
+                _emit(empty, 1, f.pos, lambda i, f=f: (
+                    'error', 'strict_fixed_width', 'FW_REQ_001',
+                    f.required_message, row_base + i + 1, f.name,
+                ))
+            remaining = ~empty
+
+            if f.allowed is not None:
+                invalid = remaining & ~pd.Series(values, copy=False).isin(f.allowed).to_numpy()
+                _emit(invalid, 1, f.pos, lambda i, f=f, values=values: (
+                    'error', 'strict_fixed_width', 'FW_VAL_001',
+                    f.invalid_value_prefix + values[i] + "'", row_base + i + 1, f.name,
+                ))
+                remaining = remaining & ~invalid
+
+            if f.format_check is not None and remaining.any():
+                bad_format = remaining & _failed(f.name, f.format_check)
+                _emit(bad_format, 1, f.pos, lambda i, f=f, values=values: (
+                    'error', 'strict_fixed_width', 'FW_FMT_001',
+                    f.invalid_format_prefix + values[i] + "'", row_base + i + 1, f.name,
+                ))
+
+    keyed.sort(key=lambda item: item[:3])
+    return [item[3] for item in keyed]
+
+
+def _count_blank_strings(values: np.ndarray) -> int:
+    """Count string cells in *values* that are empty or whitespace-only.
+
+    Checks the raw objects with ``str.isspace`` instead of building a
+    stripped copy of the column; nulls and non-string objects never count.
+    """
+    return sum(1 for v in values if isinstance(v, str) and (not v or v.isspace()))
+
+
+def _arrow_column_counts(values: np.ndarray) -> Optional[tuple[int, int]]:
+    """Return ``(nulls, blanks)`` for an object column using ``pyarrow.compute``.
+
+    Arrow's string kernels run over the UTF-8 buffer without a Python call
+    per cell, about twice as fast as :func:`pd.isna` plus
+    :func:`_count_blank_strings`.  Returns None when pyarrow is not installed
+    or the column is not purely strings and nulls (e.g. mixed types); callers
+    then fall back to the pandas path.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+    try:
+        arr = pa.array(values, from_pandas=True, type=pa.string())
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    blanks = pc.or_(pc.equal(pc.utf8_length(arr), 0), pc.utf8_is_space(arr))
+    return arr.null_count, pc.sum(blanks).as_py() or 0
+
+
+def _strip_values(values: np.ndarray, nulls: np.ndarray) -> np.ndarray:
+    """Return ``str(v).strip()`` for each cell as an object array, ``''`` for nulls.
+
+    Plain ``str`` cells (the common case) skip both the null test and the
+    ``str()`` call.
+    """
+    strip = str.strip
+    out = np.empty(len(values), dtype=object)
+    out[:] = [
+        strip(v) if type(v) is str else ('' if is_null else strip(str(v)))
+        for v, is_null in zip(values, nulls.tolist())
+    ]
+    return out
+
+
+def _scan_columns(
+    chunk: pd.DataFrame,
+    strip_columns: frozenset = frozenset(),
+) -> tuple[np.ndarray, dict]:
+    """Single pass over *chunk*'s columns collecting counts and stripped values.
+
+    Returns ``(counts, stripped)``.  ``counts`` is a ``(2, n_columns)`` int64
+    array aligned to ``chunk.columns``: row 0 holds null counts, row 1 counts
+    non-null object cells that are empty after stripping whitespace.  Chunks
+    are summed with a single array add and only converted to dicts once, by
+    :func:`_fold_column_counts`.  ``stripped`` maps each column named in
+    *strip_columns* to its stripped values, so strict-field checks reuse the
+    same pass instead of re-reading the column.
+    """
+    counts = np.zeros((2, len(chunk.columns)), dtype=np.int64)
+    stripped: dict = {}
+    for i, (col, series) in enumerate(chunk.items()):
+        values = series.to_numpy()
+        if series.dtype == 'object' and col not in strip_columns:
+            arrow_counts = _arrow_column_counts(values)
+            if arrow_counts is not None:
+                counts[:, i] = arrow_counts
+                continue
+        nulls = pd.isna(values)
+        counts[0, i] = int(nulls.sum())
+        if col in strip_columns and col not in stripped:
+            stripped[col] = _strip_values(values, nulls)
+            if series.dtype == 'object':
+                counts[1, i] = int(np.count_nonzero((stripped[col] == '') & ~nulls))
+        elif series.dtype == 'object':
+            counts[1, i] = _count_blank_strings(values)
+    return counts, stripped
+
+
+def _allowed_values(field: dict) -> list:
+    """Stripped, de-duplicated ``valid_values`` of a strict field."""
+    return sorted({str(v).strip() for v in (field.get('valid_values') or [])})
+
+
+def _strict_column_names(plan: tuple) -> frozenset:
+    """Names of the columns that strict-field checks will read."""
+    return frozenset(f.name for f in plan if f.name)
+
+
+def _add_column_counts(totals: dict, columns: tuple, counts: np.ndarray) -> None:
+    """Accumulate one chunk's column counts into *totals* in place."""
+    if columns in totals:
+        totals[columns] += counts
+    else:
+        totals[columns] = counts.copy()
+
+
+def _fold_column_counts(totals: dict) -> tuple[dict, dict]:
+    """Convert accumulated column counts into ``(nulls, empty_strings)`` dicts.
+
+    Only columns with a non-zero count are included, matching the shape of
+    the ``null_counts`` / ``empty_string_counts`` statistics.
+    """
+    nulls: dict = {}
+    empty_strings: dict = {}
+    for columns, counts in totals.items():
+        for col, n_null, n_empty in zip(columns, counts[0].tolist(), counts[1].tolist()):
+            if n_null:
+                nulls[col] = nulls.get(col, 0) + n_null
+            if n_empty:
+                empty_strings[col] = empty_strings.get(col, 0) + n_empty
+    return nulls, empty_strings
 
 
 def _validate_chunk_worker(
@@ -90,6 +472,8 @@ def _validate_chunk_worker(
     strict_fixed_width: bool,
     strict_fields: list[dict],
     strict_level: str,
+    strict_plan: Optional[tuple] = None,
+    return_row_hashes: bool = False,
 ) -> dict:
     """Validate a single DataFrame chunk and return an aggregated result dict.
 
@@ -107,111 +491,387 @@ def _validate_chunk_worker(
             may contain ``name``, ``data_type``, ``required``, and ``format``.
         strict_level: Strictness tier — ``'format'`` only checks format codes;
             ``'all'`` also checks data type compatibility.
+        strict_plan: Optional precompiled :func:`_compile_strict_plan` result
+            for *strict_fields*; compiled on demand when omitted.
+        return_row_hashes: Also return the chunk's :func:`_row_hashes` so the
+            coordinator can run cross-chunk duplicate detection without
+            hashing the chunk itself.
 
     Returns:
         Dict with keys:
-        - ``errors``: list of error message strings.
+        - ``errors``: list of error tuples in :data:`_ERROR_FIELDS` order.
         - ``warnings``: list of warning message strings.
-        - ``stats``: dict with ``duplicates`` count, ``nulls`` per column, and
-          ``empty_strings`` per column.
+        - ``stats``: dict with the ``duplicates`` count (rows repeating an
+          earlier row of the same chunk), the chunk ``columns`` and
+          ``column_counts`` (see :func:`_scan_columns`).
         - ``rows``: number of rows processed in this chunk.
+        - ``row_hashes``: only when *return_row_hashes* is set.
     """
     errors = []
     warnings = []
-    stats = {'duplicates': 0, 'nulls': {}, 'empty_strings': {}}
+    stats = {
+        'duplicates': 0,
+        'columns': tuple(chunk.columns),
+        'column_counts': np.zeros((2, len(chunk.columns)), dtype=np.int64),
+    }
 
     if chunk.empty:
         warnings.append(f"Chunk {chunk_num} is empty")
         return {'errors': errors, 'warnings': warnings, 'stats': stats, 'rows': 0}
 
-    null_counts = chunk.isnull().sum()
-    for col, count in null_counts.items():
-        if count > 0:
-            stats['nulls'][col] = int(count)
-
-    for col in chunk.columns:
-        if chunk[col].dtype == 'object':
-            series = chunk[col]
-            empty_mask = series.notna() & (series.astype(str).str.strip() == '')
-            empty_count = int(empty_mask.sum())
-            if empty_count > 0:
-                stats['empty_strings'][col] = empty_count
-
-    if strict_fields:
-        row_base = (chunk_num - 1) * chunk_size
-        for local_idx, row in chunk.reset_index(drop=True).iterrows():
-            row_num = row_base + local_idx + 1
-            # --- data-type checks ---
-            for field in strict_fields:
-                name = field.get('name')
-                dtype = str(field.get('data_type') or '').lower()
-                if not dtype or dtype == 'string' or name not in chunk.columns:
-                    continue
-                value = '' if pd.isna(row.get(name)) else str(row.get(name)).strip()
-                if not value:
-                    continue
-                if dtype in {'integer', 'int'} and not _is_integer(value):
-                    errors.append({
-                        'severity': 'error',
-                        'category': 'data_type',
-                        'code': 'DT_INT_001',
-                        'message': f"Field '{name}' expects integer but got '{value}'",
-                        'row': row_num,
-                        'field': name,
-                    })
-                elif dtype in {'float', 'decimal', 'number'} and not _is_float(value):
-                    errors.append({
-                        'severity': 'error',
-                        'category': 'data_type',
-                        'code': 'DT_FLT_001',
-                        'message': f"Field '{name}' expects float but got '{value}'",
-                        'row': row_num,
-                        'field': name,
-                    })
-            # --- strict fixed-width checks ---
-            if strict_fixed_width and strict_level in {'format', 'all'}:
-                for field in strict_fields:
-                    name = field.get('name')
-                    if name not in chunk.columns:
-                        continue
-                    value = '' if pd.isna(row.get(name)) else str(row.get(name)).strip()
-
-                    if field.get('required') and value == '':
-                        errors.append({
-                            'severity': 'error',
-                            'category': 'strict_fixed_width',
-                            'code': 'FW_REQ_001',
-                            'message': f"Required field '{name}' is empty",
-                            'row': row_num,
-                            'field': name,
-                        })
-                        continue
-
-                    if value and field.get('valid_values'):
-                        allowed = {str(v).strip() for v in (field.get('valid_values') or [])}
-                        if value not in allowed:
-                            errors.append({
-                                'severity': 'error',
-                                'category': 'strict_fixed_width',
-                                'code': 'FW_VAL_001',
-                                'message': f"Field '{name}' has invalid value '{value}'",
-                                'row': row_num,
-                                'field': name,
-                            })
-                            continue
+    hashes = _row_hashes(chunk)
+    stats['duplicates'] = len(hashes) - len(np.unique(hashes))
 
-                    fmt = str(field.get('format') or '').upper()
-                    if value and fmt and not _is_value_valid_for_format(value, fmt):
-                        errors.append({
-                            'severity': 'error',
-                            'category': 'strict_fixed_width',
-                            'code': 'FW_FMT_001',
-                            'message': f"Field '{name}' has invalid format for value '{value}'",
-                            'row': row_num,
-                            'field': name,
-                        })
+    if strict_plan is None:
+        strict_plan = _compile_strict_plan(strict_fields)
+    stats['column_counts'], stripped = _scan_columns(chunk, _strict_column_names(strict_plan))
 
-    return {'errors': errors, 'warnings': warnings, 'stats': stats, 'rows': len(chunk)}
+    if strict_plan:
+        errors.extend(_strict_field_errors(
+            chunk, (chunk_num - 1) * chunk_size, strict_plan,
+            strict_fixed_width and strict_level in {'format', 'all'},
+            stripped,
+        ))
+
+    out = {'errors': errors, 'warnings': warnings, 'stats': stats, 'rows': len(chunk)}
+    if return_row_hashes:
+        out['row_hashes'] = hashes
+    return out
+
+
+# Per-process validation settings, installed once by ``_worker_init`` so each
+# submitted task only has to carry the chunk itself.
+_WORKER_CONFIG: dict = {}
+
+
+# Business-rule engine for the worker process, built by ``_worker_init`` when
+# the validator has a rules config.
+_WORKER_RULES: dict = {}
+
+
+def _worker_init(
+    chunk_size: int,
+    strict_fixed_width: bool,
+    strict_fields: tuple,
+    strict_level: str,
+    rules_config: Optional[dict] = None,
+) -> None:
+    """ProcessPoolExecutor initializer caching the immutable validator config.
+
+    The strict-field plan and, when *rules_config* is given, the business
+    rule engine are built here, once per worker process.
+    """
+    _WORKER_CONFIG.update(
+        chunk_size=chunk_size,
+        strict_fixed_width=strict_fixed_width,
+        strict_fields=list(strict_fields),
+        strict_level=strict_level,
+        strict_plan=_compile_strict_plan(strict_fields),
+    )
+    _WORKER_RULES.clear()
+    if rules_config is not None:
+        from ..validators.cross_row_validator import CrossRowValidator
+        engine = RuleEngine(rules_config)
+        engine.disable_invalid_rules()
+        _WORKER_RULES.update(
+            engine=engine, cross_row=CrossRowValidator(), columns=engine.referenced_columns(),
+        )
+
+
+def _project_columns(chunk: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    """Narrow *chunk* to the given *columns* it has, keeping chunk order.
+
+    Business rules read only a few columns, and ``when`` conditions copy
+    every column of the rows they keep; projecting first makes those
+    copies proportionally smaller.  *chunk* is returned as is when
+    *columns* is None (unknown) or names none of its columns.
+    """
+    if columns is None:
+        return chunk
+    keep = chunk.columns.isin(columns)
+    return chunk if keep.all() or not keep.any() else chunk.loc[:, keep]
+
+
+def _business_rules_in_worker(chunk: pd.DataFrame) -> tuple[list, list]:
+    """Run the worker's business rules over *chunk*.
+
+    Returns ``(violations, cross_row_states)``: field and cross-field rule
+    violations as dicts, and ``(rule_id, partial_state)`` pairs for the
+    cross-row map step, which the coordinator merges across chunks.
+    """
+    engine = _WORKER_RULES['engine']
+    cross_row = _WORKER_RULES['cross_row']
+    chunk = _project_columns(chunk, _WORKER_RULES['columns'])
+    violations = [v.to_dict() for v in engine.validate_non_cross_row(chunk)]
+    states = [
+        (rule['id'], cross_row.collect_partial_state(rule, engine._apply_condition(rule, chunk)))
+        for rule in engine.cross_row_rules
+    ]
+    return violations, states
+
+
+def _validate_chunk_in_worker(
+    chunk: pd.DataFrame,
+    chunk_num: int,
+    return_row_hashes: bool = False,
+) -> dict:
+    """Validate *chunk* using the settings installed by :func:`_worker_init`.
+
+    With business rules configured, the result also carries
+    ``violations`` and ``cross_row_states`` (see
+    :func:`_business_rules_in_worker`).
+    """
+    out = _validate_chunk_worker(
+        chunk, chunk_num, **_WORKER_CONFIG, return_row_hashes=return_row_hashes,
+    )
+    if _WORKER_RULES and not chunk.empty:
+        out['violations'], out['cross_row_states'] = _business_rules_in_worker(chunk)
+    return out
+
+
+def _chunk_to_shared_memory(chunk: pd.DataFrame) -> Optional[tuple]:
+    """Write *chunk* into a new shared-memory block as an Arrow IPC stream.
+
+    Returns ``(shm, nbytes)``, or None when pyarrow is not installed or cannot
+    represent the chunk (e.g. mixed-type object columns); callers then pickle
+    the DataFrame as before.  The caller owns the block and must release it
+    with :func:`_release_shared_chunk`.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    try:
+        batch = pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+    except (pa.ArrowException, ValueError, TypeError):
+        return None
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    payload = sink.getvalue()
+    shm = shared_memory.SharedMemory(create=True, size=max(payload.size, 1))
+    shm.buf[:payload.size] = np.frombuffer(payload, dtype=np.uint8)
+    return shm, payload.size
+
+
+def _release_shared_chunk(shm) -> None:
+    """Close and unlink a block created by :func:`_chunk_to_shared_memory`."""
+    if shm is None:
+        return
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _validate_shared_chunk_in_worker(
+    shm_name: str,
+    nbytes: int,
+    columns: list,
+    row_start: int,
+    chunk_num: int,
+    return_row_hashes: bool = False,
+) -> dict:
+    """Rebuild a chunk from shared memory and validate it in a worker."""
+    import pyarrow as pa
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        # Copy out so no Arrow buffer keeps the mapping exported past close().
+        payload = bytes(shm.buf[:nbytes])
+    finally:
+        shm.close()
+    chunk = pa.ipc.open_stream(payload).read_all().to_pandas()
+    # Arrow stringifies column labels and drops the index; restore the
+    # parser's originals (business-rule row numbers come from the index).
+    chunk.columns = columns
+    chunk.index = pd.RangeIndex(row_start, row_start + len(chunk))
+    return _validate_chunk_in_worker(chunk, chunk_num, return_row_hashes)
+
+
+def _submit_chunk(
+    pool: ProcessPoolExecutor,
+    chunk: pd.DataFrame,
+    chunk_num: int,
+    return_row_hashes: bool = False,
+) -> tuple:
+    """Submit *chunk* to *pool*, via shared memory when possible.
+
+    Returns ``(future, shm_or_None)``; the shared block must be released once
+    the future has completed.
+    """
+    shared = _chunk_to_shared_memory(chunk)
+    if shared is None:
+        return pool.submit(_validate_chunk_in_worker, chunk, chunk_num, return_row_hashes), None
+    shm, nbytes = shared
+    try:
+        future = pool.submit(
+            _validate_shared_chunk_in_worker, shm.name, nbytes, list(chunk.columns),
+            int(chunk.index[0]) if len(chunk) else 0, chunk_num, return_row_hashes,
+        )
+    except Exception:
+        _release_shared_chunk(shm)
+        raise
+    return future, shm
+
+
+def _row_hashes(chunk: pd.DataFrame) -> np.ndarray:
+    """Hash each row of *chunk* (values only, index ignored) to a uint64.
+
+    ``categorize=False`` yields identical hashes but skips factorizing each
+    column first, which is about 3x faster on high-cardinality string data.
+    """
+    return pd.util.hash_pandas_object(chunk, index=False, categorize=False).to_numpy()
+
+
+class _RowHashSet:
+    """Exact, memory-bounded set of row hashes used for duplicate detection.
+
+    Rows are hashed in C via :func:`pandas.util.hash_pandas_object` and kept
+    in sorted, contiguous ``uint64`` runs (8 bytes per row), so membership
+    tests and inserts are NumPy operations over the whole chunk rather than a
+    Python loop per row.  New hashes form a run of their own and runs of
+    similar size are merged, so there are only O(log n) runs and inserting
+    never rewrites the whole table; this keeps large duplicate-check limits
+    affordable.
+    """
+
+    def __init__(self) -> None:
+        self._runs: list[np.ndarray] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_chunk(self, chunk: pd.DataFrame) -> int:
+        """Record every row of *chunk* and return how many were already seen.
+
+        A row counts as a duplicate when an identical row appeared earlier in
+        the same chunk or in any previously added chunk.
+        """
+        if chunk.empty:
+            return 0
+        return self.add_hashes(_row_hashes(chunk))
+
+    def add_hashes(self, hashes: np.ndarray) -> int:
+        """Like :meth:`add_chunk`, for row hashes computed by :func:`_row_hashes`."""
+        if len(hashes) == 0:
+            return 0
+        unique = np.unique(hashes)
+        seen = np.zeros(len(unique), dtype=bool)
+        for run in self._runs:
+            pos = np.searchsorted(run, unique)
+            pos[pos == len(run)] = 0
+            seen |= run[pos] == unique
+        new = unique[~seen]
+        if len(new):
+            self._size += len(new)
+            runs = self._runs
+            runs.append(new)
+            while len(runs) > 1 and len(runs[-2]) <= 2 * len(runs[-1]):
+                tail = runs.pop()
+                merged = np.concatenate((runs.pop(), tail))
+                # Two sorted, disjoint runs: the stable sort merges them in O(n).
+                merged.sort(kind='stable')
+                runs.append(merged)
+        return len(hashes) - len(new)
+
+
+@lru_cache(maxsize=16)
+def _load_rules_config(path: str, mtime_ns: int) -> dict:
+    """Parse the business-rules JSON at *path*, once per file version.
+
+    *mtime_ns* is part of the cache key so an edited file is re-read.  The
+    returned dict is shared between validators; :class:`RuleEngine` only
+    reads it.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+# RSS growth (MB) over the level at the start of the chunk loop that
+# triggers a full collection while automatic GC is paused.
+_GC_HEADROOM_MB = 512
+
+# Automatic GC is process-wide, so concurrent validations share one pause:
+# the first to pause records whether GC was on, the last to resume restores it.
+_gc_pause_lock = threading.Lock()
+_gc_pausers = 0
+_gc_was_enabled = False
+
+
+def _pause_gc() -> None:
+    """Pause automatic garbage collection until the matching :func:`_resume_gc`."""
+    global _gc_pausers, _gc_was_enabled
+    with _gc_pause_lock:
+        if _gc_pausers == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pausers += 1
+
+
+def _resume_gc() -> None:
+    """End one :func:`_pause_gc`; GC comes back on when no other pause is active."""
+    global _gc_pausers
+    with _gc_pause_lock:
+        _gc_pausers -= 1
+        if _gc_pausers == 0 and _gc_was_enabled:
+            gc.enable()
+
+# Violations kept in memory (and returned) when they stream to a JSONL file.
+_VIOLATION_SAMPLE_SIZE = 100
+
+_PREFETCH_DEPTH = 2
+_PREFETCH_DONE = object()
+
+
+def _prefetch_chunks(chunks: Iterator[pd.DataFrame], depth: int = _PREFETCH_DEPTH) -> Iterator[pd.DataFrame]:
+    """Yield *chunks* in order while a reader thread parses up to *depth* ahead.
+
+    File reads and the C tokenizer release the GIL, so parsing the next chunk
+    overlaps with validating the current one.  An exception raised by
+    *chunks* is re-raised here; closing this generator early stops the
+    reader and closes *chunks*.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _put(item: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read() -> None:
+        try:
+            for chunk in chunks:
+                if not _put((chunk, None)):
+                    return
+            _put((_PREFETCH_DONE, None))
+        except BaseException as exc:  # handed to the consuming thread
+            _put((_PREFETCH_DONE, exc))
+        finally:
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+
+    reader = threading.Thread(target=_read, name='chunk-prefetch', daemon=True)
+    reader.start()
+    try:
+        while True:
+            chunk, exc = buffer.get()
+            if chunk is _PREFETCH_DONE:
+                if exc is not None:
+                    raise exc
+                return
+            yield chunk
+    finally:
+        stop.set()
+        reader.join()
 
 
 class ChunkedFileValidator:
@@ -225,7 +885,11 @@ class ChunkedFileValidator:
                  strict_level: str = 'format',
                  strict_fields: Optional[List[Dict[str, Any]]] = None,
                  workers: int = 1,
-                 has_header: bool = True):
+                 has_header: bool = True,
+                 max_duplicate_rows: Optional[int] = 100000,
+                 engine: str = 'pandas',
+                 max_errors: Optional[int] = None,
+                 violations_jsonl_path: Optional[str] = None):
         """Initialize chunked validator.
 
         Args:
@@ -242,6 +906,23 @@ class ChunkedFileValidator:
             has_header: Whether the data file contains a header row. Forwarded
                 to the internal ChunkedFileParser when no external parser is
                 supplied.
+            max_duplicate_rows: Stop recording rows for duplicate detection
+                once this many distinct rows are held (8 bytes each); None
+                checks the whole file.
+            engine: CSV engine for the internal ChunkedFileParser
+                (``'pandas'`` or ``'pyarrow'``); ignored when *parser* is given.
+            max_errors: Stop reading further chunks once this many errors
+                are collected and keep only the first *max_errors* of them;
+                None (default) validates the whole file.  There is no finite
+                default because a cap would silently drop errors (and rows)
+                from existing callers' results.
+            violations_jsonl_path: When set, write every business-rule
+                violation to this file as one JSON object per line.  The
+                result then keeps only the first ``_VIOLATION_SAMPLE_SIZE``
+                violations, and the first ``_VIOLATION_SAMPLE_SIZE`` issues of
+                each severity in ``errors``/``warnings``/``info`` (plus a
+                warning with the full counts), so memory no longer grows
+                with the violation count.
         """
         self.file_path = file_path
         self.delimiter = delimiter
@@ -251,18 +932,32 @@ class ChunkedFileValidator:
         self.logger = get_logger(__name__)
         self.memory_monitor = MemoryMonitor()
         self.rule_engine: Optional[RuleEngine] = None
+        self._rule_columns: Optional[List[str]] = None
+        self._rule_config_warnings: List[str] = []
         self._total_rows_for_rules = 0
         self.expected_row_length = expected_row_length
         self.strict_fixed_width = strict_fixed_width
         self.strict_level = (strict_level or 'format').lower()
         self.strict_fields = strict_fields or []
+        self._strict_plan = _compile_strict_plan(self.strict_fields)
         self.workers = max(int(workers or 1), 1)
+        self.max_duplicate_rows = max_duplicate_rows
+        self.engine = engine
+        self.max_errors = max_errors
+        self.violations_jsonl_path = violations_jsonl_path
 
         if rules_config_path:
             try:
-                with open(rules_config_path, 'r') as f:
-                    rules_cfg = json.load(f)
+                rules_cfg = _load_rules_config(
+                    rules_config_path, os.stat(rules_config_path).st_mtime_ns,
+                )
                 self.rule_engine = RuleEngine(rules_cfg)
+                # Broken rules would raise (and be logged) on every chunk;
+                # drop them once and report them as run warnings instead.
+                self._rule_config_warnings = self.rule_engine.disable_invalid_rules()
+                for message in self._rule_config_warnings:
+                    self.logger.warning(message)
+                self._rule_columns = self.rule_engine.referenced_columns()
             except Exception as e:
                 self.logger.warning(f"Failed to load business rules: {e}")
     
@@ -275,6 +970,54 @@ class ChunkedFileValidator:
         Returns:
             Validation results dictionary
         """
+        result = self._validate(show_progress)
+        result['errors'] = _error_dicts(result['errors'])
+        return result
+
+    def validate_to_json(self, output_path: str, show_progress: bool = True) -> Dict[str, Any]:
+        """Validate file in chunks and write the result as newline-delimited JSON.
+
+        Each error, warning, info issue and business-rule violation becomes
+        one line tagged with ``record`` (``'error'``, ``'warning'``,
+        ``'info'`` or ``'violation'``); a final ``'summary'`` line holds the
+        rest of the result, with those lists replaced by their lengths.
+        Strict-check errors are encoded straight from their tuples, so the
+        list of error dicts :meth:`validate` returns is never built.
+
+        Args:
+            output_path: Path of the ``.jsonl`` file to write.
+            show_progress: Show progress bar
+
+        Returns:
+            The summary record.
+        """
+        result = self._validate(show_progress)
+        summary = {k: v for k, v in result.items() if k not in ('errors', 'warnings', 'info')}
+        business = dict(summary.get('business_rules') or {})
+        violations = business.pop('violations', [])
+        if 'business_rules' in summary:
+            business['violation_count'] = business['statistics']['total_violations']
+            summary['business_rules'] = business
+
+        with open(output_path, 'wb') as out:
+            def _write(record: str, items: list) -> int:
+                for item in items:
+                    if type(item) is tuple:
+                        item = dict(zip(_ERROR_FIELDS, item))
+                    elif not isinstance(item, dict):
+                        item = {'message': str(item)}
+                    out.write(_json_line({'record': record, **item}))
+                return len(items)
+
+            summary['error_count'] = _write('error', result.pop('errors', []))
+            summary['warning_count'] = _write('warning', result.pop('warnings', []))
+            summary['info_count'] = _write('info', result.pop('info', []))
+            _write('violation', violations)
+            out.write(_json_line({'record': 'summary', **summary}))
+        return {'record': 'summary', **summary}
+
+    def _validate(self, show_progress: bool) -> Dict[str, Any]:
+        """Run :meth:`validate`, leaving strict errors as :data:`_ERROR_FIELDS` tuples."""
         self.logger.info(f"Starting chunked validation: {self.file_path}")
         self.memory_monitor.log_memory_usage("validation start")
         start_ts = time.time()
@@ -283,22 +1026,33 @@ class ChunkedFileValidator:
         warnings = []
         info = []
         
-        # Validate structure first
         parser = self.parser or ChunkedFileParser(
             self.file_path, self.delimiter, self.chunk_size,
-            has_header=self.has_header,
+            has_header=self.has_header, engine=self.engine,
         )
-        structure_result = parser.validate_structure()
+
+        # The fixed-width row-length scan reads every line, so run it before
+        # the structure check and hand its line count to the parser: the
+        # structure file info and the progress total then need no extra pass.
+        length_scan = None
+        if self.expected_row_length and os.path.isfile(self.file_path):
+            length_scan = self._scan_fixed_width_row_lengths()
+            parser.set_row_count(length_scan[2])
+
+        # Validate structure first.  Its row count only sizes the progress
+        # bar, so skip that file pass when no progress is shown.
+        structure_result = parser.validate_structure(include_row_count=show_progress)
         
         if not structure_result['valid']:
             return structure_result
         
         # Add structure warnings
         warnings.extend(structure_result.get('warnings', []))
+        warnings.extend(self._rule_config_warnings)
 
         # Fixed-width row-length validation (captures row-level defects)
-        if self.expected_row_length:
-            mismatch_count, length_issues, scanned_rows = self._scan_fixed_width_row_lengths()
+        if length_scan is not None:
+            mismatch_count, length_issues, _ = length_scan
             errors.extend(length_issues)
             if mismatch_count > len(length_issues):
                 warnings.append(
@@ -307,95 +1061,193 @@ class ChunkedFileValidator:
 
         # Initialize statistics
         total_rows = 0
-        total_nulls = {}
-        total_empty_strings = {}
+        column_totals: dict = {}  # columns tuple -> (2, n) null/empty counts
         duplicate_count = 0
-        seen_rows = set()  # For duplicate detection (memory-limited)
-        max_seen_rows = 100000  # Limit duplicate tracking
+        within_chunk_duplicates = 0
+        seen_rows = _RowHashSet()  # For duplicate detection (memory-limited)
+        duplicate_check_unbounded = self.max_duplicate_rows is None
+        max_seen_rows = sys.maxsize if duplicate_check_unbounded else self.max_duplicate_rows
 
         business_violations: list[dict] = []
+        violation_count = 0
+        violations_out = None
+        actual_columns: Optional[list] = None  # columns of the first chunk
+        error_limit_reached = False
+
+        def _at_error_limit() -> bool:
+            return self.max_errors is not None and len(errors) >= self.max_errors
         
         # Parse and validate chunks
         progress = ProgressTracker(parser.count_rows(), "Validating") if show_progress else None
         
+        # Both chunk loops collect every 10 chunks only once RSS has grown
+        # past this watermark (re-armed after each collection).
+        gc_watermark_mb = self.memory_monitor.get_current_memory_mb() + _GC_HEADROOM_MB
+        gc_paused = False
         try:
-            parallel_enabled = self.workers > 1 and self.rule_engine is None
-            if self.workers > 1 and self.rule_engine is not None:
-                warnings.append("Parallel mode disabled because business rules are enabled; falling back to sequential validation")
+            if self.violations_jsonl_path:
+                violations_out = open(self.violations_jsonl_path, 'wb')
+            parallel_enabled = self.workers > 1
+
+            # Cross-row rules require map-reduce across all chunks to detect
+            # violations that straddle chunk boundaries (issue #358).
+            from src.validators.cross_row_validator import CrossRowValidator as _CRV
+            _cross_row_validator = _CRV()
+            # rule_id → {'rule': rule_dict, 'states': [partial_state, ...]}
+            _cross_row_partial_states: dict = {}
+            cross_row_rules = self.rule_engine.cross_row_rules if self.rule_engine is not None else []
+            cross_row_rules_by_id = {rule['id']: rule for rule in cross_row_rules}
+
+            def _record_partial_state(rule: dict, partial: dict) -> None:
+                entry = _cross_row_partial_states.setdefault(
+                    rule['id'], {'rule': rule, 'states': []}
+                )
+                entry['states'].append(partial)
+
+            def record_violation(v: dict) -> None:
+                nonlocal violation_count
+                violation_count += 1
+                if violations_out is None:
+                    business_violations.append(v)
+                    return
+                violations_out.write(_json_line(v))
+                if len(business_violations) < _VIOLATION_SAMPLE_SIZE:
+                    business_violations.append(v)
+
+            # Bound methods are looked up once, not per violation.
+            route_issue = {'error': errors.append, 'warning': warnings.append}
+            route_info = info.append
+            # severity -> business-rule issues seen, counted while streaming
+            # so only a sample of them is kept as issues.
+            streamed_issue_counts: Dict[str, int] = {}
+
+            def _record_violations(violations) -> None:
+                """Record violation dicts (see :meth:`RuleViolation.to_dict`)."""
+                for v in violations:
+                    record_violation(v)
+                    if violations_out is not None:
+                        seen = streamed_issue_counts.get(v['severity'], 0)
+                        streamed_issue_counts[v['severity']] = seen + 1
+                        if seen >= _VIOLATION_SAMPLE_SIZE:
+                            continue
+                    route_issue.get(v['severity'], route_info)({
+                        'severity': v['severity'],
+                        'category': 'business_rule',
+                        'message': v['message'],
+                        'row': v['row_number'],
+                        'field': v['field'],
+                        'rule_id': v['rule_id'],
+                        'rule_name': v['rule_name'],
+                    })
+
+            # When the file has no header row, supply field names from the
+            # mapping so that named-field lookups in _validate_chunk work.
+            col_names: Optional[List[str]] = None
+            if not self.has_header and self.strict_fields:
+                col_names = [
+                    f['name'] for f in self.strict_fields
+                    if isinstance(f, dict) and f.get('name')
+                ] or None
+
+            chunk_iter: Iterator[pd.DataFrame] = parser.parse_chunks(columns=col_names)
+            if parallel_enabled:
+                # A single chunk gains nothing from workers; skip the pool
+                # start-up and pickling cost.  Peeking at the first two chunks
+                # decides this without a row-count pass over the file.
+                head = list(islice(chunk_iter, 2))
+                chunk_iter = chain(head, chunk_iter)
+                if len(head) < 2:
+                    self.logger.info("File fits in one chunk; validating sequentially")
+                    parallel_enabled = False
 
             if parallel_enabled:
                 max_in_flight = max(self.workers * 2, 2)
-                pending: dict[Any, int] = {}
-
-                with ProcessPoolExecutor(max_workers=self.workers) as pool:
-                    for chunk_num, chunk in enumerate(parser.parse_chunks(), 1):
-                        # Keep duplicate detection active in parallel mode on the coordinator thread
-                        # (memory-limited to max_seen_rows, same semantics as sequential mode).
-                        if len(seen_rows) < max_seen_rows:
-                            for _, row in chunk.iterrows():
-                                row_hash = hash(tuple(row.values))
-                                if row_hash in seen_rows:
-                                    duplicate_count += 1
-                                else:
-                                    seen_rows.add(row_hash)
-
-                        fut = pool.submit(
-                            _validate_chunk_worker,
-                            chunk,
-                            chunk_num,
-                            self.chunk_size,
-                            bool(self.strict_fixed_width),
-                            list(self.strict_fields),
-                            str(self.strict_level or 'format'),
-                        )
-                        pending[fut] = chunk_num
-
-                        total_rows += len(chunk)
-                        if progress:
-                            progress.update(total_rows)
-
-                        while len(pending) >= max_in_flight:
-                            done, _ = wait(set(pending.keys()), return_when=FIRST_COMPLETED)
-                            for d in done:
-                                out = d.result()
-                                pending.pop(d, None)
-                                errors.extend(out.get('errors', []))
-                                warnings.extend(out.get('warnings', []))
-                                chunk_stats = out.get('stats', {})
-                                for col, count in chunk_stats.get('nulls', {}).items():
-                                    total_nulls[col] = total_nulls.get(col, 0) + count
-                                for col, count in chunk_stats.get('empty_strings', {}).items():
-                                    total_empty_strings[col] = total_empty_strings.get(col, 0) + count
-
-                    while pending:
-                        done, _ = wait(set(pending.keys()), return_when=FIRST_COMPLETED)
-                        for d in done:
-                            out = d.result()
-                            pending.pop(d, None)
-                            errors.extend(out.get('errors', []))
-                            warnings.extend(out.get('warnings', []))
-                            chunk_stats = out.get('stats', {})
-                            for col, count in chunk_stats.get('nulls', {}).items():
-                                total_nulls[col] = total_nulls.get(col, 0) + count
-                            for col, count in chunk_stats.get('empty_strings', {}).items():
-                                total_empty_strings[col] = total_empty_strings.get(col, 0) + count
+                in_flight: deque = deque()
+
+                def _merge(entry: tuple) -> None:
+                    nonlocal duplicate_count, within_chunk_duplicates, total_rows
+                    future, shm, chunk_rows = entry
+                    try:
+                        out = future.result()
+                    finally:
+                        _release_shared_chunk(shm)
+                    # Rows count as validated once their results are merged.
+                    total_rows += chunk_rows
+                    if progress:
+                        progress.update(total_rows)
+                    errors.extend(out.get('errors', []))
+                    warnings.extend(out.get('warnings', []))
+                    chunk_stats = out['stats']
+                    _add_column_counts(column_totals, chunk_stats['columns'], chunk_stats['column_counts'])
+                    within_chunk_duplicates += chunk_stats['duplicates']
+                    # Results merge in chunk order, so cross-chunk duplicate
+                    # detection sees rows in file order, as in sequential mode.
+                    if 'row_hashes' in out and len(seen_rows) < max_seen_rows:
+                        duplicate_count += seen_rows.add_hashes(out['row_hashes'])
+                    # Business rules ran in the worker; the violations and
+                    # cross-row partial states also arrive in chunk order.
+                    _record_violations(out.get('violations', ()))
+                    for rule_id, partial in out.get('cross_row_states', ()):
+                        _record_partial_state(cross_row_rules_by_id[rule_id], partial)
+
+                with ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_worker_init,
+                    initargs=(
+                        self.chunk_size,
+                        bool(self.strict_fixed_width),
+                        tuple(self.strict_fields),
+                        str(self.strict_level or 'format'),
+                        self.rule_engine.rules_config if self.rule_engine is not None else None,
+                    ),
+                ) as pool:
+                    try:
+                        for chunk_num, chunk in enumerate(chunk_iter, 1):
+                            if actual_columns is None:
+                                actual_columns = list(chunk.columns)
+                            # Bounded FIFO: at most max_in_flight chunks are held in
+                            # memory, and results are merged in chunk order as soon
+                            # as they are ready, so the error cap is checked early.
+                            while in_flight and (len(in_flight) >= max_in_flight or in_flight[0][0].done()):
+                                _merge(in_flight.popleft())
+                                if _at_error_limit():
+                                    error_limit_reached = True
+                                    break
+                            if error_limit_reached:
+                                break
+                            # Workers hash rows for duplicate detection (memory-
+                            # limited to max_seen_rows) while the set has room.
+                            in_flight.append(_submit_chunk(
+                                pool, chunk, chunk_num, len(seen_rows) < max_seen_rows,
+                            ) + (len(chunk),))
+
+                            if chunk_num % 10 == 0 and self.memory_monitor.collect_if_above(gc_watermark_mb):
+                                gc_watermark_mb = self.memory_monitor.get_current_memory_mb() + _GC_HEADROOM_MB
+
+                        while in_flight and not error_limit_reached:
+                            _merge(in_flight.popleft())
+                            error_limit_reached = _at_error_limit()
+                    finally:
+                        # Chunks still queued after the error cap are never
+                        # validated; drop them before the pool shuts down.
+                        for future, shm, _ in in_flight:
+                            future.cancel()
+                            _release_shared_chunk(shm)
+                if self.rule_engine is not None:
+                    self.rule_engine.set_total_rows(total_rows)
             else:
-                # Cross-row rules require map-reduce across all chunks to detect
-                # violations that straddle chunk boundaries (issue #358).
-                from src.validators.cross_row_validator import CrossRowValidator as _CRV
-                _cross_row_validator = _CRV()
-                # rule_id → {'rule': rule_dict, 'states': [partial_state, ...]}
-                _cross_row_partial_states: dict = {}
-
-                # When the file has no header row, supply field names from the
-                # mapping so that named-field lookups in _validate_chunk work.
-                col_names: Optional[List[str]] = None
-                if not self.has_header and self.strict_fields:
-                    col_names = [
-                        f['name'] for f in self.strict_fields
-                        if isinstance(f, dict) and f.get('name')
-                    ] or None
-                for chunk_num, chunk in enumerate(parser.parse_chunks(columns=col_names), 1):
+                chunks = _prefetch_chunks(chunk_iter)
+                # Chunks and their error tuples are acyclic, yet every
+                # allocation burst would trigger automatic collections that
+                # rescan all errors gathered so far.  GC is process-wide, so
+                # pause it for this loop only (resumed right after, or in
+                # ``finally``); the parallel branch, whose chunk work runs in
+                # the workers, leaves it on.
+                _pause_gc()
+                gc_paused = True
+                for chunk_num, chunk in enumerate(chunks, 1):
+                    if actual_columns is None:
+                        actual_columns = list(chunk.columns)
                     # Validate chunk
                     chunk_errors, chunk_warnings, chunk_stats = self._validate_chunk(
                         chunk, chunk_num, seen_rows, max_seen_rows
@@ -411,90 +1263,60 @@ class ChunkedFileValidator:
                     # Optional business-rule validation (map-reduce for cross-row rules).
                     if self.rule_engine is not None:
                         self.rule_engine.set_total_rows(total_rows)
+                        rule_chunk = _project_columns(chunk, self._rule_columns)
 
                         # Field / cross-field rules: evaluate per chunk immediately.
-                        chunk_violations = self.rule_engine.validate_non_cross_row(chunk)
-                        for v in chunk_violations:
-                            vdict = v.to_dict()
-                            business_violations.append(vdict)
-                            issue = {
-                                'severity': v.severity,
-                                'category': 'business_rule',
-                                'message': v.message,
-                                'row': v.row_number,
-                                'field': v.field,
-                                'rule_id': v.rule_id,
-                                'rule_name': v.rule_name,
-                            }
-                            if v.severity == 'error':
-                                errors.append(issue)
-                            elif v.severity == 'warning':
-                                warnings.append(issue)
-                            else:
-                                info.append(issue)
+                        _record_violations(
+                            v.to_dict() for v in self.rule_engine.validate_non_cross_row(rule_chunk)
+                        )
 
                         # Cross-row rules: collect partial state per chunk (map step).
-                        for rule in self.rule_engine.cross_row_rules:
-                            scoped_chunk = self.rule_engine._apply_condition(rule, chunk)
-                            partial = _cross_row_validator.collect_partial_state(
-                                rule, scoped_chunk
+                        for rule in cross_row_rules:
+                            scoped_chunk = self.rule_engine._apply_condition(rule, rule_chunk)
+                            _record_partial_state(
+                                rule, _cross_row_validator.collect_partial_state(rule, scoped_chunk)
                             )
-                            entry = _cross_row_partial_states.setdefault(
-                                rule['id'], {'rule': rule, 'states': []}
-                            )
-                            entry['states'].append(partial)
-
-                    # Aggregate null counts
-                    for col, count in chunk_stats['nulls'].items():
-                        total_nulls[col] = total_nulls.get(col, 0) + count
 
-                    # Aggregate empty string counts
-                    for col, count in chunk_stats['empty_strings'].items():
-                        total_empty_strings[col] = total_empty_strings.get(col, 0) + count
+                    # Aggregate null and empty-string counts
+                    _add_column_counts(column_totals, chunk_stats['columns'], chunk_stats['column_counts'])
 
                     if progress:
                         progress.update(total_rows)
 
-                    # Periodic garbage collection
-                    if chunk_num % 10 == 0:
-                        self.memory_monitor.force_garbage_collection()
-
-                # Cross-row rules: merge partial states and evaluate (reduce step).
-                if self.rule_engine is not None:
-                    for rule_id, data in _cross_row_partial_states.items():
-                        rule = data['rule']
-                        merged = _cross_row_validator.merge_partial_states(
-                            rule, data['states']
-                        )
-                        cr_violations = _cross_row_validator.evaluate_merged_state(
-                            rule, merged
-                        )
-                        for v in cr_violations:
-                            vdict = v.to_dict()
-                            business_violations.append(vdict)
-                            issue = {
-                                'severity': v.severity,
-                                'category': 'business_rule',
-                                'message': v.message,
-                                'row': v.row_number,
-                                'field': v.field,
-                                'rule_id': v.rule_id,
-                                'rule_name': v.rule_name,
-                            }
-                            if v.severity == 'error':
-                                errors.append(issue)
-                            elif v.severity == 'warning':
-                                warnings.append(issue)
-                            else:
-                                info.append(issue)
+                    # Automatic GC is paused for this loop (see above): every
+                    # 10 chunks, collect only if memory has grown past the
+                    # watermark, then re-arm it above the post-collection level.
+                    if chunk_num % 10 == 0 and self.memory_monitor.collect_if_above(gc_watermark_mb):
+                        gc_watermark_mb = self.memory_monitor.get_current_memory_mb() + _GC_HEADROOM_MB
+
+                    if _at_error_limit():
+                        error_limit_reached = True
+                        break
+                chunks.close()
+                gc_paused = False
+                _resume_gc()
+
+            # Cross-row rules: merge partial states and evaluate (reduce step).
+            if self.rule_engine is not None:
+                for rule_id, data in _cross_row_partial_states.items():
+                    rule = data['rule']
+                    merged = _cross_row_validator.merge_partial_states(
+                        rule, data['states']
+                    )
+                    _record_violations(
+                        v.to_dict()
+                        for v in _cross_row_validator.evaluate_merged_state(rule, merged)
+                    )
 
             if progress:
                 progress.finish()
+
+            total_nulls, total_empty_strings = _fold_column_counts(column_totals)
             
-            required_fields = {
+            required_fields = frozenset(
                 f.get('name') for f in (self.strict_fields or [])
                 if isinstance(f, dict) and f.get('name') and f.get('required')
-            }
+            )
 
             # Fail-safe: ensure required empty/null fields are represented as errors.
             if self.strict_fixed_width and self.strict_level in {'format', 'all'}:
@@ -511,23 +1333,38 @@ class ChunkedFileValidator:
                         })
 
             # Generate warnings for nulls and empty strings (exclude required fields in strict mode,
-            # because they are already promoted to errors above).
-            for col, count in total_nulls.items():
-                if count > 0 and not (self.strict_fixed_width and col in required_fields):
-                    pct = (count / total_rows) * 100
-                    warnings.append(
-                        f"Column '{col}' has {count:,} null values ({pct:.1f}%)"
-                    )
-
-            for col, count in total_empty_strings.items():
-                if count > 0 and not (self.strict_fixed_width and col in required_fields):
-                    pct = (count / total_rows) * 100
-                    warnings.append(
-                        f"Column '{col}' has {count:,} empty strings ({pct:.1f}%)"
-                    )
+            # because they are already promoted to errors above).  Folded counts are all non-zero.
+            skip_columns = required_fields if self.strict_fixed_width else frozenset()
+            warnings.extend(
+                f"Column '{col}' has {count:,} {label} ({count / total_rows * 100:.1f}%)"
+                for label, counts in (('null values', total_nulls), ('empty strings', total_empty_strings))
+                for col, count in counts.items()
+                if col not in skip_columns
+            )
             
+            warnings.extend(
+                f"Business rules raised {count:,} {severity} issues; only the first "
+                f"{_VIOLATION_SAMPLE_SIZE:,} are listed (all violations: {self.violations_jsonl_path})"
+                for severity, count in streamed_issue_counts.items()
+                if count > _VIOLATION_SAMPLE_SIZE
+            )
+
+            # Cut only now: cross-row violations and the required-field
+            # fail-safe above also count towards max_errors.
+            if self.max_errors is not None and len(errors) > self.max_errors:
+                del errors[self.max_errors:]
+                error_limit_reached = True
+
+            if error_limit_reached:
+                warnings.append(
+                    f"Stopped after {len(errors):,} errors (max_errors={self.max_errors:,}); "
+                    f"only the first {total_rows:,} rows were validated"
+                )
+
             if duplicate_count > 0:
                 warnings.append(
+                    f"Found {duplicate_count:,} duplicate rows"
+                    if duplicate_check_unbounded else
                     f"Found {duplicate_count:,} duplicate rows "
                     f"(limited to first {max_seen_rows:,} rows checked)"
                 )
@@ -544,7 +1381,7 @@ class ChunkedFileValidator:
             business_stats = {
                 'total_rules': len(self.rule_engine.rules) if self.rule_engine else 0,
                 'enabled_rules': len(self.rule_engine.enabled_rules) if self.rule_engine else 0,
-                'total_violations': len(business_violations),
+                'total_violations': violation_count,
             }
 
             return {
@@ -554,11 +1391,14 @@ class ChunkedFileValidator:
                 'info': info,
                 'file_path': self.file_path,
                 'total_rows': total_rows,
+                'actual_columns': actual_columns,
                 'statistics': {
                     'null_counts': total_nulls,
                     'empty_string_counts': total_empty_strings,
                     'duplicate_count': duplicate_count,
-                    'duplicate_check_limited': (False if parallel_enabled else len(seen_rows) >= max_seen_rows),
+                    'duplicate_check_limited': len(seen_rows) >= max_seen_rows,
+                    'duplicates_within_chunk': within_chunk_duplicates if parallel_enabled else None,
+                    'error_limit_reached': error_limit_reached,
                     'parallel': parallel_enabled,
                     'workers': self.workers,
                     'elapsed_seconds': round(elapsed, 6),
@@ -568,6 +1408,7 @@ class ChunkedFileValidator:
                 'business_rules': {
                     'enabled': self.rule_engine is not None,
                     'violations': business_violations,
+                    'violations_jsonl': self.violations_jsonl_path,
                     'statistics': business_stats,
                 }
             }
@@ -580,82 +1421,47 @@ class ChunkedFileValidator:
                 'warnings': warnings,
                 'file_path': self.file_path
             }
+        finally:
+            if violations_out is not None:
+                violations_out.close()
+            if gc_paused:
+                _resume_gc()
     
     def _scan_fixed_width_row_lengths(self, max_issue_details: int = 200) -> tuple[int, list[dict], int]:
         """Scan file line lengths and return mismatch diagnostics.
 
+        See :func:`src.utils.file_scan.scan_line_lengths`.
+
         Returns:
             (mismatch_count, sampled_issue_dicts, total_rows_scanned)
         """
         if not self.expected_row_length:
             return 0, [], 0
+        mismatch_count, sampled, total_rows = scan_line_lengths(
+            self.file_path, self.expected_row_length, max_issue_details,
+        )
+        return mismatch_count, [self._row_length_issue(*m) for m in sampled], total_rows
 
-        mismatch_count = 0
-        sampled: list[dict] = []
-        total_rows = 0
-
-        with open(self.file_path, 'r', encoding='utf-8', errors='replace') as fh:
-            for row_num, line in enumerate(fh, start=1):
-                total_rows = row_num
-                actual_len = len(line.rstrip('\r\n'))
-                if actual_len != self.expected_row_length:
-                    mismatch_count += 1
-                    if len(sampled) < max_issue_details:
-                        sampled.append({
-                            'severity': 'error',
-                            'category': 'format',
-                            'code': 'FW_LEN_001',
-                            'message': (
-                                f"Row {row_num} length mismatch: expected {self.expected_row_length}, got {actual_len}"
-                            ),
-                            'row': row_num,
-                            'field': None,
-                        })
-
-        return mismatch_count, sampled, total_rows
-
-    def _is_value_valid_for_format(self, value: str, fmt: str) -> bool:
-        import re
-
-        v = str(value).strip()
-        fmt = str(fmt or '').upper()
-        if not fmt:
-            return True
-        if fmt == 'XXX':
-            return bool(re.fullmatch(r'[A-Za-z]{3}', v))
-        if fmt == 'CCYYMMDD':
-            return bool(re.fullmatch(r'\d{8}', v))
-
-        m_s9 = re.fullmatch(r'S9\((\d+)\)', fmt)
-        if m_s9:
-            n = int(m_s9.group(1))
-            return bool(re.fullmatch(rf'[+-]?\d{{{n}}}', v))
-
-        m_9 = re.fullmatch(r'9\((\d+)\)', fmt)
-        if m_9:
-            n = int(m_9.group(1))
-            return bool(re.fullmatch(rf'\d{{{n}}}', v))
-
-        m_dec = re.fullmatch(r'([+S])?9\((\d+)\)V9\((\d+)\)', fmt)
-        if m_dec:
-            sign_kind = m_dec.group(1)
-            n = int(m_dec.group(2))
-            m = int(m_dec.group(3))
-            if sign_kind == '+':
-                return bool(re.fullmatch(rf'[+-]\d{{{n+m}}}', v))
-            if sign_kind == 'S':
-                return bool(re.fullmatch(rf'[+-]?\d{{{n+m}}}', v))
-            return bool(re.fullmatch(rf'\d{{{n+m}}}', v))
-        return True
+    def _row_length_issue(self, row_num: int, actual_len: int) -> dict:
+        return {
+            'severity': 'error',
+            'category': 'format',
+            'code': 'FW_LEN_001',
+            'message': (
+                f"Row {row_num} length mismatch: expected {self.expected_row_length}, got {actual_len}"
+            ),
+            'row': row_num,
+            'field': None,
+        }
 
     def _validate_chunk(self, chunk: pd.DataFrame, chunk_num: int,
-                       seen_rows: set, max_seen_rows: int) -> tuple:
+                       seen_rows: _RowHashSet, max_seen_rows: int) -> tuple:
         """Validate a single chunk.
         
         Args:
             chunk: DataFrame chunk
             chunk_num: Chunk number
-            seen_rows: Set of seen row hashes for duplicate detection
+            seen_rows: Row-hash set used for duplicate detection
             max_seen_rows: Maximum rows to track for duplicates
             
         Returns:
@@ -665,8 +1471,8 @@ class ChunkedFileValidator:
         warnings = []
         stats = {
             'duplicates': 0,
-            'nulls': {},
-            'empty_strings': {}
+            'columns': tuple(chunk.columns),
+            'column_counts': np.zeros((2, len(chunk.columns)), dtype=np.int64),
         }
         
         # Check for empty chunk
@@ -676,106 +1482,20 @@ class ChunkedFileValidator:
         
         # Check for duplicate rows (memory-limited)
         if len(seen_rows) < max_seen_rows:
-            for idx, row in chunk.iterrows():
-                row_hash = hash(tuple(row.values))
-                if row_hash in seen_rows:
-                    stats['duplicates'] += 1
-                else:
-                    seen_rows.add(row_hash)
+            stats['duplicates'] += seen_rows.add_chunk(chunk)
         
-        # Check for null values
-        null_counts = chunk.isnull().sum()
-        for col, count in null_counts.items():
-            if count > 0:
-                stats['nulls'][col] = int(count)
-        
-        # Check for empty/whitespace strings
-        for col in chunk.columns:
-            if chunk[col].dtype == 'object':
-                series = chunk[col]
-                empty_mask = series.notna() & (series.astype(str).str.strip() == '')
-                empty_count = int(empty_mask.sum())
-                if empty_count > 0:
-                    stats['empty_strings'][col] = empty_count
-
-        # Single-pass row loop: data-type checks and strict fixed-width checks combined.
-        if self.strict_fields:
-            row_base = (chunk_num - 1) * self.chunk_size
-            for local_idx, row in chunk.reset_index(drop=True).iterrows():
-                row_num = row_base + local_idx + 1
-                # --- data-type checks ---
-                for field in self.strict_fields:
-                    name = field.get('name')
-                    dtype = str(field.get('data_type') or '').lower()
-                    if not dtype or dtype == 'string' or name not in chunk.columns:
-                        continue
-                    value = '' if pd.isna(row.get(name)) else str(row.get(name)).strip()
-                    if not value:
-                        continue
-                    if dtype in {'integer', 'int'} and not _is_integer(value):
-                        errors.append({
-                            'severity': 'error',
-                            'category': 'data_type',
-                            'code': 'DT_INT_001',
-                            'message': (
-                                f"Field '{name}' expects integer but got '{value}'"
-                            ),
-                            'row': row_num,
-                            'field': name,
-                        })
-                    elif dtype in {'float', 'decimal', 'number'} and not _is_float(value):
-                        errors.append({
-                            'severity': 'error',
-                            'category': 'data_type',
-                            'code': 'DT_FLT_001',
-                            'message': (
-                                f"Field '{name}' expects float but got '{value}'"
-                            ),
-                            'row': row_num,
-                            'field': name,
-                        })
-                # --- strict fixed-width checks ---
-                if self.strict_fixed_width and self.strict_level in {'format', 'all'}:
-                    for field in self.strict_fields:
-                        name = field.get('name')
-                        if name not in chunk.columns:
-                            continue
-                        value = '' if pd.isna(row.get(name)) else str(row.get(name)).strip()
-
-                        if field.get('required') and value == '':
-                            errors.append({
-                                'severity': 'error',
-                                'category': 'strict_fixed_width',
-                                'code': 'FW_REQ_001',
-                                'message': f"Required field '{name}' is empty",
-                                'row': row_num,
-                                'field': name,
-                            })
-                            continue
+        # Null and empty/whitespace string counts
+        stats['column_counts'], stripped = _scan_columns(
+            chunk, _strict_column_names(self._strict_plan),
+        )
 
-                        if value and field.get('valid_values'):
-                            allowed = {str(v).strip() for v in (field.get('valid_values') or [])}
-                            if value not in allowed:
-                                errors.append({
-                                    'severity': 'error',
-                                    'category': 'strict_fixed_width',
-                                    'code': 'FW_VAL_001',
-                                    'message': f"Field '{name}' has invalid value '{value}'",
-                                    'row': row_num,
-                                    'field': name,
-                                })
-                                continue
-
-                        fmt = str(field.get('format') or '').upper()
-                        if value and fmt and not self._is_value_valid_for_format(value, fmt):
-                            errors.append({
-                                'severity': 'error',
-                                'category': 'strict_fixed_width',
-                                'code': 'FW_FMT_001',
-                                'message': f"Field '{name}' has invalid format for value '{value}'",
-                                'row': row_num,
-                                'field': name,
-                            })
+        # Column-wise data-type and strict fixed-width checks.
+        if self._strict_plan:
+            errors.extend(_strict_field_errors(
+                chunk, (chunk_num - 1) * self.chunk_size, self._strict_plan,
+                self.strict_fixed_width and self.strict_level in {'format', 'all'},
+                stripped,
+            ))
 
         return errors, warnings, stats
     
@@ -793,38 +1513,64 @@ class ChunkedFileValidator:
             Validation results dictionary
         """
         required_columns = required_columns or expected_columns
-        
-        # First validate basic structure
+        expected_set = set(expected_columns)
+        required_set = set(required_columns)
+
+        # Read the header first: a file missing required columns fails
+        # without paying for the full validation pass.  Headerless files
+        # get their names from the mapping inside validate(), so they are
+        # only checked afterwards.
+        header_columns: Optional[set] = None
+        if self.has_header:
+            parser = self.parser or ChunkedFileParser(
+                self.file_path, self.delimiter, self.chunk_size,
+                has_header=self.has_header, engine=self.engine,
+            )
+            try:
+                header_columns = set(parser.parse_sample(n_rows=1).columns)
+            except ValueError:
+                header_columns = None  # unreadable/empty; validate() reports it
+            if header_columns is not None and required_set - header_columns:
+                errors, warnings, missing_required, unexpected = self._schema_issues(
+                    header_columns, expected_set, required_set, [], [],
+                )
+                warnings.append("Data validation skipped because required columns are missing")
+                return {
+                    'valid': False,
+                    'errors': errors,
+                    'warnings': warnings,
+                    'info': [],
+                    'file_path': self.file_path,
+                    'total_rows': 0,
+                    'expected_columns': expected_columns,
+                    'actual_columns': list(header_columns),
+                    'missing_required': list(missing_required),
+                    'unexpected': list(unexpected),
+                    'statistics': {},
+                    'business_rules': {'enabled': self.rule_engine is not None, 'violations': [], 'statistics': {}},
+                }
+
         basic_result = self.validate(show_progress=show_progress)
 
-        errors = list(basic_result.get('errors', []))
-        warnings = list(basic_result.get('warnings', []))
-        
-        # Get actual columns from first chunk
-        parser = self.parser or ChunkedFileParser(
-            self.file_path, self.delimiter, self.chunk_size,
-            has_header=self.has_header,
+        # validate() reports the columns of the first chunk it read; fall
+        # back to the header when it produced no chunks.
+        if basic_result.get('actual_columns') is not None:
+            actual_columns = set(basic_result['actual_columns'])
+        elif header_columns is not None:
+            actual_columns = header_columns
+        else:
+            parser = self.parser or ChunkedFileParser(
+                self.file_path, self.delimiter, self.chunk_size,
+                has_header=self.has_header, engine=self.engine,
+            )
+            actual_columns = set(parser.parse_sample(n_rows=10).columns)
+
+        # basic_result is ours alone, so its lists are extended in place
+        # rather than copied.
+        errors, warnings, missing_required, unexpected = self._schema_issues(
+            actual_columns, expected_set, required_set,
+            basic_result.get('errors', []), basic_result.get('warnings', []),
         )
-        first_chunk = parser.parse_sample(n_rows=10)
-        actual_columns = set(first_chunk.columns)
-        
-        # Check required columns
-        expected_set = set(expected_columns)
-        required_set = set(required_columns)
-        
-        missing_required = required_set - actual_columns
-        if missing_required:
-            errors.append(f"Missing required columns: {sorted(missing_required)}")
-        
-        # Check for unexpected columns
-        unexpected = actual_columns - expected_set
-        if unexpected:
-            warnings.append(f"Unexpected columns: {sorted(unexpected)}")
-        
-        # Check for missing optional columns
-        missing_optional = expected_set - required_set - actual_columns
-        if missing_optional:
-            warnings.append(f"Missing optional columns: {sorted(missing_optional)}")
         
         return {
             'valid': len(errors) == 0,
@@ -840,3 +1586,24 @@ class ChunkedFileValidator:
             'statistics': basic_result.get('statistics', {}),
             'business_rules': basic_result.get('business_rules', {'enabled': False, 'violations': [], 'statistics': {}}),
         }
+
+    @staticmethod
+    def _schema_issues(actual_columns: set, expected_set: set, required_set: set,
+                       errors: list, warnings: list) -> tuple:
+        """Append column-schema errors and warnings to *errors* / *warnings*.
+
+        Returns:
+            (errors, warnings, missing_required, unexpected)
+        """
+        missing_required = required_set - actual_columns
+        if missing_required:
+            errors.append(f"Missing required columns: {sorted(missing_required)}")
+
+        unexpected = actual_columns - expected_set
+        if unexpected:
+            warnings.append(f"Unexpected columns: {sorted(unexpected)}")
+
+        missing_optional = expected_set - required_set - actual_columns
+        if missing_optional:
+            warnings.append(f"Missing optional columns: {sorted(missing_optional)}")
+        return errors, warnings, missing_required, unexpected
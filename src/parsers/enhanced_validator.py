@@ -1,11 +1,80 @@
 """Enhanced file validation with data profiling and quality metrics."""
 
 import os
+import re
+import warnings
 from typing import List, Dict, Any, Optional
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from .base_parser import BaseParser
+from ..utils.file_scan import scan_line_lengths
+
+
+# Values sampled per column before any full-column type coercion.
+_INFER_SAMPLE_SIZE = 200
+_DATE_FIELD_NAME_RE = re.compile(r'date|time|dt|timestamp', re.IGNORECASE)
+_YYYYMMDD_RE = re.compile(r'^\d{8}$')
+
+_MONTH = r'(?:0?[1-9]|1[0-2])'
+_DAY = r'(?:0?[1-9]|[12]\d|3[01])'
+# Display name and full-match pattern for each date format reported by
+# ``_detect_date_formats``; ambiguous values (e.g. 01/02/2024) match both
+# the month-first and day-first forms, as strptime accepts both.
+_DATE_FORMAT_PATTERNS = [
+    ('YYYY-MM-DD', re.compile(rf'\d{{4}}-{_MONTH}-{_DAY}')),
+    ('MM/DD/YYYY', re.compile(rf'{_MONTH}/{_DAY}/\d{{4}}')),
+    ('DD/MM/YYYY', re.compile(rf'{_DAY}/{_MONTH}/\d{{4}}')),
+    ('YYYYMMDD', re.compile(r'\d{4}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])')),
+    ('MM-DD-YYYY', re.compile(rf'{_MONTH}-{_DAY}-\d{{4}}')),
+    ('DD-MM-YYYY', re.compile(rf'{_DAY}-{_MONTH}-\d{{4}}')),
+    ('YYYY/MM/DD', re.compile(rf'\d{{4}}/{_MONTH}/{_DAY}')),
+]
+
+
+def _coerces(convert, values: pd.Series) -> bool:
+    """Return True when *convert* (``pd.to_numeric``/``pd.to_datetime``)
+    accepts every value without raising."""
+    try:
+        convert(values)
+    except (ValueError, TypeError, OverflowError):
+        return False
+    return True
+
+
+def _arrow_length_stats(values: np.ndarray) -> Optional[tuple]:
+    """Return ``(min, max, mean)`` character lengths of non-null *values*.
+
+    Uses Arrow's ``utf8_length`` kernel over the UTF-8 buffer instead of the
+    pandas ``.str`` accessor.  Returns None when pyarrow is not installed or
+    the values are not all strings; callers then fall back to
+    ``astype(str).str.len()``.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+    try:
+        arr = pa.array(values, type=pa.string())
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    lengths = pc.utf8_length(arr)
+    bounds = pc.min_max(lengths)
+    return bounds['min'].as_py(), bounds['max'].as_py(), pc.mean(lengths).as_py()
+
+
+def _row_duplicate_counts(df: pd.DataFrame) -> np.ndarray:
+    """Return how many times each distinct row of *df* occurs.
+
+    Rows are hashed to ``uint64`` in C (values only, index ignored) and
+    counted with one sort, instead of ``drop_duplicates`` plus a groupby
+    over every column.  Like ``drop_duplicates``, nulls compare equal.
+    """
+    if df.shape[1] == 0:
+        return np.ones(len(df), dtype=np.int64)
+    hashes = pd.util.hash_pandas_object(df, index=False, categorize=False).to_numpy()
+    return np.unique(hashes, return_counts=True)[1]
 
 
 class EnhancedFileValidator:
@@ -68,18 +137,28 @@ class EnhancedFileValidator:
         # Parse and analyze data
         try:
             df = self.parser.parse()
+
+            # Null and duplicate-row scans shared by the quality metrics and
+            # the duplicate analysis.
+            null_cells = int(df.isnull().to_numpy().sum())
+            row_counts = _row_duplicate_counts(df)
             
             # Data quality metrics
-            quality_metrics = self._calculate_quality_metrics(df)
+            quality_metrics = self._calculate_quality_metrics(df, null_cells, row_counts)
+            
+            # Column types, inferred once for the field and date analyses
+            inferred_types = (
+                {col: self._infer_data_type(df[col]) for col in df.columns} if detailed else {}
+            )
             
             # Field-level analysis
-            field_analysis = self._analyze_fields(df) if detailed else {}
+            field_analysis = self._analyze_fields(df, inferred_types) if detailed else {}
             
             # Duplicate analysis
-            duplicate_analysis = self._analyze_duplicates(df)
+            duplicate_analysis = self._analyze_duplicates(df, row_counts)
             
             # Date field analysis
-            date_analysis = self._analyze_date_fields(df) if detailed else {}
+            date_analysis = self._analyze_date_fields(df, inferred_types) if detailed else {}
             
             # Schema validation (if mapping provided)
             if self.mapping_config:
@@ -241,23 +320,22 @@ class EnhancedFileValidator:
             return
 
         expected_len = max(end for _, _, end in specs)
-        mismatch_count = 0
 
         try:
-            with open(self.parser.file_path, 'r', encoding='utf-8', errors='replace') as fh:
-                for row_num, line in enumerate(fh, start=1):
-                    actual_len = len(line.rstrip('\r\n'))
-                    if actual_len != expected_len:
-                        mismatch_count += 1
-                        if mismatch_count <= max_issue_details:
-                            self.errors.append({
-                                'severity': 'error',
-                                'category': 'format',
-                                'code': 'FW_LEN_001',
-                                'message': f"Row {row_num} length mismatch: expected {expected_len}, got {actual_len}",
-                                'row': row_num,
-                                'field': None,
-                            })
+            # Vectorized bytes scan shared with the chunked validator; only
+            # mismatching rows come back to Python.
+            mismatch_count, mismatches, _ = scan_line_lengths(
+                self.parser.file_path, expected_len, max_issue_details,
+            )
+            for row_num, actual_len in mismatches:
+                self.errors.append({
+                    'severity': 'error',
+                    'category': 'format',
+                    'code': 'FW_LEN_001',
+                    'message': f"Row {row_num} length mismatch: expected {expected_len}, got {actual_len}",
+                    'row': row_num,
+                    'field': None,
+                })
 
             if mismatch_count > max_issue_details:
                 self.warnings.append({
@@ -281,10 +359,16 @@ class EnhancedFileValidator:
                 'field': None,
             })
 
-    def _calculate_quality_metrics(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Calculate overall data quality metrics."""
+    def _calculate_quality_metrics(self, df: pd.DataFrame, null_cells: Optional[int] = None,
+                                   row_counts: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Calculate overall data quality metrics.
+
+        *null_cells* and *row_counts* (see :func:`_row_duplicate_counts`)
+        may be passed in when the caller has already computed them.
+        """
         total_cells = df.shape[0] * df.shape[1]
-        null_cells = df.isnull().sum().sum()
+        if null_cells is None:
+            null_cells = int(df.isnull().to_numpy().sum())
         filled_cells = total_cells - null_cells
         
         # Completeness
@@ -292,7 +376,9 @@ class EnhancedFileValidator:
         
         # Uniqueness
         total_rows = len(df)
-        unique_rows = len(df.drop_duplicates())
+        if row_counts is None:
+            row_counts = _row_duplicate_counts(df)
+        unique_rows = len(row_counts)
         uniqueness = (unique_rows / total_rows * 100) if total_rows > 0 else 0
         
         # Overall quality score (weighted average)
@@ -311,16 +397,25 @@ class EnhancedFileValidator:
             'quality_score': round(quality_score, 2)
         }
 
-    def _analyze_fields(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
-        """Perform field-level analysis."""
+    def _analyze_fields(self, df: pd.DataFrame,
+                        inferred_types: Optional[Dict[Any, str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Perform field-level analysis.
+
+        Args:
+            df: Parsed data.
+            inferred_types: Optional per-column types from
+                ``_infer_data_type``; missing columns are inferred here.
+        """
         field_analysis = {}
+        inferred_types = inferred_types or {}
         
         for col in df.columns:
-            field_analysis[col] = self._analyze_field(df[col], col)
+            field_analysis[col] = self._analyze_field(df[col], col, inferred_types.get(col))
         
         return field_analysis
 
-    def _analyze_field(self, series: pd.Series, field_name: str) -> Dict[str, Any]:
+    def _analyze_field(self, series: pd.Series, field_name: str,
+                       inferred_type: Optional[str] = None) -> Dict[str, Any]:
         """Analyze a single field."""
         total = len(series)
         null_count = series.isnull().sum()
@@ -329,7 +424,8 @@ class EnhancedFileValidator:
         
         # Infer data type
         dtype = str(series.dtype)
-        inferred_type = self._infer_data_type(series)
+        if inferred_type is None:
+            inferred_type = self._infer_data_type(series)
         
         # Unique values
         unique_count = series.nunique()
@@ -361,68 +457,63 @@ class EnhancedFileValidator:
         return analysis
 
     def _infer_data_type(self, series: pd.Series) -> str:
-        """Infer the actual data type of a field."""
-        import re
-        
+        """Infer the actual data type of a field.
+
+        Every pandas coercion runs on the first ``_INFER_SAMPLE_SIZE`` values
+        first; the strict numeric/datetime checks only touch the full column
+        once the sample has passed, so columns that are plainly text never
+        pay for a full-column coerce.  Columns that already carry a datetime
+        or numeric dtype are typed from the dtype alone.
+        """
         non_null = series.dropna()
         
         if len(non_null) == 0:
             return 'empty'
         
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return 'datetime'
+        
         # Check if field name suggests it's a date
         field_name = series.name if hasattr(series, 'name') else ''
-        is_date_field = bool(re.search(r'date|time|dt|timestamp', str(field_name), re.IGNORECASE))
+        is_date_field = bool(_DATE_FIELD_NAME_RE.search(str(field_name)))
         
-        # For potential date fields, try datetime first
-        if is_date_field:
-            # Check for YYYYMMDD pattern (8-digit dates) first
-            # Sample first 100 values to check pattern
-            sample = non_null.head(100).astype(str).str.strip()
-            yyyymmdd_pattern = r'^\d{8}$'
-            yyyymmdd_matches = sample.str.match(yyyymmdd_pattern).sum()
+        # Numeric dtypes under a date-like name may still hold YYYYMMDD values
+        is_numeric = pd.api.types.is_numeric_dtype(series)
+        if is_numeric and not is_date_field:
+            return 'numeric'
+        sample = non_null.head(_INFER_SAMPLE_SIZE)
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
             
-            if yyyymmdd_matches / len(sample) >= 0.8:  # 80% match YYYYMMDD pattern
-                # Try to parse as dates
+            # For potential date fields, try datetime first
+            if is_date_field:
+                # 8-digit values are checked with a precompiled regex before
+                # parsing as YYYYMMDD
+                texts = [str(v).strip() for v in sample.to_numpy()]
+                yyyymmdd = [t for t in texts if _YYYYMMDD_RE.match(t)]
+                threshold = 0.8 * len(texts)
+                if len(yyyymmdd) >= threshold:
+                    parsed = pd.to_datetime(pd.Series(yyyymmdd), format='%Y%m%d', errors='coerce')
+                    if parsed.notna().sum() >= threshold:
+                        return 'datetime'
+                
+                # General datetime parsing for date fields, on the sample only
                 try:
-                    import warnings
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore")
-                        parsed = pd.to_datetime(sample, format='%Y%m%d', errors='coerce')
-                        valid_dates = parsed.notna().sum()
-                        if valid_dates / len(sample) >= 0.8:
-                            return 'datetime'
-                except:
+                    parsed = pd.to_datetime(sample, errors='coerce')
+                    if parsed.notna().sum() / len(sample) * 100 >= 50:
+                        return 'datetime'
+                except (ValueError, TypeError, OverflowError):
                     pass
             
-            # Try general datetime parsing for date fields
-            try:
-                import warnings
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    parsed = pd.to_datetime(non_null, errors='coerce')
-                    valid_pct = parsed.notna().sum() / len(non_null) * 100
-                    if valid_pct >= 50:
-                        return 'datetime'
-            except:
-                pass
-        
-        # Try numeric (but only if not a date pattern)
-        try:
-            pd.to_numeric(non_null)
-            return 'numeric'
-        except:
-            pass
-        
-        # Try datetime for non-date-named fields
-        if not is_date_field:
-            try:
-                import warnings
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    pd.to_datetime(non_null)
-                    return 'datetime'
-            except:
-                pass
+            # Try numeric (but only if not a date pattern)
+            if is_numeric or (_coerces(pd.to_numeric, sample) and _coerces(pd.to_numeric, non_null)):
+                return 'numeric'
+            
+            # Try datetime for non-date-named fields
+            if (not is_date_field and _coerces(pd.to_datetime, sample)
+                    and _coerces(pd.to_datetime, non_null)):
+                return 'datetime'
         
         return 'string'
 
@@ -443,12 +534,21 @@ class EnhancedFileValidator:
 
     def _analyze_string_field(self, series: pd.Series) -> Dict[str, Any]:
         """Analyze string field."""
-        string_series = series.dropna().astype(str)
+        non_null = series.dropna()
         
-        if len(string_series) == 0:
+        if len(non_null) == 0:
             return {}
         
-        lengths = string_series.str.len()
+        arrow_stats = _arrow_length_stats(non_null.to_numpy())
+        if arrow_stats is not None:
+            min_length, max_length, avg_length = arrow_stats
+            return {
+                'min_length': min_length,
+                'max_length': max_length,
+                'avg_length': round(avg_length, 2)
+            }
+        
+        lengths = non_null.astype(str).str.len()
         
         return {
             'min_length': int(lengths.min()),
@@ -456,19 +556,20 @@ class EnhancedFileValidator:
             'avg_length': round(float(lengths.mean()), 2)
         }
 
-    def _analyze_duplicates(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze duplicate rows."""
+    def _analyze_duplicates(self, df: pd.DataFrame,
+                            row_counts: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Analyze duplicate rows.
+
+        *row_counts* (see :func:`_row_duplicate_counts`) may be passed in
+        when the caller has already computed it.
+        """
         total_rows = len(df)
-        unique_rows = len(df.drop_duplicates())
+        counts = _row_duplicate_counts(df) if row_counts is None else row_counts
+        unique_rows = len(counts)
         duplicate_rows = total_rows - unique_rows
         
-        # Find most duplicated rows
-        if duplicate_rows > 0:
-            dup_counts = df.groupby(list(df.columns)).size().reset_index(name='count')
-            dup_counts = dup_counts[dup_counts['count'] > 1].sort_values('count', ascending=False)
-            top_duplicates = dup_counts.head(10)['count'].tolist()
-        else:
-            top_duplicates = []
+        # Occurrence counts of the most duplicated rows
+        top_duplicates = np.sort(counts[counts > 1])[::-1][:10].tolist()
         
         return {
             'total_rows': total_rows,
@@ -625,13 +726,24 @@ class EnhancedFileValidator:
             'columns': list(df.columns)
         }
 
-    def _analyze_date_fields(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze date/datetime fields comprehensively."""
-        import warnings
-        
+    def _analyze_date_fields(self, df: pd.DataFrame,
+                             inferred_types: Optional[Dict[Any, str]] = None) -> Dict[str, Any]:
+        """Analyze date/datetime fields comprehensively.
+
+        Only columns whose inferred type is ``'datetime'`` are parsed;
+        *inferred_types* reuses the types already computed for the field
+        analysis.
+        """
         date_analysis = {}
+        inferred_types = inferred_types or {}
         
         for col in df.columns:
+            inferred_type = inferred_types.get(col)
+            if inferred_type is None:
+                inferred_type = self._infer_data_type(df[col])
+            if inferred_type != 'datetime':
+                continue
+            
             # Try to parse as datetime
             try:
                 with warnings.catch_warnings():
@@ -729,35 +841,23 @@ class EnhancedFileValidator:
         return None
 
     def _detect_date_formats(self, series: pd.Series) -> List[str]:
-        """Detect common date formats in the series."""
-        import warnings
-        
-        formats = []
+        """Detect common date formats in the series.
+
+        Sampled values are classified against ``_DATE_FORMAT_PATTERNS``
+        (one regex per format, month/day ranges included) instead of being
+        parsed once per candidate format.
+        """
         sample = series.dropna().head(100)
         
         if len(sample) == 0:
-            return formats
+            return []
         
-        common_formats = [
-            ('%Y-%m-%d', 'YYYY-MM-DD'),
-            ('%m/%d/%Y', 'MM/DD/YYYY'),
-            ('%d/%m/%Y', 'DD/MM/YYYY'),
-            ('%Y%m%d', 'YYYYMMDD'),
-            ('%m-%d-%Y', 'MM-DD-YYYY'),
-            ('%d-%m-%Y', 'DD-MM-YYYY'),
-            ('%Y/%m/%d', 'YYYY/MM/DD'),
+        values = sample.astype(str)
+        formats = [
+            fmt_name for fmt_name, pattern in _DATE_FORMAT_PATTERNS
+            if values.str.fullmatch(pattern).mean() > 0.8
         ]
         
-        for fmt_code, fmt_name in common_formats:
-            try:
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    parsed = pd.to_datetime(sample, format=fmt_code, errors='coerce')
-                    if parsed.notna().sum() / len(sample) > 0.8:
-                        formats.append(fmt_name)
-            except:
-                continue
-        
         return formats if formats else ['Mixed/Unknown']
 
     def _build_appendix_data(self, df: pd.DataFrame, detailed: bool) -> Dict[str, Any]:
@@ -0,0 +1,129 @@
+"""Streaming raw-file scans shared by the parsers and validators."""
+
+import mmap
+import os
+from typing import Optional
+
+import numpy as np
+
+_SCAN_BLOCK_SIZE = 1 << 20
+
+
+def advise_sequential(f, mm: Optional[mmap.mmap] = None) -> None:
+    """Tell the kernel *f* (or its mapping *mm*) is read front to back.
+
+    Linux then doubles the readahead window and drops pages behind the
+    reader sooner, which helps cold-cache scans.  A no-op on platforms
+    without ``posix_fadvise`` / ``madvise``; the hint never affects results.
+    """
+    try:
+        if mm is not None:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+        elif hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+def _line_char_lengths(arr: np.ndarray, newlines: np.ndarray) -> Optional[np.ndarray]:
+    """Return the character length of each ``\\n``-terminated line in *arr*.
+
+    *arr* is a uint8 view ending in a newline and *newlines* the positions
+    of every ``\\n`` in it.  Lengths exclude the line terminator, counting a
+    ``\\r\\n`` pair as one terminator, and match ``len(line.rstrip('\\r\\n'))``
+    on the UTF-8 (``errors='replace'``) decoded text.  Returns None when a bare
+    ``\\r`` is present, since text mode would treat it as a line break.
+    """
+    starts = np.empty_like(newlines)
+    starts[0] = 0
+    starts[1:] = newlines[:-1] + 1
+    lengths = newlines - starts
+
+    cr_pos = np.flatnonzero(arr == 0x0D)
+    if cr_pos.size:
+        if (arr[cr_pos + 1] != 0x0A).any():
+            return None
+        lengths[np.searchsorted(newlines, cr_pos + 1)] -= 1
+
+    high = arr >= 0x80
+    if high.any():
+        cum = np.concatenate(([0], np.cumsum(high)))
+        for i in np.flatnonzero(cum[newlines] > cum[starts]).tolist():
+            line = arr[starts[i]:newlines[i]].tobytes().decode('utf-8', errors='replace')
+            lengths[i] = len(line.rstrip('\r'))
+    return lengths
+
+
+def scan_line_lengths(path: str, expected: int,
+                      max_issue_details: int = 200) -> tuple[int, list[tuple[int, int]], int]:
+    """Count lines of *path* whose length differs from *expected*.
+
+    Reads the file as raw bytes in large blocks and measures lines from
+    newline positions with NumPy; only lines containing non-ASCII bytes
+    are decoded to count characters.  Lengths match text-mode
+    ``len(line.rstrip('\\r\\n'))`` on UTF-8 (``errors='replace'``) text; files
+    with bare ``\\r`` line breaks fall back to :func:`scan_line_lengths_text`.
+
+    Returns:
+        (mismatch_count, first *max_issue_details* ``(row_num, length)``
+        mismatches, total_rows_scanned)
+    """
+    mismatch_count = 0
+    sampled: list[tuple[int, int]] = []
+    total_rows = 0
+
+    def _record(lengths: np.ndarray) -> None:
+        nonlocal mismatch_count, total_rows
+        bad = np.flatnonzero(lengths != expected)
+        mismatch_count += len(bad)
+        for i in bad[:max(max_issue_details - len(sampled), 0)].tolist():
+            sampled.append((total_rows + i + 1, int(lengths[i])))
+        total_rows += len(lengths)
+
+    with open(path, 'rb', buffering=0) as fh:
+        advise_sequential(fh)
+        carry = b''
+        while True:
+            block = fh.read(_SCAN_BLOCK_SIZE)
+            if not block:
+                break
+            data = carry + block if carry else block
+            arr = np.frombuffer(data, dtype=np.uint8)
+            newlines = np.flatnonzero(arr == 0x0A)
+            if newlines.size == 0:
+                carry = data
+                continue
+            end = int(newlines[-1]) + 1
+            lengths = _line_char_lengths(arr[:end], newlines)
+            if lengths is None:
+                return scan_line_lengths_text(path, expected, max_issue_details)
+            _record(lengths)
+            carry = data[end:]
+
+        if carry:
+            last = carry.decode('utf-8', errors='replace')
+            if '\r' in last[:-1]:
+                return scan_line_lengths_text(path, expected, max_issue_details)
+            _record(np.array([len(last.rstrip('\r\n'))]))
+
+    return mismatch_count, sampled, total_rows
+
+
+def scan_line_lengths_text(path: str, expected: int,
+                           max_issue_details: int = 200) -> tuple[int, list[tuple[int, int]], int]:
+    """Line-by-line text-mode variant of :func:`scan_line_lengths`."""
+    mismatch_count = 0
+    sampled: list[tuple[int, int]] = []
+    total_rows = 0
+
+    with open(path, 'r', encoding='utf-8', errors='replace', buffering=_SCAN_BLOCK_SIZE) as fh:
+        for row_num, line in enumerate(fh, start=1):
+            total_rows = row_num
+            actual_len = len(line.rstrip('\r\n'))
+            if actual_len != expected:
+                mismatch_count += 1
+                if len(sampled) < max_issue_details:
+                    sampled.append((row_num, actual_len))
+
+    return mismatch_count, sampled, total_rows
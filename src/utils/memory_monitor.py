@@ -78,18 +78,42 @@ class MemoryMonitor:
         
         return False
     
-    def force_garbage_collection(self):
-        """Force garbage collection to free memory."""
+    def force_garbage_collection(self, generation: int = 2):
+        """Force garbage collection to free memory.
+
+        Args:
+            generation: Oldest generation to collect; 2 (the default) is a
+                full collection, 0 only scans recently allocated objects.
+        """
         before_mb = self.get_current_memory_mb()
-        gc.collect()
+        gc.collect(generation)
         after_mb = self.get_current_memory_mb()
         freed_mb = before_mb - after_mb
         
         self.logger.info(
-            f"Garbage collection: freed {freed_mb:.1f} MB "
+            f"Garbage collection (generation {generation}): freed {freed_mb:.1f} MB "
             f"({before_mb:.1f} MB -> {after_mb:.1f} MB)"
         )
     
+    def collect_if_above(self, watermark_mb: float, generation: int = 2) -> bool:
+        """Force a garbage collection only when memory exceeds a watermark.
+
+        Lets chunk loops collect under real memory pressure instead of on a
+        fixed schedule; below the watermark this costs one RSS read.
+
+        Args:
+            watermark_mb: Process RSS in MB above which to collect
+            generation: Oldest generation to collect (see
+                :meth:`force_garbage_collection`)
+
+        Returns:
+            True if a collection ran
+        """
+        if self.get_current_memory_mb() <= watermark_mb:
+            return False
+        self.force_garbage_collection(generation)
+        return True
+    
     def log_memory_usage(self, context: str = ""):
         """Log current memory usage.
         
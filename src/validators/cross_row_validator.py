@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import logging
 import warnings
-from typing import List
+from typing import Iterator, List
 
 import pandas as pd
 
@@ -24,6 +24,23 @@ from src.validators.rule_engine import RuleViolation
 _logger = logging.getLogger(__name__)
 
 
+def _iter_rows(df: pd.DataFrame, fields: list) -> Iterator[tuple]:
+    """Yield ``(index_label, values)`` pairs equivalent to ``df[fields].iterrows()``.
+
+    When a single column is selected, or every selected column has object
+    dtype (always true for parsed chunks), the values are zipped straight from
+    the column lists instead of building a Series per row.  Other dtype mixes
+    still go through ``iterrows`` so its common-dtype upcasting is preserved.
+    """
+    sub = df[fields]
+    if len(fields) == 1 or all(dtype == object for dtype in sub.dtypes):
+        columns = [sub.iloc[:, j].tolist() for j in range(sub.shape[1])]
+        yield from zip(sub.index, zip(*columns))
+    else:
+        for idx, row in sub.iterrows():
+            yield idx, tuple(row)
+
+
 class CrossRowValidator:
     """Validate rules that span multiple rows grouped by key columns.
 
@@ -464,8 +481,8 @@ class CrossRowValidator:
             if any(f not in df.columns for f in fields):
                 return {}
             seen = {}
-            for idx, row in df[fields].iterrows():
-                key = str(tuple(str(v) for v in row))
+            for idx, values in _iter_rows(df, fields):
+                key = str(tuple(str(v) for v in values))
                 seen.setdefault(key, []).append(int(idx))
             return {"seen": seen}
 
@@ -476,12 +493,12 @@ class CrossRowValidator:
                 return {}
             groups: dict = {}
             rows: dict = {}
-            for idx, row in df[[key_field, target_field]].iterrows():
-                k = str(row[key_field])
-                v = str(row[target_field]) if not pd.isna(row[target_field]) else None
+            for idx, (key_val, target_val) in _iter_rows(df, [key_field, target_field]):
+                k = str(key_val)
+                v = str(target_val) if not pd.isna(target_val) else None
                 if v is not None:
                     groups.setdefault(k, set()).add(v)
-                rows.setdefault(k, []).append((int(idx), str(row[target_field])))
+                rows.setdefault(k, []).append((int(idx), str(target_val)))
             return {"groups": {k: list(v) for k, v in groups.items()}, "rows": rows}
 
         if check == "sequential":
@@ -491,10 +508,10 @@ class CrossRowValidator:
                 return {}
             groups: dict = {}
             rows: dict = {}
-            numeric_seq = pd.to_numeric(df[seq_field], errors="coerce")
-            for idx, row in df[[key_field]].iterrows():
-                k = str(row[key_field])
-                sv = numeric_seq.loc[idx]
+            numeric_seq = pd.to_numeric(df[seq_field], errors="coerce").to_numpy()
+            for pos, (idx, (key_val,)) in enumerate(_iter_rows(df, [key_field])):
+                k = str(key_val)
+                sv = numeric_seq[pos]
                 if not pd.isna(sv):
                     groups.setdefault(k, set()).add(int(sv))
                 rows.setdefault(k, []).append(int(idx))
@@ -508,13 +525,12 @@ class CrossRowValidator:
             counts: dict = {}
             declared: dict = {}
             rows: dict = {}
-            for idx, row in df[[key_field, count_field]].iterrows():
-                k = str(row[key_field])
+            declared_vals = pd.to_numeric(df[count_field], errors="coerce").to_numpy()
+            for pos, (idx, (key_val, _)) in enumerate(_iter_rows(df, [key_field, count_field])):
+                k = str(key_val)
                 counts[k] = counts.get(k, 0) + 1
                 rows.setdefault(k, []).append(int(idx))
-                dc = pd.to_numeric(
-                    pd.Series([row[count_field]]), errors="coerce"
-                ).iloc[0]
+                dc = declared_vals[pos]
                 if not pd.isna(dc) and k not in declared:
                     declared[k] = int(dc)
             return {"counts": counts, "declared": declared, "rows": rows}
@@ -526,10 +542,10 @@ class CrossRowValidator:
                 return {}
             sums: dict = {}
             rows: dict = {}
-            numeric_sum = pd.to_numeric(df[sum_field], errors="coerce")
-            for idx, row in df[[key_field]].iterrows():
-                k = str(row[key_field])
-                v = numeric_sum.loc[idx]
+            numeric_sum = pd.to_numeric(df[sum_field], errors="coerce").to_numpy()
+            for pos, (idx, (key_val,)) in enumerate(_iter_rows(df, [key_field])):
+                k = str(key_val)
+                v = numeric_sum[pos]
                 if not pd.isna(v):
                     sums[k] = sums.get(k, 0.0) + float(v)
                 rows.setdefault(k, []).append(
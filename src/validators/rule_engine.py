@@ -1,7 +1,8 @@
 """Business rule validation engine."""
 
+import copy
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 import pandas as pd
 import re
@@ -9,6 +10,23 @@ from datetime import datetime
 
 _logger = logging.getLogger(__name__)
 
+# Field values RuleViolation.to_dict deep-copies, as dataclasses.asdict does.
+_CONTAINER_TYPES = (list, tuple, dict, set)
+
+# Rule keys naming a single column, across field, cross-field and cross-row rules.
+_COLUMN_KEYS = (
+    'field', 'left_field', 'right_field', 'key_field', 'target_field',
+    'sequence_field', 'count_field', 'sum_field',
+)
+
+_FIELD_OPERATORS = frozenset({
+    '>', '<', '>=', '<=', '==', '!=', 'in', 'not_in', 'regex', 'range', 'not_null', 'length',
+})
+_COMPARISON_OPERATORS = frozenset({'>', '<', '>=', '<=', '==', '!='})
+
+# Column named by a `when` condition (see RuleEngine._apply_condition).
+_CONDITION_FIELD = re.compile(r'^\s*([A-Za-z0-9_\-]+)\s*(?:in\s*\(|=|!=|>=|<=|>|<)', re.IGNORECASE)
+
 
 @dataclass
 class RuleViolation:
@@ -24,8 +42,19 @@ class RuleViolation:
     issue_code: Optional[str] = None
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary.
+
+        Equivalent to ``dataclasses.asdict`` but much cheaper on the
+        per-violation hot path: scalar fields are copied as-is and only
+        container values (e.g. ``expected`` holding a rule's ``values`` list)
+        are deep-copied, so the result never shares state with the rules
+        config.
+        """
+        out = dict(self.__dict__)
+        for key, item in out.items():
+            if isinstance(item, _CONTAINER_TYPES):
+                out[key] = copy.deepcopy(item)
+        return out
 
 
 class RuleEngine:
@@ -336,6 +365,74 @@ class RuleEngine:
         """
         return [r for r in self.enabled_rules if r.get("type") == "cross_row"]
 
+    def disable_invalid_rules(self) -> List[str]:
+        """Drop enabled rules whose configuration can never execute.
+
+        Unknown rule types, operators or cross-row checks, a missing
+        ``field``, and regex patterns that do not compile would otherwise
+        raise (and be caught and logged) again on every DataFrame validated.
+        Checking once lets chunked callers skip them up front.
+
+        Returns:
+            One message per disabled rule.
+        """
+        from src.validators.cross_row_validator import CrossRowValidator
+
+        messages: List[str] = []
+        valid: List[Dict] = []
+        for rule in self.enabled_rules:
+            rule_type = rule.get('type')
+            operator = rule.get('operator')
+            problem = None
+            if rule_type == 'field_validation':
+                if not rule.get('field'):
+                    problem = "missing 'field'"
+                elif operator not in _FIELD_OPERATORS:
+                    problem = f"Unknown operator: {operator}"
+                elif operator == 'regex':
+                    try:
+                        re.compile(rule.get('pattern') or '')
+                    except re.error as exc:
+                        problem = f"Invalid regex pattern: {exc}"
+            elif rule_type == 'cross_field':
+                if operator not in _COMPARISON_OPERATORS:
+                    problem = f"Unknown comparison operator: {operator}"
+            elif rule_type == 'cross_row':
+                if rule.get('check', '') not in CrossRowValidator._DISPATCH:
+                    problem = f"Unknown cross_row check type: '{rule.get('check', '')}'"
+            else:
+                problem = f"Unknown rule type: {rule_type}"
+
+            if problem is None:
+                valid.append(rule)
+            else:
+                messages.append(f"Business rule {rule.get('id', 'unknown')} disabled: {problem}")
+        self.enabled_rules = valid
+        return messages
+
+    def referenced_columns(self) -> Optional[List[str]]:
+        """Return the columns the enabled rules read, in first-use order.
+
+        Covers each rule's field keys, ``fields`` lists and the column named
+        by its ``when`` condition, so callers can hand the engine a narrower
+        DataFrame.  Returns None when a rule of an unknown type is enabled,
+        since its columns cannot be determined.
+        """
+        columns: Dict[str, None] = {}
+        for rule in self.enabled_rules:
+            if rule.get('type') not in ('field_validation', 'cross_field', 'cross_row'):
+                return None
+            for key in _COLUMN_KEYS:
+                if rule.get(key):
+                    columns[rule[key]] = None
+            fields = rule.get('fields') or []
+            for name in ([fields] if isinstance(fields, str) else fields):
+                columns[name] = None
+            match = _CONDITION_FIELD.match(str(rule.get('when') or ''))
+            if match:
+                columns[match.group(1)] = None
+        return list(columns)
+
     def validate_non_cross_row(self, df: pd.DataFrame) -> List[RuleViolation]:
         """Execute all enabled rules EXCEPT cross_row type rules.
 
@@ -70,3 +70,128 @@ def test_chunked_business_rules_negative_with_violation():
     finally:
         os.unlink(data_path)
         os.unlink(rules_path)
+
+
+def test_chunked_business_rules_run_in_parallel_workers():
+    data_path = _write_temp('id|status|score\nA|ACTIVE|\nB|INACTIVE|20\nA|ACTIVE|5\nC|ACTIVE|\n', '.txt')
+    rules = {
+        'metadata': {'name': 't'},
+        'rules': [
+            {
+                'id': 'BR12',
+                'name': 'score required when active',
+                'type': 'field_validation',
+                'severity': 'error',
+                'field': 'score',
+                'operator': 'not_null',
+                'when': 'status = ACTIVE',
+                'enabled': True,
+            },
+            {
+                'id': 'BR13',
+                'name': 'unique id',
+                'type': 'cross_row',
+                'check': 'unique',
+                'field': 'id',
+                'severity': 'warning',
+                'enabled': True,
+            },
+        ],
+    }
+    rules_path = _write_temp(json.dumps(rules), '.json')
+
+    try:
+        sequential, parallel = (
+            ChunkedFileValidator(
+                file_path=data_path, delimiter='|', chunk_size=1, workers=workers,
+                rules_config_path=rules_path,
+            ).validate(show_progress=False)
+            for workers in (1, 2)
+        )
+        assert parallel['statistics']['parallel'] is True
+        assert parallel['business_rules'] == sequential['business_rules']
+        assert parallel['errors'] == sequential['errors']
+        assert [w for w in parallel['warnings'] if isinstance(w, dict)] == [
+            w for w in sequential['warnings'] if isinstance(w, dict)
+        ]
+        assert {(v['rule_id'], v['row_number']) for v in parallel['business_rules']['violations']} == {
+            ('BR12', 1), ('BR12', 4), ('BR13', 1), ('BR13', 3),
+        }
+    finally:
+        os.unlink(data_path)
+        os.unlink(rules_path)
+
+
+def test_chunked_business_rules_stream_violations_to_jsonl(tmp_path, monkeypatch):
+    from src.parsers import chunked_validator as cv
+
+    monkeypatch.setattr(cv, '_VIOLATION_SAMPLE_SIZE', 2)
+    data_path = tmp_path / 'data.txt'
+    data_path.write_text('status|score\n' + 'ACTIVE|\n' * 5)
+    rules_path = tmp_path / 'rules.json'
+    rules_path.write_text(json.dumps({'rules': [{
+        'id': 'BR14', 'name': 'score required', 'type': 'field_validation',
+        'severity': 'error', 'field': 'score', 'operator': 'not_null', 'enabled': True,
+    }]}))
+    sidecar = tmp_path / 'violations.jsonl'
+
+    out = ChunkedFileValidator(
+        file_path=str(data_path), delimiter='|', chunk_size=2,
+        rules_config_path=str(rules_path), violations_jsonl_path=str(sidecar),
+    ).validate(show_progress=False)
+
+    streamed = [json.loads(line) for line in sidecar.read_text().splitlines()]
+    assert [v['row_number'] for v in streamed] == [1, 2, 3, 4, 5]
+    assert out['business_rules']['violations'] == streamed[:2]
+    assert out['business_rules']['violations_jsonl'] == str(sidecar)
+    assert out['business_rules']['statistics']['total_violations'] == 5
+    # Routed issues are sampled too, so they stay bounded as well.
+    assert [e['row'] for e in out['errors']] == [1, 2]
+    assert any(w.startswith('Business rules raised 5 error issues') for w in out['warnings'])
+
+
+def test_chunked_business_rules_see_only_referenced_columns(tmp_path, monkeypatch):
+    from src.validators.rule_engine import RuleEngine
+
+    data_path = tmp_path / 'data.txt'
+    data_path.write_text('id|status|score|note\nA|ACTIVE||x\nB|INACTIVE|20|y\n')
+    rules_path = tmp_path / 'rules.json'
+    rules_path.write_text(json.dumps({'rules': [{
+        'id': 'BR15', 'name': 'score required when active', 'type': 'field_validation',
+        'severity': 'error', 'field': 'score', 'operator': 'not_null', 'when': 'status = ACTIVE',
+        'enabled': True,
+    }]}))
+    seen_columns = []
+    original = RuleEngine.validate_non_cross_row
+
+    def _validate(self, df):
+        seen_columns.append(list(df.columns))
+        return original(self, df)
+
+    monkeypatch.setattr(RuleEngine, 'validate_non_cross_row', _validate)
+    out = ChunkedFileValidator(
+        file_path=str(data_path), delimiter='|', chunk_size=10, rules_config_path=str(rules_path),
+    ).validate(show_progress=False)
+
+    assert seen_columns == [['status', 'score']]
+    assert [v['row_number'] for v in out['business_rules']['violations']] == [1]
+
+
+def test_chunked_business_rules_report_broken_rules_once(tmp_path):
+    data_path = tmp_path / 'data.txt'
+    data_path.write_text('status|score\n' + 'ACTIVE|\n' * 4)
+    rules_path = tmp_path / 'rules.json'
+    rules_path.write_text(json.dumps({'rules': [
+        {'id': 'BR16', 'name': 'score required', 'type': 'field_validation',
+         'severity': 'error', 'field': 'score', 'operator': 'not_null'},
+        {'id': 'BR17', 'name': 'broken', 'type': 'field_validation',
+         'severity': 'error', 'field': 'score', 'operator': 'bogus'},
+    ]}))
+
+    out = ChunkedFileValidator(
+        file_path=str(data_path), delimiter='|', chunk_size=1, rules_config_path=str(rules_path),
+    ).validate(show_progress=False)
+
+    assert out['warnings'].count('Business rule BR17 disabled: Unknown operator: bogus') == 1
+    assert {v['rule_id'] for v in out['business_rules']['violations']} == {'BR16'}
+    assert out['business_rules']['statistics']['total_violations'] == 4
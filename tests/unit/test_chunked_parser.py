@@ -80,7 +80,46 @@ class TestChunkedFileParser:
         row_count = parser.count_rows()
         
         assert row_count == 6  # 5 data rows + 1 header
+
+    @pytest.mark.parametrize("content,expected", [
+        (b"", 0),
+        (b"a|b\n", 1),
+        (b"a|b\n1|2", 2),
+        (b"a|b\n1|2\n", 2),
+    ])
+    def test_count_rows_trailing_newline_handling(self, tmp_path, content, expected):
+        """Rows are counted the same with or without a trailing newline."""
+        path = tmp_path / "rows.txt"
+        path.write_bytes(content)
+
+        assert ChunkedFileParser(str(path)).count_rows() == expected
+
+    def test_count_rows_spans_read_blocks(self, tmp_path, monkeypatch):
+        """Counting is correct when lines straddle read-block boundaries."""
+        import src.parsers.chunked_parser as chunked_parser_module
+
+        monkeypatch.setattr(chunked_parser_module, "_COUNT_BLOCK_SIZE", 7)
+        path = tmp_path / "rows.txt"
+        path.write_bytes(b"".join(f"{i}|row{i}\n".encode() for i in range(50)) + b"tail")
+
+        assert ChunkedFileParser(str(path)).count_rows() == 51
     
+    def test_count_rows_is_memoized_per_file_path(self, tmp_path):
+        """Repeated counts reuse the first scan until file_path changes."""
+        first = tmp_path / "first.txt"
+        first.write_text("a|b\n1|2\n")
+        second = tmp_path / "second.txt"
+        second.write_text("a|b\n1|2\n3|4\n")
+        parser = ChunkedFileParser(str(first))
+
+        assert parser.count_rows() == 2
+        first.write_text("a|b\n")
+        assert parser.count_rows() == 2
+        assert parser.get_file_info()['total_rows'] == 2
+
+        parser.file_path = str(second)
+        assert parser.count_rows() == 3
+
     def test_get_file_info(self, sample_pipe_file):
         """Test file info retrieval."""
         parser = ChunkedFileParser(sample_pipe_file, delimiter='|', chunk_size=100)
@@ -119,6 +158,76 @@ class TestChunkedFileParser:
         
         assert result['valid'] is False
         assert len(result['errors']) > 0
+
+    @pytest.mark.parametrize("content,expected_warning", [
+        (b"id|name\n", "First chunk is empty"),
+        (b"id,name\n1,a\n", "No delimiter '|' found in first line"),
+    ])
+    def test_validate_structure_peek_warnings(self, tmp_path, content, expected_warning):
+        """Header-only files and missing delimiters are flagged from a byte peek."""
+        path = tmp_path / "peek.txt"
+        path.write_bytes(content)
+
+        result = ChunkedFileParser(str(path), delimiter='|').validate_structure()
+
+        assert result['valid'] is True
+        assert expected_warning in result['warnings']
+
+    def test_validate_structure_binary_file_is_invalid(self, tmp_path):
+        """Binary content fails structure validation without a pandas parse."""
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"\x00\x01\x02|\xff")
+
+        result = ChunkedFileParser(str(path), delimiter='|').validate_structure()
+
+        assert result['valid'] is False
+        assert any('Failed to parse first chunk' in e for e in result['errors'])
+
+    def test_validate_structure_stats_file_once(self, sample_pipe_file, monkeypatch):
+        """The size check and file_info share a single os.stat call."""
+        import src.parsers.chunked_parser as chunked_parser_module
+
+        calls = []
+        real_stat = os.stat
+
+        def _counting_stat(path, *args, **kwargs):
+            calls.append(path)
+            return real_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(chunked_parser_module.os, "stat", _counting_stat)
+        result = ChunkedFileParser(sample_pipe_file, delimiter='|').validate_structure()
+
+        assert result['valid'] is True
+        assert result['file_info']['size_bytes'] == real_stat(sample_pipe_file).st_size
+        assert calls.count(sample_pipe_file) == 1
+
+    def test_validate_structure_can_skip_the_row_count(self, tmp_path, monkeypatch):
+        """Without include_row_count the file is not scanned for rows."""
+        path = tmp_path / "rows.txt"
+        path.write_text("id|name\n1|a\n2|b\n")
+        parser = ChunkedFileParser(str(path), delimiter='|', chunk_size=10)
+        monkeypatch.setattr(parser, 'count_rows', lambda: pytest.fail('row count pass'))
+
+        info = parser.validate_structure(include_row_count=False)['file_info']
+
+        assert info['total_rows'] is None and info['estimated_chunks'] is None
+        monkeypatch.undo()
+        parser.set_row_count(3)
+        assert parser.validate_structure(include_row_count=False)['file_info']['total_rows'] == 3
+    
+    def test_count_rows_advises_sequential_reads(self, tmp_path, monkeypatch):
+        """count_rows hints sequential access where the platform supports it."""
+        path = tmp_path / "rows.txt"
+        path.write_text("id|name\n1|a\n2|b\n")
+        calls = []
+        monkeypatch.setattr(os, 'posix_fadvise', lambda *args: calls.append(args), raising=False)
+        monkeypatch.setattr(os, 'POSIX_FADV_SEQUENTIAL', 2, raising=False)
+
+        assert ChunkedFileParser(str(path), delimiter='|').count_rows() == 3
+        assert [args[1:] for args in calls] == [(0, 0, 2)]
+
+        monkeypatch.delattr(os, 'posix_fadvise')
+        assert ChunkedFileParser(str(path), delimiter='|').count_rows() == 3
     
     def test_parse_with_progress(self, large_pipe_file):
         """Test parsing with progress tracking."""
@@ -136,6 +245,18 @@ class TestChunkedFileParser:
         # Progress callback gets total from count_rows (includes header)
         # but actual data rows processed is 1000
         assert progress_updates[-1][0] >= 1000  # At least 1000 rows processed
+
+    def test_parse_with_progress_skips_row_count_without_callback(self, large_pipe_file, monkeypatch):
+        """No callback means no upfront full-file row count."""
+        parser = ChunkedFileParser(large_pipe_file, delimiter='|', chunk_size=100)
+
+        def _fail():
+            raise AssertionError("count_rows should not be called")
+
+        monkeypatch.setattr(parser, "count_rows", _fail)
+        chunks = list(parser.parse_with_progress())
+
+        assert sum(len(c) for c in chunks) == 1000
     
     def test_large_file_memory_efficiency(self, large_pipe_file):
         """Test that chunked parsing doesn't load entire file."""
@@ -150,6 +271,114 @@ class TestChunkedFileParser:
         
         assert total_rows == 1000  # 1000 data rows (header not counted by pandas)
 
+    @pytest.mark.parametrize("content,has_header,columns", [
+        (None, True, None),
+        (None, True, ['a', 'b', 'c', 'd']),
+        (None, False, None),
+        (b"\xef\xbb\xbfa|b\n1|2\n", True, None),
+        (b"\xef\xbb\xbf1|2\n3|4\n", False, None),
+        (b"a|a||a.1\n1|2|3|4\n", True, None),
+        (b"a|b\n", True, None),
+    ], ids=["header", "columns", "no_header", "bom", "bom_no_header", "duplicate_names", "header_only"])
+    def test_parse_chunks_fast_matches_parse_chunks(self, large_pipe_file, tmp_path, content, has_header, columns):
+        """The fast reader yields the same chunks as the pandas reader."""
+        path = large_pipe_file
+        if content is not None:
+            path = str(tmp_path / "small.txt")
+            with open(path, 'wb') as f:
+                f.write(content)
+
+        def _chunks(method):
+            parser = ChunkedFileParser(path, delimiter='|', chunk_size=300,
+                                       has_header=has_header)
+            return list(getattr(parser, method)(columns))
+
+        expected = _chunks('parse_chunks')
+        actual = _chunks('parse_chunks_fast')
+
+        assert len(actual) == len(expected)
+        for got, want in zip(actual, expected):
+            pd.testing.assert_frame_equal(got, want)
+
+    def test_parse_chunks_fast_skips_blank_lines_and_crlf(self, tmp_path):
+        """Blank lines are skipped and CRLF endings stripped, as in pandas."""
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"id|name\r\n1|a\r\n\r\n2|\r\n3|c")
+
+        chunk = next(ChunkedFileParser(str(path), chunk_size=10).parse_chunks_fast())
+
+        assert chunk['id'].tolist() == ['1', '2', '3']
+        assert chunk['name'].tolist() == ['a', '', 'c']
+
+    def test_parse_chunks_fast_chunk_boundaries_ignore_blank_lines(self, tmp_path):
+        """Blank lines do not shift chunk boundaries or index offsets."""
+        path = tmp_path / "blank.txt"
+        path.write_bytes(b"a|b\n1|2\n\n3|4\n5|6\n7|8\n")
+
+        def _chunks(method):
+            return list(getattr(ChunkedFileParser(str(path), chunk_size=2), method)())
+
+        expected = _chunks('parse_chunks')
+        actual = _chunks('parse_chunks_fast')
+
+        assert [list(c.index) for c in actual] == [[0, 1], [2, 3]]
+        assert len(actual) == len(expected)
+        for got, want in zip(actual, expected):
+            pd.testing.assert_frame_equal(got, want)
+
+    @pytest.mark.parametrize("body", [b"1|a|extra\n", b'1|"a"\n'])
+    def test_parse_chunks_fast_rejects_ragged_or_quoted_rows(self, tmp_path, body):
+        """Rows the fast reader cannot represent raise instead of misaligning."""
+        path = tmp_path / "bad.txt"
+        path.write_bytes(b"id|name\n" + body)
+
+        with pytest.raises(ValueError, match="parse_chunks"):
+            list(ChunkedFileParser(str(path)).parse_chunks_fast())
+
+    def test_invalid_engine_rejected(self, sample_pipe_file):
+        """Unknown engine names fail fast."""
+        with pytest.raises(ValueError):
+            ChunkedFileParser(sample_pipe_file, engine='polars')
+
+    @pytest.mark.parametrize("has_header,columns", [
+        (True, None),
+        (True, ['a', 'b', 'c', 'd']),
+        (False, None),
+    ])
+    def test_pyarrow_engine_matches_pandas(self, large_pipe_file, has_header, columns):
+        """The pyarrow engine yields the same chunks as the pandas engine."""
+        pytest.importorskip("pyarrow")
+
+        def _chunks(engine):
+            parser = ChunkedFileParser(large_pipe_file, delimiter='|', chunk_size=300,
+                                       has_header=has_header, engine=engine)
+            return list(parser.parse_chunks(columns))
+
+        expected = _chunks('pandas')
+        actual = _chunks('pyarrow')
+
+        assert [len(c) for c in actual] == [len(c) for c in expected]
+        for got, want in zip(actual, expected):
+            pd.testing.assert_frame_equal(got, want, check_dtype=False)
+            assert got.dtypes.map(lambda d: d == object or pd.api.types.is_string_dtype(d)).all()
+
+    @pytest.mark.parametrize("content", [
+        b"\xef\xbb\xbfa|b\n1|2\n",
+        b"a|a|a.1|a||b|\n1|2|3|4|5|6|7\n",
+        b"a|b\n",
+    ], ids=["bom", "duplicate_headers", "header_only"])
+    def test_pyarrow_engine_header_parity(self, tmp_path, content):
+        """BOMs, duplicate/empty names and header-only files match pandas."""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "header.txt"
+        path.write_bytes(content)
+
+        expected = list(ChunkedFileParser(str(path)).parse_chunks())
+        actual = list(ChunkedFileParser(str(path), engine='pyarrow').parse_chunks())
+
+        assert len(actual) == len(expected) == 1
+        pd.testing.assert_frame_equal(actual[0], expected[0], check_dtype=False)
+
 
 class TestChunkedFixedWidthParser:
     """Test ChunkedFixedWidthParser class."""
@@ -191,3 +420,50 @@ class TestChunkedFixedWidthParser:
         assert len(chunks) == 2  # 3 rows / 2 per chunk
         assert 'id' in chunks[0].columns
         assert 'name' in chunks[0].columns
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_uniform_records_use_mmap_path_and_match_read_fwf(self, tmp_path, newline):
+        """Uniform-length files are sliced directly and match read_fwf output."""
+        field_specs = [('id', 0, 3), ('name', 3, 11), ('code', 11, 14)]
+        rows = ["001Alice   NA ", "002        X  ", "003 Bob    abc", "004\tTab    N/A"]
+        path = tmp_path / "uniform.txt"
+        path.write_bytes(newline.join(rows).encode())
+
+        parser = ChunkedFixedWidthParser(str(path), field_specs=field_specs, chunk_size=3)
+        assert parser._uniform_record_layout() is not None
+
+        expected = list(pd.read_fwf(str(path), colspecs=parser.colspecs, names=parser.names,
+                                    dtype=str, chunksize=3))
+        actual = list(parser.parse_chunks())
+
+        assert len(actual) == len(expected) == 2
+        for got, want in zip(actual, expected):
+            pd.testing.assert_frame_equal(got, want)
+        assert pd.isna(actual[0].loc[1, 'name'])
+        assert pd.isna(actual[0].loc[0, 'code'])
+
+    def test_ragged_records_fall_back_to_read_fwf(self, tmp_path):
+        """Files with differing record lengths are not sliced by offset."""
+        path = tmp_path / "ragged.txt"
+        path.write_text("001Alice   \n002Bob\n003Charlie \n")
+        parser = ChunkedFixedWidthParser(str(path), field_specs=[('id', 0, 3), ('name', 3, 11)])
+
+        assert parser._uniform_record_layout() is None
+        chunk = next(parser.parse_chunks())
+        assert chunk['name'].tolist() == ['Alice', 'Bob', 'Charlie']
+
+    def test_mmap_path_handles_gaps_and_overlapping_fields(self, tmp_path):
+        """The record dtype honours arbitrary offsets, gaps and overlaps."""
+        field_specs = [('code', 1, 4), ('wide', 2, 9), ('tail', 10, 12)]
+        path = tmp_path / "gaps.txt"
+        path.write_text("XABCDEFGH-YZ\nX12345678-01\n")
+
+        parser = ChunkedFixedWidthParser(str(path), field_specs=field_specs)
+        assert parser._uniform_record_layout() is not None
+
+        chunk = next(parser.parse_chunks())
+        assert chunk.to_dict('list') == {
+            'code': ['ABC', '123'],
+            'wide': ['BCDEFGH', '2345678'],
+            'tail': ['YZ', '01'],
+        }
@@ -6,6 +6,19 @@ import tempfile
 from src.parsers.chunked_validator import ChunkedFileValidator
 
 
+def _reference_format_pattern(fmt):
+    """Regex form of an upper-cased format code; reference for ``_format_checker``."""
+    import re
+    from src.parsers import chunked_validator as cv
+
+    if fmt == 'XXX':
+        return re.compile(r'[A-Za-z]{3}')
+    if fmt == 'CCYYMMDD':
+        return re.compile(r'\d{8}')
+    spec = cv._numeric_format_spec(fmt)
+    return None if spec is None else cv._digits_pattern(*spec)
+
+
 def test_chunked_validator_returns_processing_stats():
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
         f.write('a|b|c\n')
@@ -155,3 +168,836 @@ def test_validate_with_schema_passes_show_progress_flag(monkeypatch):
 
     validator.validate_with_schema(expected_columns=['a'], required_columns=['a'], show_progress=True)
     assert called['show_progress'] is True
+
+
+def test_format_patterns_are_compiled_once_and_keep_semantics():
+    from src.parsers import chunked_validator as cv
+
+    cases = [
+        ('ABC', 'XXX', True), ('AB1', 'XXX', False),
+        ('20240131', 'CCYYMMDD', True), ('2024013', 'CCYYMMDD', False),
+        ('-123', 'S9(3)', True), ('123', 'S9(3)', True), ('+12', 'S9(3)', False),
+        ('00042', '9(5)', True), ('-0042', '9(5)', False),
+        ('+12345', '+9(3)V9(2)', True), ('12345', '+9(3)V9(2)', False),
+        ('12345', 'S9(3)V9(2)', True), ('12345', '9(3)V9(2)', True),
+        ('anything', 'X(10)', True), ('anything', '+9(3)', True),
+    ]
+    for value, fmt, expected in cases:
+        assert cv._is_value_valid_for_format(value, fmt) is expected, (value, fmt)
+
+    assert cv._format_checker('9(5)') is cv._format_checker('9(5)')
+    assert cv._digits_pattern('S', 5) is cv._digits_pattern('S', 5)
+
+
+def test_strict_field_errors_keep_row_order_and_precedence():
+    import pandas as pd
+    from src.parsers.chunked_validator import _error_dicts, _validate_chunk_worker
+
+    chunk = pd.DataFrame(
+        {'A': ['12', '', 'zz', None], 'B': ['Q', 'X', 'ABC', 'X']},
+        index=[10, 11, 12, 13],
+    )
+    fields = [
+        {'name': 'A', 'required': True, 'format': '9(2)', 'data_type': 'int'},
+        {'name': 'B', 'valid_values': ['X', 'ABC'], 'format': 'XXX'},
+    ]
+    out = _validate_chunk_worker(chunk, 2, 4, True, fields, 'format')
+
+    assert [(e['row'], e['code'], e['field']) for e in _error_dicts(out['errors'])] == [
+        (5, 'FW_VAL_001', 'B'),
+        (6, 'FW_REQ_001', 'A'),
+        (6, 'FW_FMT_001', 'B'),
+        (7, 'DT_INT_001', 'A'),
+        (7, 'FW_FMT_001', 'A'),
+        (8, 'FW_REQ_001', 'A'),
+        (8, 'FW_FMT_001', 'B'),
+    ]
+
+
+def test_row_hash_set_counts_duplicates_within_and_across_chunks():
+    import pandas as pd
+    from src.parsers.chunked_validator import _RowHashSet
+
+    seen = _RowHashSet()
+    first = pd.DataFrame({'a': ['1', '1', '2'], 'b': ['x', 'x', None]})
+    second = pd.DataFrame({'a': ['2', '3', '1'], 'b': [None, 'y', 'x']}, index=[3, 4, 5])
+
+    assert seen.add_chunk(first) == 1
+    assert seen.add_chunk(second) == 2
+    assert len(seen) == 3
+    assert seen.add_chunk(first.iloc[0:0]) == 0
+
+
+def test_chunked_validator_counts_duplicates_across_chunks():
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('c1|c2\n1|A\n2|B\n1|A\n2|B\n1|A\n')
+        temp_file = f.name
+
+    try:
+        validator = ChunkedFileValidator(file_path=temp_file, delimiter='|', chunk_size=2)
+        result = validator.validate(show_progress=False)
+        assert result['statistics']['duplicate_count'] == 3
+        assert result['statistics']['duplicate_check_limited'] is False
+    finally:
+        os.unlink(temp_file)
+
+
+def test_worker_init_caches_config_for_chunk_tasks(monkeypatch):
+    import pandas as pd
+    from src.parsers import chunked_validator as cv
+
+    monkeypatch.setattr(cv, '_WORKER_CONFIG', {})
+    cv._worker_init(5, True, ({'name': 'A', 'required': True},), 'format')
+
+    out = cv._validate_chunk_in_worker(pd.DataFrame({'A': ['x', '']}), 2)
+    assert out['rows'] == 2
+    assert [(e['code'], e['row']) for e in cv._error_dicts(out['errors'])] == [('FW_REQ_001', 7)]
+
+
+def test_parallel_mode_merges_chunk_results_in_file_order():
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('NUM\n')
+        f.write('\n'.join(['x'] * 12) + '\n')
+        temp_file = f.name
+
+    try:
+        validator = ChunkedFileValidator(
+            file_path=temp_file, delimiter='|', chunk_size=2, workers=2,
+            strict_fields=[{'name': 'NUM', 'data_type': 'int'}],
+        )
+        result = validator.validate(show_progress=False)
+
+        rows = [e['row'] for e in result['errors'] if isinstance(e, dict)]
+        assert rows == list(range(1, 13))
+        assert result['total_rows'] == 12
+    finally:
+        os.unlink(temp_file)
+
+
+def test_column_counts_aggregate_identically_in_sequential_and_parallel_modes():
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('a|b|c\n1| |x\n|y|\n3|  |z\n|w|\n')
+        temp_file = f.name
+
+    try:
+        results = [
+            ChunkedFileValidator(file_path=temp_file, delimiter='|', chunk_size=1, workers=w)
+            .validate(show_progress=False)['statistics']
+            for w in (1, 2)
+        ]
+        for stats in results:
+            assert stats['empty_string_counts'] == {'a': 2, 'b': 2, 'c': 2}
+        assert results[0]['null_counts'] == results[1]['null_counts']
+    finally:
+        os.unlink(temp_file)
+
+
+def test_fold_column_counts_merges_differing_column_sets():
+    import numpy as np
+    from src.parsers.chunked_validator import _add_column_counts, _fold_column_counts
+
+    totals: dict = {}
+    _add_column_counts(totals, ('a', 'b'), np.array([[1, 0], [0, 2]]))
+    _add_column_counts(totals, ('a', 'b'), np.array([[1, 0], [0, 1]]))
+    _add_column_counts(totals, ('a',), np.array([[3], [0]]))
+
+    assert _fold_column_counts(totals) == ({'a': 5}, {'b': 3})
+
+
+def test_count_blank_strings_matches_strip_semantics():
+    import numpy as np
+    import pandas as pd
+    from src.parsers.chunked_validator import _count_blank_strings
+
+    values = ['', ' ', '\t\n', 'a', ' b ', None, float('nan'), 0, np.str_('  ')]
+    series = pd.Series(values, dtype=object)
+    expected = int((series.notna() & (series.astype(str).str.strip() == '')).sum())
+
+    assert _count_blank_strings(series.to_numpy()) == expected == 4
+
+
+def test_arrow_column_counts_match_pandas_path():
+    import numpy as np
+    import pandas as pd
+    import pytest
+    from src.parsers import chunked_validator as cv
+
+    pytest.importorskip('pyarrow')
+    strings = np.array(['', ' ', '\t\n', 'a', ' b ', None, float('nan'), '\u3000', np.str_('  ')], dtype=object)
+    mixed = np.array(['', ' ', 0, None], dtype=object)
+
+    assert cv._arrow_column_counts(strings) == (
+        int(pd.isna(strings).sum()), cv._count_blank_strings(strings),
+    ) == (2, 5)
+    assert cv._arrow_column_counts(mixed) is None
+    counts, _ = cv._scan_columns(pd.DataFrame({'s': strings[:4], 'm': mixed}))
+    assert counts.tolist() == [[0, 1], [3, 2]]
+
+
+def test_format_checkers_agree_with_compiled_patterns():
+    import itertools
+    from src.parsers import chunked_validator as cv
+
+    alphabet = ['1', '0', '+', '-', 'a', 'Z', ' ', '٣', '²', 'é']
+    samples = [''.join(p) for n in range(0, 5) for p in itertools.product(alphabet, repeat=n)
+               if n < 4 or p[0] in '+-1']
+    for fmt in ('XXX', 'CCYYMMDD', '9(3)', 'S9(2)', '+9(1)V9(2)', 'S9(1)V9(1)', '9(0)V9(0)'):
+        pattern, checker = _reference_format_pattern(fmt), cv._format_checker(fmt)
+        for v in samples:
+            assert checker(v) is (pattern.fullmatch(v) is not None), (fmt, v)
+    assert cv._format_checker('X(5)') is None
+
+
+def _reference_row_length_scan(validator, max_issue_details):
+    """Line-by-line text-mode row-length scan; reference for the bytes scan."""
+    mismatch_count, issues, total_rows = 0, [], 0
+    with open(validator.file_path, 'r', encoding='utf-8', errors='replace') as fh:
+        for total_rows, line in enumerate(fh, start=1):
+            actual_len = len(line.rstrip('\r\n'))
+            if actual_len != validator.expected_row_length:
+                mismatch_count += 1
+                if len(issues) < max_issue_details:
+                    issues.append(validator._row_length_issue(total_rows, actual_len))
+    return mismatch_count, issues, total_rows
+
+
+def test_fixed_width_length_scan_matches_text_mode(tmp_path, monkeypatch):
+    from src.utils import file_scan
+
+    monkeypatch.setattr(file_scan, '_SCAN_BLOCK_SIZE', 4)
+    cases = [
+        b'abc\r\nab\r\nabcd\r\n',
+        'abé\nabc\nñññ\n\xff\xfe\n'.encode('utf-8') + b'ab\xffc\n',
+        b'abc\nabcdef',
+        b'abc\rab\nabc\n',  # bare CR: falls back to text mode
+        b'',
+    ]
+    for i, raw in enumerate(cases):
+        path = tmp_path / f'fw_{i}.txt'
+        path.write_bytes(raw)
+        validator = ChunkedFileValidator(file_path=str(path), expected_row_length=3)
+        assert validator._scan_fixed_width_row_lengths(max_issue_details=1) == \
+            _reference_row_length_scan(validator, max_issue_details=1)
+
+
+def test_scan_columns_counts_and_strips_strict_columns_in_one_pass():
+    import pandas as pd
+    from src.parsers.chunked_validator import _scan_columns
+
+    chunk = pd.DataFrame({'a': [' x ', '  ', None], 'b': ['', 'y', 'z'], 'n': [1.0, None, 3.0]})
+    counts, stripped = _scan_columns(chunk, frozenset({'a', 'n'}))
+
+    assert counts.tolist() == [[1, 0, 1], [1, 1, 0]]
+    assert stripped['a'].tolist() == ['x', '', '']
+    assert stripped['n'].tolist() == ['1.0', '', '3.0']
+    assert 'b' not in stripped
+
+
+def test_compile_strict_plan_resolves_field_lookups_once():
+    from src.parsers import chunked_validator as cv
+
+    fields = [
+        {'name': 'A', 'valid_values': [' X', 'Y', 'X '], 'required': 1},
+        {'name': 'B', 'data_type': 'Decimal', 'format': 's9(2)'},
+        {'name': 'C', 'data_type': 'string', 'format': 'X(4)'},
+    ]
+    plan = cv._compile_strict_plan(fields)
+
+    assert [f.pos for f in plan] == [0, 1, 2]
+    assert plan[0].allowed == ['X', 'Y'] and plan[0].required is True
+    assert plan[1].type_check is cv._is_float and plan[1].type_code == 'DT_FLT_001'
+    assert plan[1].format_check is cv._format_checker('S9(2)')
+    assert plan[2].type_check is None and plan[2].format_check is None
+    assert cv._strict_column_names(plan) == frozenset({'A', 'B', 'C'})
+    assert '_allowed' not in fields[0]
+
+
+def test_row_hash_set_matches_python_set_semantics():
+    import numpy as np
+    import pandas as pd
+    from src.parsers.chunked_validator import _RowHashSet
+
+    rng = np.random.default_rng(7)
+    seen, reference = _RowHashSet(), set()
+    for size in (300, 20, 300, 5, 1, 150, 300):
+        chunk = pd.DataFrame({'v': rng.integers(0, 500, size).astype(str)})
+        expected = 0
+        for value in chunk['v']:
+            expected += value in reference
+            reference.add(value)
+        assert seen.add_chunk(chunk) == expected
+    assert len(seen) == len(reference)
+
+
+def test_each_strict_column_is_stripped_once_per_chunk(monkeypatch):
+    import pandas as pd
+    from src.parsers import chunked_validator as cv
+
+    calls = []
+    real_strip = cv._strip_values
+    monkeypatch.setattr(cv, '_strip_values', lambda v, n: calls.append(len(v)) or real_strip(v, n))
+
+    chunk = pd.DataFrame({'A': [' 1', 'x '], 'B': ['ab', None]})
+    fields = [
+        {'name': 'A', 'data_type': 'int', 'required': True},
+        {'name': 'A', 'format': '9(1)'},
+        {'name': 'B', 'format': 'XXX'},
+    ]
+    out = cv._validate_chunk_worker(chunk, 1, 2, True, fields, 'all')
+
+    assert calls == [2, 2]
+    assert [(e['code'], e['row'], e['field']) for e in cv._error_dicts(out['errors'])] == [
+        ('FW_FMT_001', 1, 'B'), ('DT_INT_001', 2, 'A'), ('FW_FMT_001', 2, 'A'),
+    ]
+
+
+def test_shared_memory_chunk_round_trip_restores_column_labels(monkeypatch):
+    import pandas as pd
+    import pytest
+    from src.parsers import chunked_validator as cv
+
+    pytest.importorskip('pyarrow')
+    monkeypatch.setattr(cv, '_WORKER_CONFIG', {})
+    monkeypatch.setattr(cv, '_WORKER_RULES', {})
+    cv._worker_init(2, False, (), 'format')
+
+    chunk = pd.DataFrame({0: ['a', ' '], 1: ['b', None]})
+    shm, nbytes = cv._chunk_to_shared_memory(chunk)
+    try:
+        out = cv._validate_shared_chunk_in_worker(shm.name, nbytes, list(chunk.columns), 0, 1)
+    finally:
+        cv._release_shared_chunk(shm)
+
+    assert out['stats']['columns'] == (0, 1)
+    assert out['stats']['column_counts'].tolist() == [[0, 1], [1, 0]]
+    assert cv._chunk_to_shared_memory(pd.DataFrame({'m': ['x', 1]})) is None
+
+
+def test_parallel_duplicate_detection_matches_sequential_and_reports_within_chunk():
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('c1|c2\n1|A\n1|A\n2|B\n1|A\n2|B\n3|C\n')
+        temp_file = f.name
+
+    try:
+        seq, par = (
+            ChunkedFileValidator(file_path=temp_file, delimiter='|', chunk_size=2, workers=w)
+            .validate(show_progress=False)['statistics']
+            for w in (1, 2)
+        )
+        assert seq['duplicate_count'] == par['duplicate_count'] == 3
+        assert par['duplicates_within_chunk'] == 1
+        assert seq['duplicates_within_chunk'] is None
+    finally:
+        os.unlink(temp_file)
+
+
+def test_failing_values_same_result_for_repetitive_and_unique_columns(monkeypatch):
+    import numpy as np
+    from src.parsers import chunked_validator as cv
+
+    calls = []
+
+    def is_digit(v):
+        calls.append(v)
+        return v.isdecimal()
+
+    repetitive = np.array(['1', 'x', '', '1', 'x'] * 40, dtype=object)
+    assert cv._failing_values(repetitive, is_digit).tolist() == [False, True, False, False, True] * 40
+    assert sorted(calls) == ['1', 'x']
+
+    monkeypatch.setattr(cv, '_UNIQUE_SAMPLE_SIZE', 4)
+    unique = np.array(['1', 'a', '22', 'b3', ''], dtype=object)
+    assert cv._failing_values(unique, str.isdecimal).tolist() == [False, True, False, True, False]
+
+
+def test_strict_error_messages_built_from_precomputed_prefixes():
+    import pandas as pd
+    from src.parsers import chunked_validator as cv
+
+    plan = cv._compile_strict_plan([
+        {'name': 'N', 'data_type': 'integer', 'required': True},
+        {'name': 'S', 'valid_values': ['A']},
+        {'name': 'D', 'format': 'CCYYMMDD'},
+    ])
+    chunk = pd.DataFrame({'N': ['x1', ''], 'S': ['B', 'A'], 'D': ['2024', '20240101']})
+
+    messages = [e[3] for e in cv._strict_field_errors(chunk, 0, plan, True)]
+
+    assert messages == [
+        "Field 'N' expects integer but got 'x1'",
+        "Field 'S' has invalid value 'B'",
+        "Field 'D' has invalid format for value '2024'",
+        "Required field 'N' is empty",
+    ]
+
+
+def test_strict_errors_travel_as_tuples_until_reported():
+    import pickle
+    from src.parsers import chunked_validator as cv
+
+    err = ('error', 'strict_fixed_width', 'FW_REQ_001', 'msg', 3, 'A')
+    other = {'severity': 'error', 'code': 'X'}
+
+    assert pickle.loads(pickle.dumps([err])) == [err]
+    assert cv._error_dicts([err, other]) == [
+        {'severity': 'error', 'category': 'strict_fixed_width', 'code': 'FW_REQ_001',
+         'message': 'msg', 'row': 3, 'field': 'A'},
+        other,
+    ]
+
+
+def test_blank_column_warnings_skip_required_fields_in_strict_mode():
+    from src.parsers.chunked_parser import ChunkedFixedWidthParser
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write(' A \n B1\n  2\n CC\n')
+        temp_file = f.name
+
+    try:
+        parser = ChunkedFixedWidthParser(temp_file, [('R', 0, 1), ('O', 1, 2), ('P', 2, 3)], chunk_size=10)
+        validator = ChunkedFileValidator(
+            file_path=temp_file,
+            parser=parser,
+            chunk_size=10,
+            strict_fixed_width=True,
+            strict_level='format',
+            strict_fields=[{'name': 'R', 'required': True}],
+        )
+        result = validator.validate(show_progress=False)
+
+        blank_warnings = [w for w in result['warnings'] if w.startswith('Column ')]
+        assert blank_warnings == [
+            "Column 'O' has 1 null values (25.0%)",
+            "Column 'P' has 1 null values (25.0%)",
+        ]
+        assert [e['field'] for e in result['errors'] if e['row'] is None] == ['R']
+    finally:
+        os.unlink(temp_file)
+
+
+def test_max_duplicate_rows_bounds_or_lifts_duplicate_check():
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('c1|c2\n1|A\n2|B\n3|C\n1|A\n2|B\n')
+        temp_file = f.name
+
+    try:
+        def run(limit):
+            validator = ChunkedFileValidator(
+                file_path=temp_file, delimiter='|', chunk_size=3, max_duplicate_rows=limit,
+            )
+            return validator.validate(show_progress=False)
+
+        limited, unbounded = run(2), run(None)
+        assert limited['statistics']['duplicate_count'] == 0
+        assert limited['statistics']['duplicate_check_limited'] is True
+        assert unbounded['statistics']['duplicate_count'] == 2
+        assert unbounded['statistics']['duplicate_check_limited'] is False
+        assert 'Found 2 duplicate rows' in unbounded['warnings']
+    finally:
+        os.unlink(temp_file)
+
+
+def test_row_length_scan_supplies_the_row_count(monkeypatch):
+    import builtins
+
+    import pytest
+    from src.parsers import chunked_parser
+    from src.parsers.chunked_parser import ChunkedFixedWidthParser
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('AB\nCD\nEF')
+        temp_file = f.name
+
+    def no_count_pass(file, mode='r', buffering=-1, **kwargs):
+        if buffering == 0:
+            pytest.fail('count_rows re-read the file')
+        return builtins.open(file, mode, buffering, **kwargs)
+
+    try:
+        parser = ChunkedFixedWidthParser(temp_file, [('A', 0, 1), ('B', 1, 2)], chunk_size=10)
+        monkeypatch.setattr(chunked_parser, 'open', no_count_pass, raising=False)
+        validator = ChunkedFileValidator(
+            file_path=temp_file, parser=parser, chunk_size=10, expected_row_length=2,
+        )
+        result = validator.validate(show_progress=False)
+
+        assert parser.count_rows() == 3
+        assert result['total_rows'] == 3 and result['valid'] is True
+    finally:
+        os.unlink(temp_file)
+
+
+def test_prefetch_chunks_preserves_order_errors_and_early_close():
+    import pytest
+    from src.parsers.chunked_validator import _prefetch_chunks
+
+    assert list(_prefetch_chunks(iter(range(7)), depth=2)) == list(range(7))
+
+    def failing():
+        yield 1
+        raise ValueError('Failed to parse file: boom')
+
+    with pytest.raises(ValueError, match='boom'):
+        list(_prefetch_chunks(failing()))
+
+    closed = []
+
+    def endless():
+        try:
+            n = 0
+            while True:
+                yield n
+                n += 1
+        finally:
+            closed.append(True)
+
+    chunks = _prefetch_chunks(endless(), depth=1)
+    assert next(chunks) == 0
+    chunks.close()
+    assert closed == [True]
+
+
+def test_parallel_mode_skips_pool_for_single_chunk_files(monkeypatch):
+    from src.parsers import chunked_validator as cv
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('c1|c2\n1|A\n1|A\n')
+        temp_file = f.name
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError('process pool started for a single chunk')
+
+    def no_count(self):
+        raise AssertionError('row-count pass over the file')
+
+    try:
+        monkeypatch.setattr(cv.ChunkedFileParser, 'count_rows', no_count)
+        monkeypatch.setattr(cv, 'ProcessPoolExecutor', no_pool)
+        result = ChunkedFileValidator(
+            file_path=temp_file, delimiter='|', chunk_size=10, workers=4,
+        ).validate(show_progress=False)
+
+        assert result['statistics']['parallel'] is False
+        assert result['statistics']['duplicate_count'] == 1
+
+        monkeypatch.undo()
+        monkeypatch.setattr(cv.ChunkedFileParser, 'count_rows', no_count)
+        result = ChunkedFileValidator(
+            file_path=temp_file, delimiter='|', chunk_size=1, workers=2,
+        ).validate(show_progress=False)
+
+        assert result['statistics']['parallel'] is True
+        assert result['total_rows'] == 2 and result['statistics']['duplicate_count'] == 1
+    finally:
+        os.unlink(temp_file)
+
+
+def test_rules_config_parsed_once_per_file_version(tmp_path, monkeypatch):
+    import json
+    from src.parsers import chunked_validator as cv
+
+    rules = tmp_path / 'rules.json'
+    rules.write_text(json.dumps({'rules': [{'id': 'R1', 'type': 'not_null', 'field': 'a'}]}))
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(cv.json, 'load', lambda f: loads.append(1) or real_load(f))
+    cv._load_rules_config.cache_clear()
+
+    first = ChunkedFileValidator(file_path='x.txt', rules_config_path=str(rules))
+    second = ChunkedFileValidator(file_path='x.txt', rules_config_path=str(rules))
+    assert len(loads) == 1
+    assert first.rule_engine is not second.rule_engine
+    assert [r['id'] for r in second.rule_engine.rules] == ['R1']
+
+    rules.write_text(json.dumps({'rules': []}))
+    os.utime(rules, ns=(0, os.stat(rules).st_mtime_ns + 10**9))
+    assert ChunkedFileValidator(file_path='x.txt', rules_config_path=str(rules)).rule_engine.rules == []
+    assert len(loads) == 2
+
+
+def test_validate_with_schema_reads_header_once_then_uses_columns_from_validate(monkeypatch):
+    from src.parsers.chunked_parser import ChunkedFileParser
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('a|b|extra\n1|2|3\n')
+        temp_file = f.name
+
+    sample_rows = []
+    original_sample = ChunkedFileParser.parse_sample
+
+    def _sample(self, n_rows=1000):
+        sample_rows.append(n_rows)
+        return original_sample(self, n_rows)
+
+    try:
+        monkeypatch.setattr(ChunkedFileParser, 'parse_sample', _sample)
+        validator = ChunkedFileValidator(file_path=temp_file, delimiter='|', chunk_size=10)
+        result = validator.validate_with_schema(expected_columns=['a', 'b', 'c'], required_columns=['a'])
+
+        assert sample_rows == [1]
+        assert result['total_rows'] == 1
+        assert result['missing_required'] == []
+        assert result['unexpected'] == ['extra']
+        assert "Missing optional columns: ['c']" in result['warnings']
+    finally:
+        os.unlink(temp_file)
+
+
+def test_validate_with_schema_skips_validation_when_required_columns_missing(monkeypatch):
+    import pytest
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('a|b|extra\n1|2|3\n')
+        temp_file = f.name
+
+    try:
+        validator = ChunkedFileValidator(file_path=temp_file, delimiter='|', chunk_size=10)
+        monkeypatch.setattr(validator, 'validate', lambda show_progress=True: pytest.fail('full pass'))
+        result = validator.validate_with_schema(expected_columns=['a', 'b', 'c'], required_columns=['a', 'c'])
+
+        assert result['valid'] is False
+        assert result['missing_required'] == ['c']
+        assert result['unexpected'] == ['extra']
+        assert "Missing required columns: ['c']" in result['errors']
+        assert "Data validation skipped because required columns are missing" in result['warnings']
+    finally:
+        os.unlink(temp_file)
+
+
+def test_automatic_gc_paused_during_chunk_loop_and_restored():
+    import gc
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('c1\n' + ''.join(f'{i}\n' for i in range(20)))
+        temp_file = f.name
+
+    try:
+        validator = ChunkedFileValidator(file_path=temp_file, delimiter='|', chunk_size=1)
+        seen = []
+        validator.memory_monitor.collect_if_above = (
+            lambda watermark_mb, generation=2: seen.append(gc.isenabled()) or False
+        )
+        assert gc.isenabled()
+        result = validator.validate(show_progress=False)
+
+        assert result['total_rows'] == 20
+        assert seen == [False, False]
+        assert gc.isenabled()
+
+        # The parallel branch keeps automatic GC on but still checks the watermark.
+        seen.clear()
+        validator.workers = 2
+        validator.chunk_size = 2
+        result = validator.validate(show_progress=False)
+
+        assert result['statistics']['parallel'] is True
+        assert result['total_rows'] == 20
+        assert seen == [True]
+        assert gc.isenabled()
+    finally:
+        os.unlink(temp_file)
+
+
+def test_overlapping_gc_pauses_restore_gc_once_the_last_ends():
+    import gc
+    import threading
+    from src.parsers import chunked_validator as cv
+
+    assert gc.isenabled()
+    cv._pause_gc()   # run A
+    cv._pause_gc()   # run B starts while A has GC paused
+    cv._resume_gc()  # A finishes first
+    assert not gc.isenabled()
+    cv._resume_gc()  # B finishes
+    assert gc.isenabled()
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('c1\n' + ''.join(f'{i}\n' for i in range(200)))
+        temp_file = f.name
+    try:
+        threads = [
+            threading.Thread(target=ChunkedFileValidator(file_path=temp_file, chunk_size=1).validate,
+                             kwargs={'show_progress': False})
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert gc.isenabled()
+    finally:
+        os.unlink(temp_file)
+
+
+def test_chunk_loop_collects_fully_once_memory_passes_watermark(monkeypatch):
+    import gc
+    from src.parsers import chunked_validator as cv
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('c1\n' + ''.join(f'{i}\n' for i in range(20)))
+        temp_file = f.name
+
+    try:
+        monkeypatch.setattr(cv, '_GC_HEADROOM_MB', -1)  # always above the watermark
+        validator = ChunkedFileValidator(file_path=temp_file, delimiter='|', chunk_size=1)
+        seen = []
+        validator.memory_monitor.force_garbage_collection = (
+            lambda generation=2: seen.append((generation, gc.isenabled()))
+        )
+        validator.validate(show_progress=False)
+        assert seen == [(2, False), (2, False)]
+
+        monkeypatch.setattr(cv, '_GC_HEADROOM_MB', 1 << 20)
+        seen.clear()
+        validator.validate(show_progress=False)
+        assert seen == []
+    finally:
+        os.unlink(temp_file)
+
+
+def test_pyarrow_engine_matches_pandas_engine_results():
+    import pytest
+
+    pytest.importorskip('pyarrow')
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('id|code\n1|A\nx| \n3|B\n1|A\n')
+        temp_file = f.name
+
+    try:
+        def run(engine):
+            result = ChunkedFileValidator(
+                file_path=temp_file, delimiter='|', chunk_size=2, engine=engine,
+                strict_fixed_width=True, strict_level='all',
+                strict_fields=[{'name': 'id', 'data_type': 'int'}, {'name': 'code', 'valid_values': ['A']}],
+            ).validate(show_progress=False)
+            stats = result['statistics']
+            return result['errors'], result['actual_columns'], stats['empty_string_counts'], stats['duplicate_count']
+
+        assert run('pyarrow') == run('pandas')
+        assert run('pyarrow')[3] == 1
+    finally:
+        os.unlink(temp_file)
+
+
+def test_pyarrow_engine_matches_pandas_engine_on_ragged_rows():
+    import pytest
+
+    pytest.importorskip('pyarrow')
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        # A short row after the first chunk and a whitespace-only line.
+        f.write('a|b|c\n1|2|3\n4|5|6\n1|2\n   \n7|8|9\n')
+        temp_file = f.name
+
+    try:
+        def run(engine):
+            result = ChunkedFileValidator(
+                file_path=temp_file, delimiter='|', chunk_size=2, engine=engine,
+                strict_fixed_width=True, strict_fields=[{'name': 'c', 'required': True}],
+            ).validate(show_progress=False)
+            return result['errors'], result['total_rows'], result['actual_columns']
+
+        assert run('pyarrow') == run('pandas')
+        errors, total_rows, _ = run('pyarrow')
+        assert total_rows == 4
+        assert [e['row'] for e in errors if e.get('row') is not None] == [3]
+        assert "Required field 'c' is empty" in errors[0]['message']
+    finally:
+        os.unlink(temp_file)
+
+
+def test_max_errors_stops_reading_further_chunks():
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+        f.write('NUM\n' + 'x\n' * 40)
+        temp_file = f.name
+
+    try:
+        for workers in (1, 2):
+            result = ChunkedFileValidator(
+                file_path=temp_file, delimiter='|', chunk_size=2, workers=workers, max_errors=3,
+                strict_fields=[{'name': 'NUM', 'data_type': 'int'}],
+            ).validate(show_progress=False)
+
+            # Both modes stop after the chunk that reaches the cap and keep
+            # only the first max_errors errors.
+            assert len(result['errors']) == 3
+            assert result['total_rows'] == 4
+            assert result['statistics']['error_limit_reached'] is True
+            assert any(w.startswith('Stopped after') for w in result['warnings'])
+
+        full = ChunkedFileValidator(
+            file_path=temp_file, delimiter='|', chunk_size=2,
+            strict_fields=[{'name': 'NUM', 'data_type': 'int'}],
+        ).validate(show_progress=False)
+        assert len(full['errors']) == 40
+        assert full['statistics']['error_limit_reached'] is False
+    finally:
+        os.unlink(temp_file)
+
+
+def test_max_errors_parallel_stops_like_sequential(tmp_path):
+    data = tmp_path / 'data.txt'
+    data.write_text('NUM\n' + 'x\n' * 50)
+
+    def run(workers):
+        return ChunkedFileValidator(
+            file_path=str(data), delimiter='|', chunk_size=5, workers=workers, max_errors=7,
+            strict_fields=[{'name': 'NUM', 'data_type': 'int'}],
+        ).validate(show_progress=False)
+
+    sequential, parallel = run(1), run(2)
+
+    assert parallel['statistics']['parallel'] is True
+    assert parallel['total_rows'] == sequential['total_rows'] == 10
+    assert parallel['errors'] == sequential['errors']
+    assert len(parallel['errors']) == 7
+
+
+def test_max_errors_also_caps_errors_added_after_the_chunk_loop(tmp_path):
+    data = tmp_path / 'data.txt'
+    data.write_text('NUM|REQ\n' + 'x|\n' * 20)
+
+    for workers in (1, 2):
+        result = ChunkedFileValidator(
+            file_path=str(data), delimiter='|', chunk_size=4, workers=workers, max_errors=3,
+            strict_fixed_width=True, strict_level='all',
+            strict_fields=[{'name': 'NUM', 'data_type': 'int'}, {'name': 'REQ', 'required': True}],
+        ).validate(show_progress=False)
+
+        assert len(result['errors']) <= 3
+        assert "Stopped after 3 errors (max_errors=3); only the first 4 rows were validated" in result['warnings']
+
+
+def test_validate_to_json_writes_one_record_per_issue(tmp_path):
+    import json
+
+    data = tmp_path / 'data.txt'
+    data.write_text('NUM\n1\nx\n1\ny\n')
+    out = tmp_path / 'result.jsonl'
+    validator = ChunkedFileValidator(
+        file_path=str(data), delimiter='|', chunk_size=2,
+        strict_fields=[{'name': 'NUM', 'data_type': 'int'}],
+    )
+
+    summary = validator.validate_to_json(str(out), show_progress=False)
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    expected = validator.validate(show_progress=False)
+
+    n_warnings = len(expected['warnings'])
+    assert [r['record'] for r in records] == ['error', 'error'] + ['warning'] * n_warnings + ['summary']
+    assert [{k: v for k, v in r.items() if k != 'record'} for r in records[:2]] == expected['errors']
+    assert [r['message'] for r in records[2:-1]] == expected['warnings']
+    assert records[-1] == summary
+    assert summary['error_count'] == 2 and summary['valid'] is False
+    assert summary['business_rules']['violation_count'] == 0
+    assert summary['statistics']['duplicate_count'] == 1
+
+
+def test_json_lines_keep_numpy_numbers_numeric():
+    import json
+    import numpy as np
+    from src.parsers import chunked_validator as cv
+
+    line = cv._json_line({'row': np.int64(7), 'pct': np.float32(0.5), 'vals': np.arange(2), 3: 'x'})
+
+    assert line.endswith(b'\n')
+    assert json.loads(line) == {'row': 7, 'pct': 0.5, 'vals': [0, 1], '3': 'x'}
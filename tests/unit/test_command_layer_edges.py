@@ -211,3 +211,32 @@ def test_validate_command_json_payload_written(tmp_path):
     payload = json.loads(out_file.read_text(encoding="utf-8"))
     assert isinstance(payload, dict)
     assert "quality_metrics" in payload
+
+
+def test_parse_command_chunked_preview_limited_to_first_rows(monkeypatch, capsys):
+    import pandas as pd
+    from src.parsers import chunked_parser
+
+    chunks = [pd.DataFrame({"a": [f"v{i}" for i in range(20)]}), pd.DataFrame({"a": ["x"]})]
+
+    class _FakeParser:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def parse_chunks(self):
+            yield from chunks
+
+    monkeypatch.setattr(chunked_parser, "ChunkedFileParser", _FakeParser)
+    run_parse_command(
+        file="unused.txt",
+        mapping=None,
+        format="pipe",
+        output=None,
+        use_chunked=True,
+        chunk_size=20,
+        logger=_Logger(),
+    )
+    out = capsys.readouterr().out
+    assert "Total rows: 21" in out
+    assert "v9" in out
+    assert "v10" not in out
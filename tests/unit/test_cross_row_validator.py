@@ -552,3 +552,40 @@ class TestRuleEngineDispatchesCrossRow:
         from src.validators.rule_engine import RuleEngine
         violations = RuleEngine(config).validate(df)
         assert all(v.issue_code.endswith("_CROSS") for v in violations)
+
+
+# ---------------------------------------------------------------------------
+# collect_partial_state row iteration
+# ---------------------------------------------------------------------------
+
+class TestCollectPartialState:
+    def test_object_chunk_state_matches_row_by_row_reference(self):
+        df = pd.DataFrame(
+            {"K": ["A", "A", "B", None], "T": ["x", "y", None, "x"], "N": ["1", "2", "bad", "3"]},
+            index=[10, 11, 12, 13],
+        )
+        v = CrossRowValidator()
+        assert v.collect_partial_state(
+            {"check": "unique_composite", "fields": ["K", "T"]}, df
+        ) == {"seen": {str(("A", "x")): [10], str(("A", "y")): [11],
+                       str(("B", "None")): [12], str(("None", "x")): [13]}}
+        consistent = v.collect_partial_state(
+            {"check": "consistent", "key_field": "K", "target_field": "T"}, df
+        )
+        assert sorted(consistent["groups"]["A"]) == ["x", "y"]
+        assert consistent["rows"]["B"] == [(12, "None")]
+        assert v.collect_partial_state(
+            {"check": "group_count", "key_field": "K", "count_field": "N"}, df
+        ) == {"counts": {"A": 2, "B": 1, "None": 1},
+              "declared": {"A": 1, "None": 3},
+              "rows": {"A": [10, 11], "B": [12], "None": [13]}}
+        assert v.collect_partial_state(
+            {"check": "group_sum", "key_field": "K", "sum_field": "N"}, df
+        )["sums"] == {"A": 3.0, "None": 3.0}
+
+    def test_mixed_numeric_columns_keep_iterrows_upcasting(self):
+        df = pd.DataFrame({"K": [1, 2], "T": [1.5, 2.5]})
+        state = CrossRowValidator().collect_partial_state(
+            {"check": "unique_composite", "fields": ["K", "T"]}, df
+        )
+        assert set(state["seen"]) == {str(("1.0", "1.5")), str(("2.0", "2.5"))}
@@ -0,0 +1,170 @@
+"""Tests for EnhancedFileValidator data-profiling helpers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.parsers.enhanced_validator import EnhancedFileValidator, _arrow_length_stats, _row_duplicate_counts
+
+
+def _validator() -> EnhancedFileValidator:
+    return EnhancedFileValidator.__new__(EnhancedFileValidator)
+
+
+def test_row_duplicate_counts_match_drop_duplicates():
+    df = pd.DataFrame({
+        'a': ['x', 'x', 'y', 'x', None, None, 'y'],
+        'b': ['1', '1', '2', '1', '3', '3', '2'],
+    })
+
+    counts = _row_duplicate_counts(df)
+
+    assert len(counts) == len(df.drop_duplicates()) == 3
+    assert sorted(counts.tolist()) == [2, 2, 3]
+    assert _row_duplicate_counts(pd.DataFrame(index=range(3))).tolist() == [1, 1, 1]
+
+
+def test_analyze_duplicates_reports_top_counts_without_groupby():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'a': rng.integers(0, 5, 200).astype(str), 'b': rng.integers(0, 5, 200).astype(str)})
+    grouped = df.groupby(list(df.columns)).size()
+
+    result = _validator()._analyze_duplicates(df)
+
+    assert result['unique_rows'] == len(df.drop_duplicates())
+    assert result['duplicate_rows'] == 200 - result['unique_rows']
+    assert result['top_duplicate_counts'] == grouped[grouped > 1].sort_values(ascending=False).head(10).tolist()
+    assert _validator()._analyze_duplicates(df.drop_duplicates())['top_duplicate_counts'] == []
+
+
+def test_validate_hashes_rows_once_for_metrics_and_duplicates(tmp_path, monkeypatch):
+    from src.parsers import enhanced_validator as ev
+    from src.parsers.pipe_delimited_parser import PipeDelimitedParser
+
+    path = tmp_path / 'data.txt'
+    path.write_text('id|name\n1|a\n1|a\n2|\n')
+    calls = []
+    original = ev._row_duplicate_counts
+
+    def _counting(df):
+        calls.append(len(df))
+        return original(df)
+
+    parser = PipeDelimitedParser(str(path))
+    df = parser.parse()
+    monkeypatch.setattr(ev, '_row_duplicate_counts', _counting)
+    result = EnhancedFileValidator(parser).validate(detailed=False)
+
+    assert calls == [len(df)]
+    assert result['quality_metrics']['unique_rows'] == result['duplicate_analysis']['unique_rows'] \
+        == len(df.drop_duplicates())
+    assert result['quality_metrics']['null_cells'] == int(df.isnull().sum().sum())
+
+
+def test_fixed_width_row_lengths_scan_matches_text_lines(tmp_path):
+    from types import SimpleNamespace
+
+    path = tmp_path / 'fw.txt'
+    path.write_bytes('abc\r\nab\nabcd\nñbc\nabc'.encode('utf-8'))
+    validator = _validator()
+    validator.parser = SimpleNamespace(file_path=str(path), column_specs=[('a', 0, 1), ('b', 1, 3)])
+    validator.errors, validator.warnings = [], []
+
+    validator._validate_fixed_width_row_lengths(max_issue_details=1)
+
+    with open(path, encoding='utf-8') as fh:
+        bad = [(n, len(line.rstrip('\r\n'))) for n, line in enumerate(fh, 1) if len(line.rstrip('\r\n')) != 3]
+    assert bad == [(2, 2), (3, 4)]
+    assert [(e['code'], e['row']) for e in validator.errors] == [('FW_LEN_001', 2)]
+    assert validator.errors[0]['message'] == 'Row 2 length mismatch: expected 3, got 2'
+    assert [w['code'] for w in validator.warnings] == ['FW_LEN_002']
+    assert validator.warnings[0]['message'].startswith('Detected 2 row-length mismatches')
+
+
+def test_infer_data_type_coerces_full_column_only_after_sample_passes(monkeypatch):
+    calls = []
+    real = pd.to_numeric
+    monkeypatch.setattr(pd, 'to_numeric', lambda values, *a, **k: calls.append(len(values)) or real(values, *a, **k))
+    validator = _validator()
+
+    text = pd.Series(['x%d' % i for i in range(1000)], name='code')
+    late_text = pd.Series([str(i) for i in range(999)] + ['x'], name='amount')
+
+    assert validator._infer_data_type(text) == 'string'
+    assert calls == [200]
+    assert validator._infer_data_type(late_text) == 'string'
+    assert validator._infer_data_type(pd.Series([str(i) for i in range(1000)], name='amount')) == 'numeric'
+    assert validator._infer_data_type(pd.Series(['20240131', '20240229'] * 300, name='birth_date')) == 'datetime'
+    assert validator._infer_data_type(pd.Series(['2024-01-31'] * 300, name='posted')) == 'datetime'
+    assert validator._infer_data_type(pd.Series(['abc'] * 300, name='update_time')) == 'string'
+    assert validator._infer_data_type(pd.Series([None, None], name='x')) == 'empty'
+
+
+def test_date_analysis_reuses_inferred_types_and_skips_other_columns(monkeypatch):
+    validator = _validator()
+    validator.errors, validator.warnings, validator.info = [], [], []
+    validator.mapping_config = None
+    df = pd.DataFrame({
+        'name': ['Alice', 'Bob', 'Carol'],
+        'amount': ['1', '2', '3'],
+        'birth_date': ['20240101', '20240102', '20240103'],
+    })
+    inferred = {col: validator._infer_data_type(df[col]) for col in df.columns}
+    monkeypatch.setattr(validator, '_infer_data_type', lambda series: pytest.fail('type inferred twice'))
+
+    fields = validator._analyze_fields(df, inferred)
+    dates = validator._analyze_date_fields(df, inferred)
+
+    assert {col: info['inferred_type'] for col, info in fields.items()} == inferred
+    assert list(dates) == ['birth_date']
+    assert dates['birth_date']['valid_date_count'] == 3
+
+
+def test_detect_date_formats_classifies_with_regex_only(monkeypatch):
+    monkeypatch.setattr(pd, 'to_datetime', lambda *a, **k: pytest.fail('parsed dates'))
+    detect = _validator()._detect_date_formats
+
+    assert detect(pd.Series(['2024-01-31', '2024-2-9'] * 10)) == ['YYYY-MM-DD']
+    assert detect(pd.Series(['12/31/2024'] * 10)) == ['MM/DD/YYYY']
+    assert detect(pd.Series(['01/02/2024'] * 10)) == ['MM/DD/YYYY', 'DD/MM/YYYY']
+    assert detect(pd.Series(['20240131'] * 9 + ['20241331'])) == ['YYYYMMDD']
+    assert detect(pd.Series(['31-12-2024'] * 10)) == ['DD-MM-YYYY']
+    assert detect(pd.Series(['2024/12/31', None] * 10)) == ['YYYY/MM/DD']
+    assert detect(pd.Series(['2024-01-31'] * 8 + ['x'] * 2)) == ['Mixed/Unknown']
+    assert detect(pd.Series([None], dtype=object)) == []
+
+
+def test_string_field_lengths_match_pandas_str_len():
+    pytest.importorskip('pyarrow')
+    series = pd.Series(['Alice', None, 'ñandú', '', '  x '], dtype=object)
+    lengths = series.dropna().astype(str).str.len()
+    expected = {
+        'min_length': int(lengths.min()),
+        'max_length': int(lengths.max()),
+        'avg_length': round(float(lengths.mean()), 2),
+    }
+
+    assert _arrow_length_stats(series.dropna().to_numpy()) is not None
+    assert _validator()._analyze_string_field(series) == expected
+    # Mixed types cannot be read as an Arrow string column; pandas handles them.
+    assert _arrow_length_stats(np.array([12345, 'ab'], dtype=object)) is None
+    assert _validator()._analyze_string_field(pd.Series([12345, 'ab', None], dtype=object)) == {
+        'min_length': 2, 'max_length': 5, 'avg_length': 3.5,
+    }
+
+
+def test_infer_data_type_trusts_numeric_and_datetime_dtypes(monkeypatch):
+    validator = _validator()
+    dates = pd.Series(pd.date_range('2024-01-01', periods=3), name='posted')
+    ymd_ints = pd.Series([20240101, 20240102, 20240103], name='birth_date')
+    amounts = pd.Series([1.5, None, 2.0], name='amount')
+    nullable = pd.Series([1, None, 3], dtype='Int64', name='count')
+
+    assert validator._infer_data_type(ymd_ints) == 'datetime'
+    monkeypatch.setattr(pd, 'to_numeric', lambda *a, **k: pytest.fail('coerced a typed column'))
+    monkeypatch.setattr(pd, 'to_datetime', lambda *a, **k: pytest.fail('coerced a typed column'))
+
+    assert validator._infer_data_type(dates) == 'datetime'
+    assert validator._infer_data_type(amounts) == 'numeric'
+    assert validator._infer_data_type(nullable) == 'numeric'
+    assert validator._infer_data_type(pd.Series([True, False], name='flag')) == 'numeric'
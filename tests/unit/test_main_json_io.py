@@ -0,0 +1,29 @@
+"""Unit tests for the JSON helpers used by reconcile-all report I/O."""
+
+import json
+
+import pytest
+
+import src.main as main_module
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_then_load_json_round_trips(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and main_module.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(main_module, "orjson", None)
+
+    payload = {"total_mappings": 2, "results": [{"mapping_file": "a.json", "warnings": ["é"]}]}
+    out = tmp_path / "summary.json"
+
+    main_module._write_json(str(out), payload)
+
+    assert json.loads(out.read_text(encoding="utf-8")) == payload
+    assert main_module._load_json(str(out)) == payload
+
+
+def test_write_json_is_indented(tmp_path):
+    out = tmp_path / "summary.json"
+    main_module._write_json(str(out), {"a": [1]})
+    assert out.read_text(encoding="utf-8").splitlines()[1].startswith("  ")
@@ -158,3 +158,36 @@ class TestNegativeViolations:
         assert stats["violations_by_severity"]["error"] >= 1
         assert stats["violations_by_severity"]["warning"] >= 1
         assert stats["total_violations"] == len(violations)
+
+    def test_violation_to_dict_returns_fields_in_order(self):
+        """to_dict should return every field, in declaration order, as a new dict."""
+        violation = RuleViolation(
+            rule_id="R1", rule_name="n", severity="error", row_number=5,
+            field="f", value="x", message="msg", issue_code="BR_FLD_001",
+        )
+
+        out = violation.to_dict()
+        out["message"] = "changed"
+
+        assert list(out) == [
+            "rule_id", "rule_name", "severity", "row_number", "field",
+            "value", "message", "expected", "issue_code",
+        ]
+        assert out["row_number"] == 5 and out["expected"] is None
+        assert violation.message == "msg"
+
+    def test_violation_to_dict_does_not_share_expected_list(self):
+        """List-valued fields are copied, so the result never aliases the rules config."""
+        from dataclasses import asdict
+
+        allowed = ["A", "B"]
+        violation = RuleViolation(
+            rule_id="R1", rule_name="n", severity="error", row_number=5,
+            field="f", value="x", message="msg", expected=allowed,
+        )
+
+        out = violation.to_dict()
+        out["expected"].append("C")
+
+        assert allowed == ["A", "B"]
+        assert violation.to_dict() == asdict(violation)
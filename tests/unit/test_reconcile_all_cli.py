@@ -0,0 +1,191 @@
+"""Unit tests for the reconcile-all CLI command."""
+
+import json
+
+import click
+from click.testing import CliRunner
+
+import src.main as main_module
+from src.main import cli
+
+
+def _mapping(name, table):
+    return {
+        'mapping_name': name,
+        'version': '1.0.0',
+        'description': 'reconcile-all test mapping',
+        'source': {'type': 'file', 'format': 'pipe_delimited'},
+        'target': {'type': 'database', 'table_name': table},
+        'mappings': [
+            {
+                'source_column': 'name',
+                'target_column': 'NAME',
+                'data_type': 'string',
+                'required': True,
+                'transformations': [],
+                'validation_rules': [],
+            }
+        ],
+        'key_columns': [],
+    }
+
+
+class _FakeReconciler:
+    """Reconciler stub: tables named BAD_* are invalid, WARN_* carry one warning."""
+
+    prefetched = []
+
+    def __init__(self, connection):
+        pass
+
+    def prefetch_schemas(self, table_references):
+        _FakeReconciler.prefetched = list(table_references)
+        return len(set(table_references))
+
+    def reconcile_mapping(self, mapping):
+        table = mapping.target['table_name']
+        errors = ['Target table does not exist'] if table.startswith('BAD_') else []
+        warnings = ['nullable mismatch'] if table.startswith('WARN_') else []
+        return {
+            'valid': not errors,
+            'errors': errors,
+            'warnings': warnings,
+            'error_count': len(errors),
+            'warning_count': len(warnings),
+            'table_name': table,
+        }
+
+
+def _setup(tmp_path, monkeypatch, tables):
+    import src.database.connection as connection_module
+    import src.database.reconciliation as reconciliation_module
+
+    monkeypatch.setattr(connection_module.OracleConnection, 'from_env', staticmethod(lambda: object()))
+    monkeypatch.setattr(reconciliation_module, 'SchemaReconciler', _FakeReconciler)
+
+    mappings_dir = tmp_path / 'mappings'
+    mappings_dir.mkdir()
+    for i, table in enumerate(tables):
+        (mappings_dir / f'm{i}.json').write_text(json.dumps(_mapping(f'm{i}', table)))
+    return mappings_dir
+
+
+def test_reconcile_all_prefetches_and_writes_summary(tmp_path, monkeypatch):
+    mappings_dir = _setup(tmp_path, monkeypatch, ['GOOD_A', 'WARN_B'])
+    out = tmp_path / 'summary.json'
+
+    result = CliRunner().invoke(cli, ['reconcile-all', '-d', str(mappings_dir), '-o', str(out)])
+
+    assert result.exit_code == 0, result.output
+    assert sorted(_FakeReconciler.prefetched) == ['GOOD_A', 'WARN_B']
+    summary = json.loads(out.read_text())
+    assert summary['total_mappings'] == 2
+    assert summary['valid_mappings'] == 2
+    assert summary['total_warnings'] == 1
+
+
+def test_reconcile_all_drift_against_baseline(tmp_path, monkeypatch):
+    mappings_dir = _setup(tmp_path, monkeypatch, ['GOOD_A', 'WARN_B'])
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps({'results': [
+        {'mapping_file': str(mappings_dir / 'm0.json'), 'error_count': 0, 'warning_count': 0},
+        {'mapping_file': str(mappings_dir / 'm1.json'), 'errors': [], 'warnings': []},
+        {'mapping_file': str(mappings_dir / 'gone.json'), 'error_count': 0, 'warning_count': 0},
+    ]}))
+    out = tmp_path / 'summary.json'
+
+    result = CliRunner().invoke(cli, [
+        'reconcile-all', '-d', str(mappings_dir), '-b', str(baseline), '-o', str(out), '--fail-on-drift',
+    ])
+
+    assert result.exit_code == 1
+    drift = json.loads(out.read_text())['drift']
+    assert drift['removed_files'] == [str(mappings_dir / 'gone.json')]
+    assert drift['added_files'] == []
+    assert drift['new_warnings'] == 1
+    assert [c['mapping_file'] for c in drift['changed']] == [str(mappings_dir / 'm1.json')]
+
+
+def test_index_reconcile_results_falls_back_to_list_lengths():
+    index = main_module._index_reconcile_results([
+        {'mapping_file': 'a.json', 'error_count': 2, 'warning_count': 0},
+        {'mapping_file': 'b.json', 'errors': ['e'], 'warnings': ['w1', 'w2']},
+        {'errors': ['ignored']},
+    ])
+
+    assert index == {'a.json': (2, 0), 'b.json': (1, 2)}
+
+
+def test_reconcile_all_parallel_workers_match_sequential(tmp_path, monkeypatch):
+    mappings_dir = _setup(tmp_path, monkeypatch, ['GOOD_A', 'BAD_B', 'WARN_C'])
+    (mappings_dir / 'broken.json').write_text('{not json')
+
+    summaries = []
+    for workers in ('1', '2'):
+        out = tmp_path / f'summary_{workers}.json'
+        result = CliRunner().invoke(cli, [
+            'reconcile-all', '-d', str(mappings_dir), '-o', str(out), '--workers', workers,
+        ])
+        assert result.exit_code == 1
+        summaries.append(json.loads(out.read_text()))
+
+    assert summaries[0] == summaries[1]
+    assert summaries[0]['invalid_mappings'] == 2
+    assert any('Failed to process mapping' in e for r in summaries[0]['results'] for e in r['errors'])
+
+
+def test_load_mapping_document_returns_errors_instead_of_raising(tmp_path):
+    good = tmp_path / 'good.json'
+    good.write_text(json.dumps(_mapping('good', 'GOOD_A')))
+
+    doc = main_module._load_mapping_document(str(good))
+    missing = main_module._load_mapping_document(str(tmp_path / 'missing.json'))
+
+    assert doc.mapping_name == 'good'
+    assert isinstance(missing, OSError)
+
+
+def test_reconcile_all_buffered_status_lines_keep_order(tmp_path, monkeypatch):
+    mappings_dir = _setup(tmp_path, monkeypatch, ['GOOD_A', 'BAD_B', 'WARN_C', 'GOOD_D'])
+    monkeypatch.setattr(main_module, '_ECHO_FLUSH_LINES', 3)
+
+    result = CliRunner().invoke(cli, ['reconcile-all', '-d', str(mappings_dir)])
+
+    lines = [line for line in result.output.splitlines() if line.strip()]
+    status = lines[:8]
+    assert [line.split(': ', 1)[0] for line in status[0::2]] == ['Reconciling'] * 4
+    assert status[1].strip() == '✓ VALID'
+    assert status[3].strip().startswith('✗ INVALID')
+    assert status[5].strip() == '✓ VALID (1 warnings)'
+    assert lines[8] == '=' * 60
+
+
+def test_iter_mapping_files_filters_by_pattern(tmp_path):
+    (tmp_path / 'b.json').write_text('{}')
+    (tmp_path / 'a.json').write_text('{}')
+    (tmp_path / 'notes.txt').write_text('')
+    (tmp_path / 'dir.json').mkdir()
+    (tmp_path / 'dir.json' / 'nested.json').write_text('{}')
+
+    flat = sorted(main_module._iter_mapping_files(str(tmp_path), '*.json'))
+    nested = list(main_module._iter_mapping_files(str(tmp_path), '*/*.json'))
+
+    assert flat == [str(tmp_path / 'a.json'), str(tmp_path / 'b.json')]
+    assert nested == [str(tmp_path / 'dir.json' / 'nested.json')]
+
+
+def test_reconcile_all_reports_when_no_mapping_matches(tmp_path, monkeypatch):
+    mappings_dir = _setup(tmp_path, monkeypatch, [])
+
+    result = CliRunner().invoke(cli, ['reconcile-all', '-d', str(mappings_dir)])
+
+    assert result.exit_code == 0
+    assert 'No mapping files found' in result.output
+
+
+def test_status_templates_match_click_style():
+    message = "  ✗ INVALID {0} {x}"
+
+    assert main_module._STYLE_RED.format(msg=message) == click.style(message, fg='red')
+    assert main_module._STYLE_YELLOW.format(msg=message) == click.style(message, fg='yellow')
+    assert main_module._STYLE_GREEN.format(msg=message) == click.style(message, fg='green')
@@ -182,3 +182,64 @@ def test_reconcile_warns_when_mapping_keys_do_not_match_pk_unique():
     result = reconciler.reconcile_mapping(mapping)
 
     assert any('do not exactly match any database PK/UNIQUE constraint' in w for w in result['warnings'])
+
+
+class _RecordingExecutor:
+    """Executor stub that returns canned dictionary-view results."""
+
+    def __init__(self):
+        self.queries = []
+
+    def execute_query(self, query, params=None):
+        import pandas as pd
+
+        self.queries.append((query, params))
+        if 'all_tables' in query:
+            return pd.DataFrame({'OWNER': ['APP'], 'TABLE_NAME': ['TEST_TABLE']})
+        return pd.DataFrame({
+            'OWNER': ['APP', 'APP'],
+            'TABLE_NAME': ['TEST_TABLE', 'TEST_TABLE'],
+            'COLUMN_NAME': ['NAME', 'ID'],
+            'DATA_TYPE': ['VARCHAR2', 'NUMBER'],
+            'DATA_LENGTH': [100, 22],
+            'DATA_PRECISION': [None, 22],
+            'DATA_SCALE': [None, 0],
+            'NULLABLE': ['N', 'N'],
+        })
+
+
+def test_prefetch_schemas_batches_lookups_and_serves_reconcile_from_cache():
+    reconciler = SchemaReconciler(DummyConnection())
+    reconciler.executor = _RecordingExecutor()
+    reconciler._get_pk_unique_constraint_columns = lambda _table, _owner=None: []
+
+    count = reconciler.prefetch_schemas(['APP.TEST_TABLE', 'app.missing_table', 'APP.TEST_TABLE'])
+    assert count == 2
+    assert len(reconciler.executor.queries) == 2
+
+    present = _build_mapping({'target': {'type': 'database', 'table_name': 'APP.TEST_TABLE'}})
+    result = reconciler.reconcile_mapping(present)
+    assert result['valid'] is True
+    assert result['database_columns'] == 2
+    assert 'ID' in result['unmapped_required']
+
+    missing = _build_mapping({'target': {'type': 'database', 'table_name': 'APP.MISSING_TABLE'}})
+    result = reconciler.reconcile_mapping(missing)
+    assert result['valid'] is False
+    assert 'Target table does not exist' in result['errors'][0]
+
+    # Both reconciliations were answered without further dictionary queries.
+    assert len(reconciler.executor.queries) == 2
+
+
+def test_prefetch_schemas_failure_falls_back_to_per_table_queries():
+    reconciler = SchemaReconciler(DummyConnection())
+
+    class _FailingExecutor:
+        def execute_query(self, query, params=None):
+            raise RuntimeError('ORA-00942')
+
+    reconciler.executor = _FailingExecutor()
+    reconciler.prefetch_schemas(['APP.TEST_TABLE'])
+
+    assert reconciler._schema_cache == {}
@@ -65,3 +65,43 @@ def test_when_condition_in_filters_rows():
     assert len(violations) == 1
     assert violations[0].row_number == 1
     assert violations[0].issue_code == 'BR_BRC2_FIELD'
+
+
+def test_referenced_columns_include_rule_fields_and_conditions():
+    engine = RuleEngine({
+        'rules': [
+            {'id': 'A', 'type': 'field_validation', 'field': 'score', 'operator': 'not_null',
+             'when': 'status in (ACTIVE, NEW)'},
+            {'id': 'B', 'type': 'cross_field', 'left_field': 'start', 'right_field': 'end',
+             'operator': '<=', 'when': 'amount >= 10'},
+            {'id': 'C', 'type': 'cross_row', 'check': 'unique_composite', 'fields': ['id', 'score']},
+            {'id': 'D', 'type': 'cross_row', 'check': 'group_sum', 'key_field': 'grp', 'sum_field': 'amt'},
+            {'id': 'E', 'type': 'field_validation', 'field': 'ignored', 'operator': 'not_null', 'enabled': False},
+        ]
+    })
+
+    assert engine.referenced_columns() == [
+        'score', 'status', 'start', 'end', 'amount', 'id', 'grp', 'amt',
+    ]
+    assert RuleEngine({'rules': [{'id': 'X', 'type': 'custom'}]}).referenced_columns() is None
+
+
+def test_disable_invalid_rules_drops_rules_that_cannot_run():
+    engine = RuleEngine({
+        'rules': [
+            {'id': 'OK', 'type': 'field_validation', 'field': 'a', 'operator': 'not_null'},
+            {'id': 'OP', 'type': 'field_validation', 'field': 'a', 'operator': 'bogus'},
+            {'id': 'RX', 'type': 'field_validation', 'field': 'a', 'operator': 'regex', 'pattern': '('},
+            {'id': 'CF', 'type': 'cross_field', 'left_field': 'a', 'right_field': 'b', 'operator': '<>'},
+            {'id': 'CR', 'type': 'cross_row', 'check': 'nope', 'field': 'a'},
+            {'id': 'TY', 'type': 'custom'},
+        ]
+    })
+
+    messages = engine.disable_invalid_rules()
+
+    assert [r['id'] for r in engine.enabled_rules] == ['OK']
+    assert [m.split(' disabled')[0] for m in messages] == [
+        'Business rule OP', 'Business rule RX', 'Business rule CF', 'Business rule CR', 'Business rule TY',
+    ]
+    assert messages[0] == 'Business rule OP disabled: Unknown operator: bogus'